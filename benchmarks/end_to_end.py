@@ -0,0 +1,244 @@
+"""
+Times a whole upload, from prep to the torrent client, with every service it
+talks to stood in for by a local server, so it runs offline and the same way
+every time.
+
+The release is synthetic media made with ffmpeg. TMDb, TVmaze, srrdb, the
+image hosts and the UNIT3D trackers are answered by a stub server, which the
+shared HTTP session reaches through a host rewriting adapter, and the
+qBittorrent in the config is pointed at it too. Every run is a fresh process
+on a fresh base dir, and its trace.json is read back for the stage timings,
+CPU time, peak RSS and requests per host.
+
+    python benchmarks/end_to_end.py [--files 1] [--trackers AITHER BLU] [--repeat 3] [--latency ptpimg.me=200]
+
+--latency adds that many milliseconds to every answer from a host, or from
+every host with '*'. Lookups of any host that isn't local are refused, and
+listed after the results.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.harness import REPO_DIR, StubServer, block_remote_hosts, load_config, make_media, mount_stubs, save_config  # noqa: E402
+
+# UNIT3D trackers that upload with the common UNIT3D form, without asking anything
+DEFAULT_TRACKERS = ['AITHER', 'BLU', 'LST', 'OE', 'ULCX']
+
+
+def child_config(settings):
+    """
+    The example config, with the keys the upload needs filled in with dummies
+    and the caches that would carry over between runs turned off.
+    """
+    trackers = {tracker: {'useAPI': False, 'api_key': "benchmark", 'announce_url': f"https://{tracker.lower()}.example/announce/benchmark", 'anon': False}
+                for tracker in settings['trackers']}
+    trackers['default_trackers'] = ", ".join(settings['trackers'])
+    return {
+        'DEFAULT': {
+            'tmdb_api': "benchmark",
+            'img_host_1': settings['imghost'],
+            'ptpimg_api': "benchmark",
+            'imgbb_api': "benchmark",
+            'screens': str(settings['screens']),
+            'metadata_cache': "False",
+            'piece_cache': "False",
+            'default_torrent_client': "Client1",
+            'get_permalink': False,
+        },
+        'TRACKERS': trackers,
+        'TORRENT_CLIENTS': {
+            'Client1': {
+                'torrent_client': "qbit", 'enable_search': False,
+                'qbit_url': "http://127.0.0.1", 'qbit_port': str(settings['stub_port']), 'qbit_user': "benchmark", 'qbit_pass': "benchmark",
+            },
+        },
+    }
+
+
+def copy_data_dir(base_dir):
+    """
+    Copies the templates and lists prep reads from data/, without the user's
+    config or cookies.
+    """
+    shutil.copytree(os.path.join(REPO_DIR, "data"), os.path.join(base_dir, "data"),
+                    ignore=shutil.ignore_patterns("config.py", "cookies", "__pycache__"))
+
+
+def run_child(settings):
+    """
+    One upload, in the process the parent started for it.
+    """
+    base_dir = settings['base_dir']
+    config = load_config(child_config(settings))
+    copy_data_dir(base_dir)
+    save_config(config, base_dir)
+    blocked = block_remote_hosts()
+    mount_stubs(config, settings['stub_url'])
+
+    import upload
+    from src.console import console
+    from src.tracing import save_trace
+
+    args = (settings['path'], '-ua', '-ih', settings['imghost'], '-s', str(settings['screens']),
+            '-tc', str(settings['concurrency']), '--trackers', *settings['trackers'])
+    meta, help, before_args = upload.parser.parse(args, {'base_dir': base_dir})
+    meta['path'] = settings['path']
+    meta['uuid'] = None
+
+    async def run():
+        try:
+            await upload.process_meta(meta, base_dir)
+            await upload.upload_release(meta)
+        finally:
+            if meta.get('uuid'):
+                save_trace(meta)
+
+    error = None
+    console.quiet = not settings['verbose']
+    try:
+        asyncio.run(run())
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        console.quiet = False
+    with open(os.path.join(base_dir, "result.json"), 'w', encoding='utf-8') as f:
+        json.dump({'uuid': meta.get('uuid'), 'blocked': blocked, 'error': error}, f)
+
+
+def stage_times(trace):
+    """
+    Returns {span name: seconds} of a trace.json, spans with the same name added up.
+    """
+    stages = {}
+    for event in trace['traceEvents']:
+        if event.get('ph') == 'X':
+            stages[event['name']] = stages.get(event['name'], 0) + event['dur'] / 1e6
+    return stages
+
+
+def print_results(console, runs, stub, blocked):
+    from rich.table import Table
+
+    stages = {}
+    for run in runs:
+        for name, seconds in stage_times(run).items():
+            stages.setdefault(name, []).append(seconds)
+    table = Table(title=f"Stages, over {len(runs)} runs")
+    table.add_column("Stage")
+    table.add_column("Mean s", justify="right")
+    table.add_column("Min s", justify="right")
+    for name, times in sorted(stages.items(), key=lambda item: -sum(item[1]) / len(item[1])):
+        table.add_row(name, f"{sum(times) / len(times):.3f}", f"{min(times):.3f}")
+    console.print(table)
+
+    table = Table(title="Resources")
+    table.add_column("Run", justify="right")
+    table.add_column("Wall s", justify="right")
+    table.add_column("CPU s", justify="right")
+    table.add_column("Children CPU s", justify="right")
+    table.add_column("Peak RSS MiB", justify="right")
+    for n, run in enumerate(runs, 1):
+        other = run['otherData']
+
+        def figure(key, fmt):
+            return fmt.format(other[key]) if other.get(key) is not None else "-"
+        table.add_row(str(n), figure('wall_seconds', "{:.2f}"), figure('cpu_seconds', "{:.2f}"),
+                      figure('children_cpu_seconds', "{:.2f}"), figure('peak_rss_mib', "{:.0f}"))
+    console.print(table)
+
+    table = Table(title="Stub requests, all runs")
+    table.add_column("Host")
+    table.add_column("Requests", justify="right")
+    table.add_column("KiB in", justify="right")
+    table.add_column("KiB out", justify="right")
+    table.add_column("Mean ms", justify="right")
+    for host, (requests, bytes_in, bytes_out, seconds) in sorted(stub.stats.items()):
+        table.add_row(host, str(requests), f"{bytes_in / 1024:.0f}", f"{bytes_out / 1024:.0f}", f"{seconds / requests * 1000:.1f}")
+    console.print(table)
+
+    for request, count in sorted(stub.unhandled.items()):
+        console.print(f"[yellow]Not handled by the stub server: {request} ({count}x)")
+    for host, count in sorted(blocked.items()):
+        console.print(f"[yellow]Lookup refused, this request needs a stub: {host} ({count}x)")
+
+
+def parse_latency(values):
+    latency = {}
+    for value in values:
+        host, _, ms = value.rpartition('=')
+        latency[host or '*'] = float(ms) / 1000
+    return latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--files', type=int, default=1, help="episodes of a season pack, 1 uploads a movie")
+    parser.add_argument('--duration', type=int, default=60, help="seconds of media per file")
+    parser.add_argument('--trackers', nargs='+', default=DEFAULT_TRACKERS)
+    parser.add_argument('--tracker-concurrency', type=int, default=1)
+    parser.add_argument('--screens', type=int, default=4)
+    parser.add_argument('--imghost', default="ptpimg", choices=['ptpimg', 'imgbb', 'pixhost', 'lensdump', 'ptscreens', 'onlyimage'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--latency', action='append', default=[], metavar="[HOST=]MS", help="added to every answer from HOST, or every host")
+    parser.add_argument('--media-dir', help="where the synthetic media is made and kept, a temporary dir by default")
+    parser.add_argument('--verbose', action='store_true', help="show the uploader's output")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(json.loads(args.child))
+        return
+
+    from rich.console import Console
+    console = Console()
+    work_dir = tempfile.mkdtemp(prefix="end_to_end_")
+    media_dir = args.media_dir or os.path.join(work_dir, "media")
+    try:
+        if args.files > 1:
+            path = make_media(media_dir, "Benchmark.Show.S01.1080p.WEB-DL.DD5.1.H.264-BENCH", args.files, args.duration)
+        else:
+            path = make_media(media_dir, "Benchmark.Movie.2020.1080p.WEB-DL.DD5.1.H.264-BENCH", 1, args.duration)
+
+        runs = []
+        blocked = {}
+        with StubServer(parse_latency(args.latency)) as stub:
+            for n in range(args.repeat):
+                base_dir = os.path.join(work_dir, f"run{n}")
+                os.makedirs(base_dir)
+                settings = {
+                    'base_dir': base_dir, 'path': path, 'trackers': [tracker.upper() for tracker in args.trackers],
+                    'concurrency': args.tracker_concurrency, 'screens': args.screens, 'imghost': args.imghost,
+                    'stub_url': stub.url, 'stub_port': stub.server.server_port, 'verbose': args.verbose,
+                }
+                subprocess.run([sys.executable, os.path.abspath(__file__), '--child', json.dumps(settings)], cwd=base_dir, check=True,
+                               stdout=None if args.verbose else subprocess.DEVNULL)
+                with open(os.path.join(base_dir, "result.json"), encoding='utf-8') as f:
+                    result = json.load(f)
+                for host, count in result['blocked'].items():
+                    blocked[host] = blocked.get(host, 0) + count
+                if result['error']:
+                    console.print(f"[red]Run {n + 1} failed: {result['error']}")
+                    continue
+                with open(os.path.join(base_dir, "tmp", result['uuid'], "trace.json"), encoding='utf-8') as f:
+                    runs.append(json.load(f))
+            uploads = len(stub.torrents)
+            added = stub.client_adds
+
+        console.print(f"{os.path.basename(path)}, {args.files} files, {len(args.trackers)} trackers, "
+                      f"{uploads} torrents uploaded, {added} added to the client")
+        if runs:
+            print_results(console, runs, stub, blocked)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+import copy
+import email.parser
+import email.policy
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Hosts a benchmark may resolve, everything else is refused by block_remote_hosts
+LOCAL_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+
+def load_config(overrides=None):
+    """
+    Loads data/example-config.py as data.config, so a benchmark never reads the
+    user's own config, and returns the config dict. overrides is merged into it
+    one section at a time. Call it before importing anything from src.
+    """
+    spec = importlib.util.spec_from_file_location("example_config", os.path.join(REPO_DIR, "data", "example-config.py"))
+    example = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(example)
+    config = copy.deepcopy(example.config)
+    for section, values in (overrides or {}).items():
+        config.setdefault(section, {}).update(values)
+
+    module = types.ModuleType("data.config")
+    module.config = config
+    sys.modules["data.config"] = module
+    return config
+
+
+def save_config(config, base_dir):
+    """
+    Writes config to base_dir/data/config.py and puts base_dir first on
+    sys.path, for the processes of the worker pool, which import data.config
+    for themselves.
+    """
+    os.makedirs(os.path.join(base_dir, "data"), exist_ok=True)
+    with open(os.path.join(base_dir, "data", "config.py"), 'w', encoding='utf-8') as f:
+        f.write(f"config = {config!r}\n")
+    sys.path.insert(0, base_dir)
+
+
+def multipart_fields(content_type, body):
+    """
+    Returns {name: (filename, value)} of a multipart/form-data body.
+    """
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\nMIME-Version: 1.0\r\n\r\n".encode('utf-8') + body)
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param('name', header='content-disposition')
+        fields[name] = (part.get_filename(), part.get_payload(decode=True))
+    return fields
+
+
+def infohash(torrent):
+    """
+    Returns the infohash of a .torrent's bytes.
+    """
+    from torf import Torrent
+    return Torrent.read_stream(io.BytesIO(torrent)).infohash
+
+
+class StubServer():
+    """
+    Local stand-ins for every service an upload talks to, on one HTTP server.
+
+    Requests are told apart by their Host header, which HostRewriteAdapter
+    keeps as the real host when it sends them here. Any host with a path under
+    /api/torrents/ is answered as a UNIT3D tracker. The qBittorrent WebUI is
+    the server's own address. Hosts in latency get that many seconds of delay
+    before each answer, '*' sets it for every other host.
+
+    stats holds {host: [requests, bytes in, bytes out, seconds]}, unhandled
+    the requests nothing answered.
+    """
+    def __init__(self, latency=None):
+        self.latency = dict(latency or {})
+        self.stats = {}
+        self.unhandled = {}
+        self.torrents = {}  # Uploaded to a stand-in tracker, by id
+        self.client_torrents = {}  # Added to the qBittorrent stand-in, by infohash
+        self.client_adds = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.server.server_close()
+        return False
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                stub.handle(self)
+
+            do_POST = do_HEAD = do_PUT = do_GET
+
+        return Handler
+
+    def handle(self, request):
+        start = time.perf_counter()
+        host = request.headers.get('Host', '').split(':')[0].lower()
+        if host in LOCAL_HOSTS:
+            host = "qbittorrent"
+        length = int(request.headers.get('Content-Length') or 0)
+        body = request.rfile.read(length) if length else b""
+        url = urlparse(request.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        time.sleep(self.latency.get(host, self.latency.get('*', 0)))
+        answer = self.route(host, request.command, url.path, query, request.headers.get('Content-Type', ''), body)
+        if answer is None:
+            with self.lock:
+                key = f"{request.command} {host}{url.path}"
+                self.unhandled[key] = self.unhandled.get(key, 0) + 1
+            answer = (404, {'message': "Not handled by the benchmark"})
+        status, payload = answer[0], answer[1]
+        headers = answer[2] if len(answer) > 2 else {}
+        if isinstance(payload, (dict, list)):
+            payload, content_type = json.dumps(payload).encode('utf-8'), "application/json"
+        elif isinstance(payload, str):
+            payload, content_type = payload.encode('utf-8'), "text/plain; charset=UTF-8"
+        else:
+            content_type = "application/octet-stream"
+
+        request.send_response(status)
+        request.send_header('Content-Type', content_type)
+        request.send_header('Content-Length', str(len(payload)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        if request.command != 'HEAD':
+            request.wfile.write(payload)
+        with self.lock:
+            stats = self.stats.setdefault(host, [0, 0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += len(body)
+            stats[2] += len(payload)
+            stats[3] += time.perf_counter() - start
+
+    def route(self, host, method, path, query, content_type, body):
+        if path.startswith('/api/torrents/'):
+            return self.unit3d(host, method, path, query, content_type, body)
+        if path.startswith('/_torrents/'):
+            torrent = self.torrents.get(path.rsplit('/', 1)[-1])
+            return (200, torrent, {'Content-Disposition': 'attachment; filename="benchmark.torrent"'}) if torrent else None
+        service = {
+            'api.themoviedb.org': self.tmdb,
+            'api.tvmaze.com': self.tvmaze,
+            'api.srrdb.com': self.srrdb,
+            'www.srrdb.com': self.srrdb,
+            'qbittorrent': self.qbittorrent,
+        }.get(host)
+        if service is None:
+            service = self.image_host
+        return service(host, method, path, query, content_type, body)
+
+    def unit3d(self, host, method, path, query, content_type, body):
+        if path == '/api/torrents/filter':
+            return 200, {'data': [], 'links': {}, 'meta': {'current_page': 1, 'total': 0}}
+        if path == '/api/torrents/upload' and method == 'POST':
+            torrent = multipart_fields(content_type, body).get('torrent', (None, b""))[1]
+            with self.lock:
+                torrent_id = str(len(self.torrents) + 1)
+                self.torrents[torrent_id] = torrent
+            return 200, {'success': True, 'data': f"{self.url}/_torrents/{torrent_id}", 'message': "Torrent uploaded successfully."}
+        return None
+
+    def tmdb(self, host, method, path, query, content_type, body):
+        parts = path.strip('/').split('/')[1:]  # Without the API version
+        if parts[:1] == ['search']:
+            if parts[1:] == ['movie']:
+                return 200, {'page': 1, 'results': [{'id': 1001, 'title': "Benchmark Movie", 'release_date': "2020-06-01"}], 'total_results': 1}
+            return 200, {'page': 1, 'results': [{'id': 2001, 'name': "Benchmark Show", 'first_air_date': "2020-06-01"}], 'total_results': 1}
+        if len(parts) < 2 or parts[0] not in ('movie', 'tv'):
+            return None
+        category, tmdb_id, endpoint = parts[0], int(parts[1]), (parts[2:] or ['info'])[0]
+        if endpoint == 'external_ids':
+            # No IMDb ID, IMDb is reached through a client of its own that can't be pointed here
+            return 200, {'id': tmdb_id, 'imdb_id': None, 'tvdb_id': 3001 if category == 'tv' else None}
+        if endpoint == 'videos':
+            return 200, {'id': tmdb_id, 'results': [{'site': "YouTube", 'type': "Trailer", 'key': "benchmark"}]}
+        if endpoint == 'keywords':
+            keywords = [{'id': n, 'name': f"keyword {n}"} for n in range(8)]
+            return 200, {'id': tmdb_id, 'keywords' if category == 'movie' else 'results': keywords}
+        if endpoint == 'credits':
+            return 200, {'id': tmdb_id, 'cast': [], 'crew': [{'id': 1, 'name': "Benchmark Director", 'job': "Director", 'department': "Directing"}]}
+        if endpoint != 'info':
+            return None
+        info = {
+            'id': tmdb_id, 'overview': "A synthetic release made for benchmarking.", 'original_language': "en",
+            'genres': [{'id': 18, 'name': "Drama"}], 'poster_path': None, 'backdrop_path': None,
+            'production_countries': [{'iso_3166_1': "US", 'name': "United States of America"}],
+            'spoken_languages': [{'iso_639_1': "en", 'english_name': "English", 'name': "English"}],
+        }
+        if category == 'movie':
+            info.update({'title': "Benchmark Movie", 'original_title': "Benchmark Movie", 'release_date': "2020-06-01", 'runtime': 100})
+        else:
+            info.update({
+                'name': "Benchmark Show", 'original_name': "Benchmark Show", 'first_air_date': "2020-06-01", 'episode_run_time': [45],
+                'type': "Scripted", 'networks': [{'id': 1, 'name': "Benchmark Network"}], 'number_of_seasons': 1,
+            })
+        return 200, info
+
+    def tvmaze(self, host, method, path, query, content_type, body):
+        show = {'id': 4001, 'name': "Benchmark Show", 'premiered': "2020-06-01", 'externals': {'tvrage': None, 'thetvdb': 3001, 'imdb': None}}
+        if path == '/lookup/shows':
+            return 200, show
+        if path == '/search/shows':
+            return 200, [{'score': 1.0, 'show': show}]
+        return None
+
+    def srrdb(self, host, method, path, query, content_type, body):
+        if path.startswith('/v1/search/'):
+            return 200, {'results': [], 'resultsCount': "0", 'warnings': []}
+        if path.startswith('/v1/imdb/'):
+            return 200, {'releases': [], 'query': []}
+        return None
+
+    def image_host(self, host, method, path, query, content_type, body):
+        if method != 'POST':
+            return None
+        image = hashlib.sha1(body).hexdigest()[:12]
+        url = f"https://{host}/images/{image}.png"
+        thumb = f"https://{host}/thumbs/{image}.png"
+        viewer = f"https://{host}/image/{image}"
+        if host == 'ptpimg.me':
+            return 200, [{'code': image, 'ext': "png"}]
+        if host == 'api.imgbb.com':
+            return 200, {'success': True, 'status': 200, 'data': {'url_viewer': viewer, 'image': {'url': url}, 'medium': {'url': thumb}}}
+        if host == 'api.pixhost.to':
+            return 200, {'th_url': f"https://t0.pixhost.to/thumbs/{image}.png", 'show_url': f"https://pixhost.to/show/{image}.png"}
+        if host in ('ptscreens.com', 'onlyimage.org', 'lensdump.com'):
+            image_data = {'url': url, 'url_viewer': viewer, 'medium': {'url': thumb}}
+            return 200, {'status_code': 200, 'success': True, 'image': image_data, 'data': {'image': {'url': url}, 'url_viewer': viewer}}
+        return None
+
+    def qbittorrent(self, host, method, path, query, content_type, body):
+        api = path[len('/api/v2/'):] if path.startswith('/api/v2/') else None
+        if path == '/':
+            # Checked by the client for a redirect before it logs in
+            return 200, ""
+        if api == 'auth/login':
+            return 200, "Ok.", {'Set-Cookie': "SID=benchmark; HttpOnly; path=/"}
+        if api == 'app/version':
+            return 200, "v4.6.5"
+        if api == 'app/webapiVersion':
+            return 200, "2.9.3"
+        if api == 'torrents/add':
+            fields = multipart_fields(content_type, body)
+            save_path = fields.get('savepath', (None, b""))[1].decode('utf-8')
+            with self.lock:
+                for name, (filename, value) in fields.items():
+                    if filename is not None:
+                        self.client_adds += 1
+                        self.client_torrents[infohash(value)] = {'name': filename, 'save_path': save_path, 'content_path': save_path}
+            return 200, "Ok."
+        if api == 'sync/maindata':
+            with self.lock:
+                torrents = copy.deepcopy(self.client_torrents)
+            return 200, {'rid': int(query.get('rid', 0)) + 1, 'full_update': True, 'torrents': torrents}
+        if api == 'torrents/info':
+            with self.lock:
+                return 200, [dict(torrent, hash=torrenthash) for torrenthash, torrent in self.client_torrents.items()]
+        return None
+
+
+def host_rewrite_adapter(config, stub_url, **kwargs):
+    """
+    Returns a RateLimitedAdapter that sends every request to the stub server,
+    to mount on a requests.Session in place of src.network's adapter.
+
+    The request keeps its real URL, so the rate limits, the HTTP stats and
+    anything that reads response.url still see the real host, which goes to
+    the stub as the Host header.
+    """
+    from src.network import RateLimitedAdapter, get_rate_limiter
+
+    class HostRewriteAdapter(RateLimitedAdapter):
+        def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+            return self.poolmanager.connection_from_url(stub_url)
+
+        def get_connection(self, url, proxies=None):
+            return self.poolmanager.connection_from_url(stub_url)
+
+        def request_url(self, request, proxies):
+            return request.path_url
+
+        def add_headers(self, request, **kwargs):
+            request.headers['Host'] = urlparse(request.url).netloc
+
+    retries = max(0, int(config.get('DEFAULT', {}).get('http_retries', 3)))
+    return HostRewriteAdapter(get_rate_limiter(config), retries=retries, **kwargs)
+
+
+def mount_stubs(config, stub_url):
+    """
+    Sends everything on the shared HTTPClient session, which the trackers,
+    image hosts, TMDb, TVmaze and srrdb lookups use, to the stub server.
+    """
+    from src.network import get_http_client
+    http = get_http_client(config)
+    adapter = host_rewrite_adapter(config, stub_url, pool_connections=64, pool_maxsize=http.connections_per_host)
+    http.session.mount('https://', adapter)
+    http.session.mount('http://', adapter)
+
+
+def block_remote_hosts():
+    """
+    Makes every name lookup but the local ones fail, so nothing a benchmark
+    runs can reach the internet. Returns {host: lookups} of what was refused.
+    """
+    blocked = {}
+    getaddrinfo = socket.getaddrinfo
+
+    def local_getaddrinfo(host, *args, **kwargs):
+        name = host.decode('idna') if isinstance(host, bytes) else str(host)
+        if name not in LOCAL_HOSTS:
+            blocked[name] = blocked.get(name, 0) + 1
+            raise socket.gaierror(socket.EAI_NONAME, f"{name} is not reachable during a benchmark")
+        return getaddrinfo(host, *args, **kwargs)
+    socket.getaddrinfo = local_getaddrinfo
+    return blocked
+
+
+def make_media(media_dir, name, files=1, duration=60, size="1920x1080"):
+    """
+    Makes a release of synthetic media with ffmpeg: a test pattern with 5.1
+    sine audio and English subtitles. files > 1 makes a season pack folder of
+    that many episodes. Media that was made before with the same settings is
+    reused. Returns the release's path.
+    """
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg was not found on the PATH, it is needed to make the benchmark media")
+    settings = hashlib.sha1(json.dumps([name, files, duration, size]).encode('utf-8')).hexdigest()[:8]
+    release_dir = os.path.join(media_dir, settings)
+    if files > 1:
+        release = os.path.join(release_dir, name)
+        paths = [os.path.join(release, f"{name.replace('.S01.', f'.S01E{n + 1:02d}.')}.mkv") for n in range(files)]
+    else:
+        release = os.path.join(release_dir, f"{name}.mkv")
+        paths = [release]
+
+    for path in paths:
+        if os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        subtitles = f"{path}.srt"
+        with open(subtitles, 'w', encoding='utf-8') as f:
+            f.write("1\n00:00:01,000 --> 00:00:04,000\nBenchmark subtitles\n")
+        subprocess.run([
+            ffmpeg, '-hide_banner', '-loglevel', 'error', '-y',
+            '-f', 'lavfi', '-i', f"testsrc2=size={size}:rate=24000/1001:duration={duration}",
+            '-f', 'lavfi', '-i', f"sine=frequency=440:sample_rate=48000:duration={duration}",
+            '-i', subtitles,
+            '-map', '0:v', '-map', '1:a', '-map', '2:s',
+            '-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '30', '-pix_fmt', 'yuv420p',
+            '-c:a', 'ac3', '-ac', '6', '-b:a', '384k', '-c:s', 'srt',
+            '-metadata:s:a:0', 'language=eng', '-metadata:s:s:0', 'language=eng',
+            f"{path}.part.mkv",
+        ], check=True)
+        os.remove(subtitles)
+        os.replace(f"{path}.part.mkv", path)
+    return release
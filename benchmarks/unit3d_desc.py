@@ -0,0 +1,239 @@
+"""
+Times the UNIT3D description of a 20 file pack sent to a number of trackers,
+rendered for every tracker as before, and rendered once and shared by
+COMMON.unit3d_edit_desc.
+
+Runs offline against a temporary release dir, with the MediaInfo of every
+file already saved. By default the screenshots of every file are already in
+meta, so only the rendering is timed. With --upload the screenshots of the
+other files of the pack are uploaded while rendering, to an image host
+stand-in that takes --upload-latency seconds per file.
+
+    python benchmarks/unit3d_desc.py [--files 20] [--trackers 10] [--repeat 5] [--upload]
+"""
+import argparse
+import asyncio
+import copy
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.harness import load_config  # noqa: E402
+
+config = load_config()
+
+from src.console import console  # noqa: E402
+from src.mediainfocache import get_mediainfo_cache  # noqa: E402
+from src.trackers import COMMON as common_module  # noqa: E402
+
+MEDIAINFO = """General
+Complete name                            : {name}
+Format                                   : Matroska
+Format version                           : Version 4
+File size                                : 1.17 GiB
+Duration                                 : 44 min 12 s
+Overall bit rate                         : 3 786 kb/s
+
+Video
+ID                                       : 1
+Format                                   : AVC
+Format/Info                              : Advanced Video Codec
+Format profile                           : High@L4.1
+Duration                                 : 44 min 12 s
+Bit rate                                 : 3 147 kb/s
+Width                                    : 1 920 pixels
+Height                                   : 1 080 pixels
+Display aspect ratio                     : 16:9
+Frame rate                               : 23.976 (24000/1001) FPS
+Bit depth                                : 8 bits
+Language                                 : English
+
+Audio
+ID                                       : 2
+Format                                   : E-AC-3
+Commercial name                          : Dolby Digital Plus
+Duration                                 : 44 min 12 s
+Bit rate                                 : 640 kb/s
+Channel(s)                               : 6 channels
+Language                                 : English
+
+Text
+ID                                       : 3
+Format                                   : UTF-8
+Title                                    : English (SDH)
+Language                                 : English
+"""
+
+
+def images(prefix, count):
+    return [
+        {
+            'img_url': f"https://images.example/{prefix}_{n}_thumb.png",
+            'raw_url': f"https://images.example/{prefix}_{n}.png",
+            'web_url': f"https://images.example/view/{prefix}_{n}",
+        }
+        for n in range(count)
+    ]
+
+
+def make_release(root, files, screens, upload):
+    uuid = "Benchmark.Show.S01.1080p.WEB-DL.DDP5.1.H.264-GRP"
+    release_dir = os.path.join(root, "tmp", uuid)
+    pack_dir = os.path.join(root, "media", uuid)
+    os.makedirs(release_dir)
+    os.makedirs(pack_dir)
+    filelist = []
+    for i in range(files):
+        path = os.path.join(pack_dir, f"Benchmark.Show.S01E{i + 1:02d}.1080p.WEB-DL.DDP5.1.H.264-GRP.mkv")
+        with open(path, 'wb') as f:
+            f.write(b"\0" * 1024)
+        get_mediainfo_cache(root, uuid).add(path, MEDIAINFO.format(name=path))
+        filelist.append(path)
+    with open(os.path.join(release_dir, "DESCRIPTION.txt"), 'w', encoding='utf8') as f:
+        f.write("[center][b]Benchmark Show[/b][/center]\n[code]Notes about the release[/code]\n[hide=Details]Nothing to see[/hide]\n")
+
+    meta = {
+        'base_dir': root,
+        'uuid': uuid,
+        'path': pack_dir,
+        'filelist': filelist,
+        'discs': [],
+        'screens': screens,
+        'imghost': 'imgbb',
+        'debug': False,
+        'image_list': images("file_0", screens),
+    }
+    for i in range(1, files):
+        if upload:
+            for n in range(2):
+                open(os.path.join(release_dir, f"FILE_{i}-{n}.png"), 'wb').close()
+        else:
+            meta[f'new_images_file_{i}'] = images(f"file_{i}", 2)
+    return meta
+
+
+def fake_image_host(latency, uploads):
+    """
+    Returns a stand-in for Prep.upload_screens that sleeps for latency and
+    makes up the URLs, counting the calls in uploads.
+    """
+    def upload_screens(prep, meta, screens, img_host_num, i, total_screens, custom_img_list, return_dict, retry_mode=False, max_retries=3):
+        uploads[0] += 1
+        time.sleep(latency)
+        uploaded = [images(os.path.splitext(image)[0], 1)[0] for image in sorted(custom_img_list)]
+        return uploaded, len(uploaded)
+    return upload_screens
+
+
+async def old_path(common, meta, trackers):
+    """
+    What unit3d_edit_desc did before, the whole description rendered for each tracker.
+    """
+    for tracker in trackers:
+        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf8').read()
+        body = await common.unit3d_desc_body(meta, base)
+        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]DESCRIPTION.txt", 'w', encoding='utf8') as descfile:
+            descfile.write(body)
+            descfile.write(f"\n[right][size=4]{tracker} signature[/size][/right]")
+
+
+async def new_path(common, meta, trackers, concurrent):
+    signatures = {tracker: f"\n[right][size=4]{tracker} signature[/size][/right]" for tracker in trackers}
+    if concurrent:
+        # As with --tracker-concurrency, every tracker gets its own copy of meta
+        await asyncio.gather(*(common.unit3d_edit_desc(copy.deepcopy(meta), tracker, signatures[tracker]) for tracker in trackers))
+    else:
+        for tracker in trackers:
+            await common.unit3d_edit_desc(meta, tracker, signatures[tracker])
+
+
+def read_descriptions(meta, trackers):
+    descriptions = {}
+    for tracker in trackers:
+        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]DESCRIPTION.txt", 'r', encoding='utf8') as f:
+            descriptions[tracker] = f.read()
+    return descriptions
+
+
+def count_renders(common):
+    """
+    Counts the calls to common.unit3d_desc_body.
+    """
+    render = common.unit3d_desc_body
+    renders = [0]
+
+    async def counted(*args, **kwargs):
+        renders[0] += 1
+        return await render(*args, **kwargs)
+    common.unit3d_desc_body = counted
+    return renders
+
+
+def time_runs(meta, repeat, run, renders, uploads):
+    """
+    Returns the best and mean time of run, and the renders per run. Every run
+    starts with no bodies saved, and the first one, which imports src.prep,
+    isn't counted.
+    """
+    times = []
+    for n in range(repeat + 1):
+        common_module._unit3d_desc_bodies.clear()
+        common_module._unit3d_desc_locks.clear()
+        run_meta = copy.deepcopy(meta)
+        if n == 1:
+            renders[0] = uploads[0] = 0
+        start = time.perf_counter()
+        asyncio.run(run(run_meta))
+        times.append(time.perf_counter() - start)
+    times = times[1:]
+    return min(times), sum(times) / len(times), renders[0] // repeat, uploads[0] // repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--files', type=int, default=20)
+    parser.add_argument('--trackers', type=int, default=10)
+    parser.add_argument('--screens', type=int, default=6)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--upload', action='store_true', help="upload the pack's screenshots while rendering")
+    parser.add_argument('--upload-latency', type=float, default=0.05)
+    args = parser.parse_args()
+
+    # The pack part of the description, with every file's MediaInfo and screenshots
+    config['DEFAULT'].update({'multiScreens': "2", 'fileLimit': "5", 'processLimit': str(args.files)})
+    common = common_module.COMMON(config)
+    renders = count_renders(common)
+    uploads = [0]
+    from src.prep import Prep
+    Prep.upload_screens = fake_image_host(args.upload_latency, uploads)
+    trackers = [f"T{n:02d}" for n in range(args.trackers)]
+    root = tempfile.mkdtemp(prefix="unit3d_desc_")
+    console.quiet = True
+    try:
+        meta = make_release(root, args.files, args.screens, args.upload)
+        results = {}
+        outputs = {}
+        for name, run in (
+            ("old", lambda m: old_path(common, m, trackers)),
+            ("new, sequential", lambda m: new_path(common, m, trackers, False)),
+            ("new, concurrent", lambda m: new_path(common, m, trackers, True)),
+        ):
+            results[name] = time_runs(meta, args.repeat, run, renders, uploads)
+            outputs[name] = read_descriptions(meta, trackers)
+    finally:
+        console.quiet = False
+        shutil.rmtree(root, ignore_errors=True)
+
+    expected = outputs["old"]
+    console.print(f"{args.files} files, {args.trackers} trackers, best and mean of {args.repeat} runs")
+    for name, (best, mean, run_renders, run_uploads) in results.items():
+        same = "identical" if outputs[name] == expected else "DIFFERENT"
+        console.print(f"{name:<16} {best * 1000:7.1f} ms {mean * 1000:7.1f} ms {run_renders:3d} renders {run_uploads:4d} uploads, {same}")
+
+
+if __name__ == "__main__":
+    main()
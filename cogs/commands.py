@@ -2,12 +2,7 @@ from src.prep import Prep
 from src.args import Args
 from src.clients import Clients
 from src.search import Search
-from src.trackers.BLU import BLU
-from src.trackers.BHD import BHD
-from src.trackers.AITHER import AITHER
-from src.trackers.STC import STC
-from src.trackers.LCD import LCD
-from src.trackers.CBR import CBR
+from src.trackerregistry import tracker_class_map
 from data.config import config  # type: ignore
 
 import discord  # type: ignore
@@ -419,25 +414,25 @@ class Commands(commands.Cog):
                 for manual_tracker in tracker_list:
                     manual_tracker = manual_tracker.replace(" ", "")
                     if manual_tracker.upper() == "BLU":
-                        blu = BLU(config=config)
+                        blu = tracker_class_map['BLU'](config=config)
                         await blu.edit_desc(meta)
                     if manual_tracker.upper() == "BHD":
-                        bhd = BHD(config=config)
+                        bhd = tracker_class_map['BHD'](config=config)
                         await bhd.edit_desc(meta)
                     if manual_tracker.upper() == "AITHER":
-                        aither = AITHER(config=config)
+                        aither = tracker_class_map['AITHER'](config=config)
                         await aither.edit_desc(meta)
                     if manual_tracker.upper() == "STC":
-                        stc = STC(config=config)
+                        stc = tracker_class_map['STC'](config=config)
                         await stc.edit_desc(meta)
                     if manual_tracker.upper() == "OE":
-                        stc = OE(config=config)
+                        stc = tracker_class_map['OE'](config=config)
                         await stc.edit_desc(meta)
                     if manual_tracker.upper() == "LCD":
-                        lcd = LCD(config=config)
+                        lcd = tracker_class_map['LCD'](config=config)
                         await lcd.edit_desc(meta)
                     if manual_tracker.upper() == "CBR":
-                        cbr = CBR(config=config)
+                        cbr = tracker_class_map['CBR'](config=config)
                         await cbr.edit_desc(meta)
                 archive_url = await prep.package(meta)
                 upload_embed_description = upload_embed_description.replace('MANUAL', '~~MANUAL~~')
@@ -450,7 +445,7 @@ class Commands(commands.Cog):
                     upload_embed.add_field(name="Files can be found at:", value=f"{archive_url} or `tmp/{meta['uuid']}`")
                     await msg.edit(embed=upload_embed)
             if "BLU" in tracker_list:
-                blu = BLU(config=config)
+                blu = tracker_class_map['BLU'](config=config)
                 dupes = await blu.search_existing(meta)
                 meta = await self.dupe_embed(dupes, meta, tracker_emojis, channel)
                 if meta['upload'] is True:
@@ -460,7 +455,7 @@ class Commands(commands.Cog):
                     upload_embed = discord.Embed(title=f"Uploaded `{meta['name']}` to:", description=upload_embed_description, color=0x00ff40)
                     await msg.edit(embed=upload_embed)
             if "BHD" in tracker_list:
-                bhd = BHD(config=config)
+                bhd = tracker_class_map['BHD'](config=config)
                 dupes = await bhd.search_existing(meta)
                 meta = await self.dupe_embed(dupes, meta, tracker_emojis, channel)
                 if meta['upload'] is True:
@@ -470,7 +465,7 @@ class Commands(commands.Cog):
                     upload_embed = discord.Embed(title=f"Uploaded `{meta['name']}` to:", description=upload_embed_description, color=0x00ff40)
                     await msg.edit(embed=upload_embed)
             if "AITHER" in tracker_list:
-                aither = AITHER(config=config)
+                aither = tracker_class_map['AITHER'](config=config)
                 dupes = await aither.search_existing(meta)
                 meta = await self.dupe_embed(dupes, meta, tracker_emojis, channel)
                 if meta['upload'] is True:
@@ -480,7 +475,7 @@ class Commands(commands.Cog):
                     upload_embed = discord.Embed(title=f"Uploaded `{meta['name']}` to:", description=upload_embed_description, color=0x00ff40)
                     await msg.edit(embed=upload_embed)
             if "STC" in tracker_list:
-                stc = STC(config=config)
+                stc = tracker_class_map['STC'](config=config)
                 dupes = await stc.search_existing(meta)
                 meta = await self.dupe_embed(dupes, meta, tracker_emojis, channel)
                 if meta['upload'] is True:
@@ -490,7 +485,7 @@ class Commands(commands.Cog):
                     upload_embed = discord.Embed(title=f"Uploaded `{meta['name']}` to:", description=upload_embed_description, color=0x00ff40)
                     await msg.edit(embed=upload_embed)
             if "LCD" in tracker_list:
-                lcd = LCD(config=config)
+                lcd = tracker_class_map['LCD'](config=config)
                 dupes = await lcd.search_existing(meta)
                 meta = await self.dupe_embed(dupes, meta, tracker_emojis, channel)
                 if meta['upload'] is True:
@@ -500,7 +495,7 @@ class Commands(commands.Cog):
                     upload_embed = discord.Embed(title=f"Uploaded `{meta['name']}` to:", description=upload_embed_description, color=0x00ff40)
                     await msg.edit(embed=upload_embed)
             if "CBR" in tracker_list:
-                cbr = CBR(config=config)
+                cbr = tracker_class_map['CBR'](config=config)
                 dupes = await cbr.search_existing(meta)
                 meta = await self.dupe_embed(dupes, meta, tracker_emojis, channel)
                 if meta['upload'] is True:
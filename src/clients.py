@@ -1,19 +1,23 @@
 # -*- coding: utf-8 -*-
 from torf import Torrent
-import xmlrpc.client
 import bencode
 import os
-import qbittorrentapi
-from deluge_client import DelugeRPCClient
 import base64
 import errno
 import asyncio
-import ssl
 import shutil
-import time
+from concurrent.futures import ThreadPoolExecutor
 from src.console import console
+from src.clientsessions import get_client_session
+from src.lazyimport import lazy_import
+from src.torrentindex import get_torrent_index, wait_for_torrent
+from src.tracing import traced
 import re
 
+qbittorrentapi = lazy_import('qbittorrentapi')
+# Per file fast resume data of the releases this process has added, so every tracker's torrent reuses it
+_fast_resume_files = {}
+
 
 class Clients():
     """
@@ -23,6 +27,14 @@ class Clients():
         self.config = config
         pass
 
+    def client_session(self, client_name):
+        """
+        The shared connection to a configured client, so every tracker's torrent
+        is added over one login instead of a new one each time.
+        """
+        return get_client_session(client_name, self.config['TORRENT_CLIENTS'][client_name])
+
+    @traced("Add to client ({tracker})", cat="client")
     async def add_to_client(self, meta, tracker):
         torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]{meta['clean_name']}.torrent"
         if meta.get('no_seed', False) is True:
@@ -48,13 +60,13 @@ class Clients():
 
         console.print(f"[bold green]Adding to {torrent_client}")
         if torrent_client.lower() == "rtorrent":
-            self.rtorrent(meta['path'], torrent_path, torrent, meta, local_path, remote_path, client)
+            await self.rtorrent(meta['path'], torrent_path, torrent, meta, local_path, remote_path, client, self.client_session(default_torrent_client), get_torrent_index(default_torrent_client, client))
         elif torrent_client == "qbit":
-            await self.qbittorrent(meta['path'], torrent, local_path, remote_path, client, meta['is_disc'], meta['filelist'], meta)
+            await self.qbittorrent(meta['path'], torrent, local_path, remote_path, client, meta['is_disc'], meta['filelist'], meta, self.client_session(default_torrent_client), get_torrent_index(default_torrent_client, client))
         elif torrent_client.lower() == "deluge":
             if meta['type'] == "DISC":
                 path = os.path.dirname(meta['path'])  # noqa F841
-            self.deluge(meta['path'], torrent_path, torrent, local_path, remote_path, client, meta)
+            self.deluge(meta['path'], torrent_path, torrent, local_path, remote_path, client, meta, self.client_session(default_torrent_client))
         elif torrent_client.lower() == "watch":
             shutil.copy(torrent_path, client['watch_folder'])
         return
@@ -88,8 +100,8 @@ class Clients():
                     torrenthash = hash_value
                     break
 
-        if torrent_client == 'qbit' and not torrenthash and client.get('enable_search'):
-            torrenthash = await self.search_qbit_for_torrent(meta, client)
+        if torrent_client in ('qbit', 'rtorrent', 'deluge') and not torrenthash and client.get('enable_search'):
+            torrenthash = await self.search_client_for_torrent(meta, default_torrent_client, client)
 
         if torrenthash:
             torrent_path = f"{torrent_storage_dir}/{torrenthash}.torrent"
@@ -199,84 +211,58 @@ class Clients():
 
         return valid, torrent_path
 
-    async def search_qbit_for_torrent(self, meta, client):
-        console.print("[green]Searching qbittorrent for an existing .torrent")
+    async def search_client_for_torrent(self, meta, client_name, client):
+        torrent_client = client.get('torrent_client', '').lower()
+        console.print(f"[green]Searching {torrent_client} for an existing .torrent")
         torrent_storage_dir = client.get('torrent_storage_dir', None)
         if meta['debug']:
             if torrent_storage_dir:
                 console.print(f"Torrent storage directory found: {torrent_storage_dir}")
             else:
                 console.print("No torrent storage directory found.")
-        if torrent_storage_dir is None and client.get("torrent_client", None) != "watch":
-            console.print(f"[bold red]Missing torrent_storage_dir for {self.config['DEFAULT']['default_torrent_client']}")
+        if torrent_storage_dir is None:
+            console.print(f"[bold red]Missing torrent_storage_dir for {client_name}")
             return None
 
-        try:
-            qbt_client = qbittorrentapi.Client(host=client['qbit_url'], port=client['qbit_port'], username=client['qbit_user'], password=client['qbit_pass'], VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True))
-            qbt_client.auth_log_in()
-            if meta['debug']:
-                console.print("We logged into qbittorrent")
-        except qbittorrentapi.LoginFailed:
-            console.print("[bold red]INCORRECT QBIT LOGIN CREDENTIALS")
-            return None
-        except qbittorrentapi.APIConnectionError:
-            console.print("[bold red]APIConnectionError: INCORRECT HOST/PORT")
-            return None
+        # A single file is stored by its own path, anything else by the folder
+        if meta['is_disc'] in ("", None) and len(meta['filelist']) == 1:
+            content_path = meta['filelist'][0]
+        else:
+            content_path = meta['path']
 
-        # Remote path map if needed
-        remote_path_map = False
+        # The client knows the content by its remote path
         local_path, remote_path = await self.remote_path_map(meta)
-        if local_path.lower() in meta['path'].lower() and local_path.lower() != remote_path.lower():
-            remote_path_map = True
+        if local_path.lower() in content_path.lower() and local_path.lower() != remote_path.lower():
+            content_path = content_path.replace(local_path, remote_path)
             if meta['debug']:
                 console.print("Remote path mapping found!")
                 console.print(f"Local path: {local_path}")
                 console.print(f"Remote path: {remote_path}")
+                console.print(f"Content path after remote mapping: {content_path}")
 
-        torrents = qbt_client.torrents.info()
-        for torrent in torrents:
-            try:
-                torrent_path = torrent.get('content_path', f"{torrent.save_path}{torrent.name}")
-                # console.print("Trying torrent_paths")
-            except AttributeError:
-                if meta['debug']:
-                    console.print(torrent)
-                    console.print_exception()
-                continue
-            if remote_path_map:
-                # Replace remote path with local path only if not already mapped
-                if not torrent_path.startswith(local_path):
-                    torrent_path = torrent_path.replace(remote_path, local_path)
-                    if meta['debug']:
-                        console.print("Replaced paths round 2:", torrent_path)
-
-                # Check if the local path was accidentally duplicated and correct it
-                if torrent_path.startswith(f"{local_path}/{local_path.split('/')[-1]}"):
-                    torrent_path = torrent_path.replace(f"{local_path}/{local_path.split('/')[-1]}", local_path)
-                    if meta['debug']:
-                        console.print("Corrected duplicate in torrent path round 2:", torrent_path)
-
-                # Standardize path separators for the local OS
-                torrent_path = torrent_path.replace(os.sep, '/').replace('/', os.sep)
-                if meta['debug']:
-                    console.print("Final torrent path after remote mapping round 2:", torrent_path)
-
-            if meta['is_disc'] in ("", None) and len(meta['filelist']) == 1:
-                if torrent_path.lower() == meta['filelist'][0].lower() and len(torrent.files) == len(meta['filelist']):
-                    valid, torrent_path = await self.is_valid_torrent(meta, f"{torrent_storage_dir}/{torrent.hash}.torrent", torrent.hash, 'qbit', print_err=False)
-                    if valid:
-                        console.print(f"[green]Found a matching .torrent with hash: [bold yellow]{torrent.hash}")
-                        return torrent.hash
+        index = get_torrent_index(client_name, client)
+        try:
+            torrenthashes = await asyncio.to_thread(index.lookup, content_path)
+        except qbittorrentapi.LoginFailed:
+            console.print("[bold red]INCORRECT QBIT LOGIN CREDENTIALS")
+            return None
+        except qbittorrentapi.APIConnectionError:
+            console.print("[bold red]APIConnectionError: INCORRECT HOST/PORT")
+            return None
+        except Exception as e:
+            console.print(f"[bold red]Unable to search {torrent_client}: {e}")
+            return None
+        if meta['debug']:
+            console.print(f"{torrent_client} has {len(index.hashes)} torrents, {len(torrenthashes)} with this content path")
 
-            elif os.path.normpath(meta['path']).lower() == os.path.normpath(torrent_path).lower():
-                valid, torrent_path = await self.is_valid_torrent(meta, f"{torrent_storage_dir}/{torrent.hash}.torrent", torrent.hash, 'qbit', print_err=False)
-                if valid:
-                    console.print(f"[green]Found a matching .torrent with hash: [bold yellow]{torrent.hash}")
-                    return torrent.hash
+        for torrenthash in torrenthashes:
+            valid, torrent_path = await self.is_valid_torrent(meta, f"{torrent_storage_dir}/{torrenthash}.torrent", torrenthash, torrent_client, print_err=False)
+            if valid:
+                console.print(f"[green]Found a matching .torrent with hash: [bold yellow]{torrenthash}")
+                return torrenthash
         return None
 
-    def rtorrent(self, path, torrent_path, torrent, meta, local_path, remote_path, client):
-        rtorrent = xmlrpc.client.Server(client['rtorrent_url'], context=ssl._create_stdlib_context())
+    async def rtorrent(self, path, torrent_path, torrent, meta, local_path, remote_path, client, session, index):
         metainfo = bencode.bread(torrent_path)
         try:
             fast_resume = self.add_fast_resume(metainfo, path, torrent)
@@ -306,13 +292,15 @@ class Clients():
             path = os.path.dirname(path)
 
         console.print("[bold yellow]Adding and starting torrent")
-        rtorrent.load.start_verbose('', fr_file, f"d.directory_base.set={path}")
-        time.sleep(1)
-        # Add labels
-        if client.get('rtorrent_label', None) is not None:
-            rtorrent.d.custom1.set(torrent.infohash, client['rtorrent_label'])
-        if meta.get('rtorrent_label') is not None:
-            rtorrent.d.custom1.set(torrent.infohash, meta['rtorrent_label'])
+        with session as rtorrent:
+            rtorrent.load.start_verbose('', fr_file, f"d.directory_base.set={path}")
+        # A meta label wins over the client's. It's set with its own call, rTorrent splits load commands on commas
+        label = meta.get('rtorrent_label') if meta.get('rtorrent_label') is not None else client.get('rtorrent_label', None)
+        if not await wait_for_torrent(index, torrent.infohash, timeout=10):
+            console.print("[red]rTorrent has not loaded the torrent yet.")
+        elif label is not None:
+            with session as rtorrent:
+                rtorrent.d.custom1.set(torrent.infohash, label)
 
         # Delete modified fr_file location
         if modified_fr:
@@ -321,7 +309,7 @@ class Clients():
             console.print(f"[cyan]Path: {path}")
         return
 
-    async def qbittorrent(self, path, torrent, local_path, remote_path, client, is_disc, filelist, meta):
+    async def qbittorrent(self, path, torrent, local_path, remote_path, client, is_disc, filelist, meta, session, index):
         # Remote path mount
         if meta.get('keep_folder'):
             # Keep only the root folder (e.g., "D:\\Movies")
@@ -341,22 +329,8 @@ class Clients():
         if not path.endswith('/'):
             path += '/'
 
-        # Initialize qBittorrent client
-        qbt_client = qbittorrentapi.Client(
-            host=client['qbit_url'],
-            port=client['qbit_port'],
-            username=client['qbit_user'],
-            password=client['qbit_pass'],
-            VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
-        )
         console.print("[bold yellow]Adding and rechecking torrent")
 
-        try:
-            qbt_client.auth_log_in()
-        except qbittorrentapi.LoginFailed:
-            console.print("[bold red]INCORRECT QBIT LOGIN CREDENTIALS")
-            return
-
         # Check for automatic management
         auto_management = False
         am_config = client.get('automatic_management_paths', '')
@@ -369,62 +343,58 @@ class Clients():
                 auto_management = True
         qbt_category = client.get("qbit_cat") if not meta.get("qbit_cat") else meta.get('qbit_cat')
         content_layout = client.get('content_layout', 'Original')
+        qbt_tags = [tag for tag in (client.get('qbit_tag'), meta.get('qbit_tag')) if tag]
 
-        # Add the torrent
+        # Add the torrent, tagged and started in the same call
         try:
-            qbt_client.torrents_add(
-                torrent_files=torrent.dump(),
-                save_path=path,
-                use_auto_torrent_management=auto_management,
-                is_skip_checking=True,
-                content_layout=content_layout,
-                category=qbt_category
-            )
+            with session as qbt_client:
+                qbt_client.torrents_add(
+                    torrent_files=torrent.dump(),
+                    save_path=path,
+                    use_auto_torrent_management=auto_management,
+                    is_skip_checking=True,
+                    is_paused=False,
+                    content_layout=content_layout,
+                    category=qbt_category,
+                    tags=qbt_tags or None
+                )
+        except qbittorrentapi.LoginFailed:
+            console.print("[bold red]INCORRECT QBIT LOGIN CREDENTIALS")
+            return
         except qbittorrentapi.APIConnectionError as e:
             console.print(f"[red]Failed to add torrent: {e}")
             return
 
         # Wait for torrent to be added
-        timeout = 30
-        for _ in range(timeout):
-            if len(qbt_client.torrents_info(torrent_hashes=torrent.infohash)) > 0:
-                break
-            await asyncio.sleep(1)
-        else:
+        if not await wait_for_torrent(index, torrent.infohash, timeout=30):
             console.print("[red]Torrent addition timed out.")
             return
 
-        # Resume and tag torrent
-        qbt_client.torrents_resume(torrent.infohash)
-        if client.get('qbit_tag'):
-            qbt_client.torrents_add_tags(tags=client['qbit_tag'], torrent_hashes=torrent.infohash)
-        if meta.get('qbit_tag'):
-            qbt_client.torrents_add_tags(tags=meta['qbit_tag'], torrent_hashes=torrent.infohash)
-
         console.print(f"Added to: {path}")
 
-    def deluge(self, path, torrent_path, torrent, local_path, remote_path, client, meta):
-        client = DelugeRPCClient(client['deluge_url'], int(client['deluge_port']), client['deluge_user'], client['deluge_pass'])
-        # client = LocalDelugeRPCClient()
-        client.connect()
-        if client.connected is True:
-            console.print("Connected to Deluge")
-            isdir = os.path.isdir(path)  # noqa F841
-            # Remote path mount
-            if local_path.lower() in path.lower() and local_path.lower() != remote_path.lower():
-                path = path.replace(local_path, remote_path)
-                path = path.replace(os.sep, '/')
+    def deluge(self, path, torrent_path, torrent, local_path, remote_path, client, meta, session):
+        try:
+            with session as deluge:
+                if deluge.connected is not True:
+                    raise ConnectionError("not connected")
+                isdir = os.path.isdir(path)  # noqa F841
+                # Remote path mount
+                if local_path.lower() in path.lower() and local_path.lower() != remote_path.lower():
+                    path = path.replace(local_path, remote_path)
+                    path = path.replace(os.sep, '/')
 
-            path = os.path.dirname(path)
+                path = os.path.dirname(path)
 
-            client.call('core.add_torrent_file', torrent_path, base64.b64encode(torrent.dump()), {'download_location': path, 'seed_mode': True})
-            if meta['debug']:
-                console.print(f"[cyan]Path: {path}")
-        else:
+                deluge.call('core.add_torrent_file', torrent_path, base64.b64encode(torrent.dump()), {'download_location': path, 'seed_mode': True})
+                if meta['debug']:
+                    console.print(f"[cyan]Path: {path}")
+        except OSError:
             console.print("[bold red]Unable to connect to deluge")
 
     def add_fast_resume(self, metainfo, datapath, torrent):
         """ Add fast resume data to a metafile dict.
+        The per file resume data only depends on the payload, so it's worked out
+        once per release in this process and reused for every tracker's torrent.
         """
         # Get list of files
         files = metainfo["info"].get("files", None)
@@ -440,35 +410,53 @@ class Clients():
         # Prepare resume data
         resume = metainfo.setdefault("libtorrent_resume", {})
         resume["bitfield"] = len(metainfo["info"]["pieces"]) // 20
-        resume["files"] = []
         piece_length = metainfo["info"]["piece length"]
-        offset = 0
 
+        # Get the paths into the filesystem
+        filepaths = []
         for fileinfo in files:
-            # Get the path into the filesystem
             filepath = os.sep.join(fileinfo["path"])
             if not single:
                 filepath = os.path.join(datapath, filepath.strip(os.sep))
-
-            # Check file size
-            if os.path.getsize(filepath) != fileinfo["length"]:
-                raise OSError(errno.EINVAL, "File size mismatch for %r [is %d, expected %d]" % (
-                    filepath, os.path.getsize(filepath), fileinfo["length"],
+            filepaths.append(filepath)
+
+        cache_key = (piece_length, tuple((filepath, fileinfo["length"]) for filepath, fileinfo in zip(filepaths, files)))
+        resume_files = _fast_resume_files.get(cache_key)
+        if resume_files is None:
+            resume_files = []
+            offset = 0
+            for filepath, fileinfo, stat in zip(filepaths, files, self.stat_files(filepaths)):
+                # Check file size
+                if stat.st_size != fileinfo["length"]:
+                    raise OSError(errno.EINVAL, "File size mismatch for %r [is %d, expected %d]" % (
+                        filepath, stat.st_size, fileinfo["length"],
+                    ))
+
+                # Add resume data for this file
+                resume_files.append(dict(
+                    priority=1,
+                    mtime=int(stat.st_mtime),
+                    completed=(
+                        (offset + fileinfo["length"] + piece_length - 1) // piece_length -
+                        offset // piece_length
+                    ),
                 ))
+                offset += fileinfo["length"]
+            _fast_resume_files[cache_key] = resume_files
+            if len(_fast_resume_files) > 16:
+                _fast_resume_files.pop(next(iter(_fast_resume_files)))
 
-            # Add resume data for this file
-            resume["files"].append(dict(
-                priority=1,
-                mtime=int(os.path.getmtime(filepath)),
-                completed=(
-                    (offset + fileinfo["length"] + piece_length - 1) // piece_length -
-                    offset // piece_length
-                ),
-            ))
-            offset += fileinfo["length"]
-
+        resume["files"] = [dict(resume_file) for resume_file in resume_files]
         return metainfo
 
+    @staticmethod
+    def stat_files(filepaths):
+        # Each stat is a round trip on network storage, so large file lists are stat'ed in parallel
+        if len(filepaths) < 32:
+            return [os.stat(filepath) for filepath in filepaths]
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            return list(pool.map(os.stat, filepaths))
+
     async def remote_path_map(self, meta):
         if meta.get('client', None) is None:
             torrent_client = self.config['DEFAULT']['default_torrent_client']
@@ -491,23 +479,13 @@ class Clients():
 
     async def get_ptp_from_hash(self, meta):
         default_torrent_client = self.config['DEFAULT']['default_torrent_client']
-        client = self.config['TORRENT_CLIENTS'][default_torrent_client]
-        qbt_client = qbittorrentapi.Client(
-            host=client['qbit_url'],
-            port=client['qbit_port'],
-            username=client['qbit_user'],
-            password=client['qbit_pass'],
-            VERIFY_WEBUI_CERTIFICATE=client.get('VERIFY_WEBUI_CERTIFICATE', True)
-        )
-
         try:
-            qbt_client.auth_log_in()
+            with self.client_session(default_torrent_client) as qbt_client:
+                info_hash_v1 = meta.get('infohash')
+                torrents = qbt_client.torrents_info()
         except qbittorrentapi.LoginFailed as e:
             console.print(f"[bold red]Login failed while trying to get info hash: {e}")
             exit(1)
-
-        info_hash_v1 = meta.get('infohash')
-        torrents = qbt_client.torrents_info()
         found = False
 
         for torrent in torrents:
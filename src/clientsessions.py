@@ -0,0 +1,112 @@
+import ssl
+import threading
+import xmlrpc.client
+from abc import ABC, abstractmethod
+
+from src.lazyimport import lazy_import
+
+qbittorrentapi = lazy_import('qbittorrentapi')
+DelugeRPCClient = lazy_import('deluge_client', 'DelugeRPCClient')
+
+
+class ClientSession(ABC):
+    """
+    One connection to a configured torrent client, kept for the life of the process.
+
+    Use it as a context manager to get the connection. It is made on first use,
+    and the lock keeps two threads from talking over the same socket. After a
+    connection error the connection is dropped, and the next use connects and
+    logs in again.
+    """
+    connection_errors = (ConnectionError, OSError)
+
+    def __init__(self, client):
+        self.client = client
+        self.conn = None
+        self.lock = threading.RLock()
+
+    @abstractmethod
+    def connect(self):
+        """
+        Returns a new, logged in connection to the client.
+        """
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            if self.conn is None:
+                self.conn = self.connect()
+        except BaseException:
+            self.lock.release()
+            raise
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and issubclass(exc_type, self.connection_errors):
+            self.conn = None
+        self.lock.release()
+        return False
+
+
+class QbitSession(ClientSession):
+    """
+    qBittorrent Web API session. qbittorrentapi logs in again by itself when
+    the session cookie expires, so only a lost connection needs a new client.
+    """
+    @property
+    def connection_errors(self):
+        return (qbittorrentapi.APIConnectionError,)
+
+    def connect(self):
+        qbt_client = qbittorrentapi.Client(
+            host=self.client['qbit_url'],
+            port=self.client['qbit_port'],
+            username=self.client['qbit_user'],
+            password=self.client['qbit_pass'],
+            VERIFY_WEBUI_CERTIFICATE=self.client.get('VERIFY_WEBUI_CERTIFICATE', True)
+        )
+        qbt_client.auth_log_in()
+        return qbt_client
+
+
+class RtorrentSession(ClientSession):
+    """
+    rTorrent XML-RPC proxy. The transport keeps its HTTP connection open between calls.
+    """
+    connection_errors = (ConnectionError, OSError, xmlrpc.client.ProtocolError)
+
+    def connect(self):
+        return xmlrpc.client.Server(self.client['rtorrent_url'], context=ssl._create_stdlib_context())
+
+
+class DelugeSession(ClientSession):
+    """
+    Deluge daemon RPC connection, logged in once.
+    """
+    def connect(self):
+        deluge = DelugeRPCClient(self.client['deluge_url'], int(self.client['deluge_port']), self.client['deluge_user'], self.client['deluge_pass'], decode_utf8=True)
+        deluge.connect()
+        return deluge
+
+
+_session_classes = {
+    'qbit': QbitSession,
+    'rtorrent': RtorrentSession,
+    'deluge': DelugeSession,
+}
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_client_session(client_name, client):
+    """
+    Returns the session for a configured torrent client, creating it on first use.
+    None if the client type has no connection to keep.
+    """
+    session_class = _session_classes.get(client.get('torrent_client', '').lower())
+    if session_class is None:
+        return None
+    with _sessions_lock:
+        if client_name not in _sessions:
+            _sessions[client_name] = session_class(client)
+        return _sessions[client_name]
@@ -0,0 +1,138 @@
+import atexit
+import os
+import pickle
+import re
+import threading
+
+import requests
+
+from data.config import config
+from src.network import rate_limited_adapter
+
+
+def parse_cookie_file(cookiefile):
+    """
+    Parses a cookies.txt file into a dictionary of key value pairs compatible with requests.
+    """
+    cookies = {}
+    with open(cookiefile, 'r') as fp:
+        for line in fp:
+            if not line.startswith(("# ", "\n", "#\n")):
+                lineFields = re.split(' |\t', line.strip())
+                lineFields = [x for x in lineFields if x != ""]
+                cookies[lineFields[5]] = lineFields[6]
+    return cookies
+
+
+def save_cookies(cookiefile, cookies):
+    """
+    Pickles cookies to cookiefile through a temporary file, so a crash never leaves half a cookie file.
+    """
+    tmp_file = f"{cookiefile}.tmp"
+    with open(tmp_file, 'wb') as cf:
+        pickle.dump(cookies, cf)
+    os.replace(tmp_file, cookiefile)
+
+
+def _cookie_values(jar):
+    return sorted((cookie.domain, cookie.path, cookie.name, cookie.value) for cookie in jar)
+
+
+class CookieSession():
+    """
+    One requests.Session per cookie based tracker, kept for the life of the process,
+    so its connection is reused and the cookie file is only read when it changes.
+    It shares the per host rate limits of src.network with the API clients.
+    Its requests block, rate limit waits included, so coroutines send them
+    through asyncio.to_thread.
+
+    Use it as a context manager to get the session, which is left open on exit.
+    validated remembers a successful cookie check, so a tracker only checks its
+    cookies once per run; it's cleared again whenever the cookie file changes.
+    Pickled cookies the site refreshed during the run are written back at exit.
+    """
+    def __init__(self, cookiefile):
+        self.cookiefile = cookiefile
+        self.session = requests.Session()
+        adapter = rate_limited_adapter(config)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.validated = False
+        self.version = None
+        self.loaded = []
+        self.lock = threading.Lock()
+
+    @property
+    def pickled(self):
+        return not self.cookiefile.endswith('.txt')
+
+    def refresh(self):
+        """
+        Loads the cookie file again if it has changed, and returns the session.
+        """
+        with self.lock:
+            try:
+                stat = os.stat(self.cookiefile)
+            except FileNotFoundError:
+                return self.session
+            version = (stat.st_mtime_ns, stat.st_size)
+            if version != self.version:
+                if self.pickled:
+                    with open(self.cookiefile, 'rb') as cf:
+                        cookies = pickle.load(cf)
+                else:
+                    cookies = parse_cookie_file(self.cookiefile)
+                self.session.cookies = requests.cookies.RequestsCookieJar()
+                self.session.cookies.update(cookies)
+                self.version = version
+                self.loaded = _cookie_values(self.session.cookies)
+                self.validated = False
+            return self.session
+
+    def save(self):
+        """
+        Writes the session's cookies to the cookie file.
+        """
+        with self.lock:
+            save_cookies(self.cookiefile, self.session.cookies)
+            stat = os.stat(self.cookiefile)
+            self.version = (stat.st_mtime_ns, stat.st_size)
+            self.loaded = _cookie_values(self.session.cookies)
+
+    def save_if_changed(self):
+        if self.pickled and self.version is not None and _cookie_values(self.session.cookies) != self.loaded:
+            self.save()
+
+    def __enter__(self):
+        return self.refresh()
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_cookie_session(tracker, cookiefile):
+    """
+    Returns the CookieSession of a tracker's cookie file, creating it on first use.
+    """
+    key = (tracker, os.path.abspath(cookiefile))
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = CookieSession(os.path.abspath(cookiefile))
+        return _sessions[key]
+
+
+def save_cookie_sessions():
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+    for cookie_session in sessions:
+        try:
+            cookie_session.save_if_changed()
+        except OSError:
+            pass
+
+
+atexit.register(save_cookie_sessions)
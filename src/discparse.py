@@ -3,7 +3,7 @@ import shutil
 import traceback
 import sys
 import asyncio
-from glob import glob
+from glob import glob, escape
 from pymediainfo import MediaInfo
 from collections import OrderedDict
 import json
@@ -210,8 +210,7 @@ class DiscParse():
     async def get_dvdinfo(self, discs):
         for each in discs:
             path = each.get('path')
-            os.chdir(path)
-            files = glob("VTS_*.VOB")
+            files = [os.path.basename(f) for f in glob(os.path.join(escape(path), "VTS_*.VOB"))]
             files.sort()
             filesdict = OrderedDict()
             main_set = []
@@ -223,7 +222,7 @@ class DiscParse():
             main_set_duration = 0
             for vob_set in filesdict.values():
                 try:
-                    vob_set_mi = MediaInfo.parse(f"VTS_{vob_set[0][:2]}_0.IFO", output='JSON')
+                    vob_set_mi = MediaInfo.parse(os.path.join(path, f"VTS_{vob_set[0][:2]}_0.IFO"), output='JSON')
                     vob_set_mi = json.loads(vob_set_mi)
                     tracks = vob_set_mi.get('media', {}).get('track', [])
                     if len(tracks) > 1:
@@ -252,12 +251,12 @@ class DiscParse():
             set = main_set[0][:2]
             each['vob'] = vob = f"{path}/VTS_{set}_1.VOB"
             each['ifo'] = ifo = f"{path}/VTS_{set}_0.IFO"
-            each['vob_mi'] = MediaInfo.parse(os.path.basename(vob), output='STRING', full=False, mediainfo_options={'inform_version': '1'}).replace('\r\n', '\n')
-            each['ifo_mi'] = MediaInfo.parse(os.path.basename(ifo), output='STRING', full=False, mediainfo_options={'inform_version': '1'}).replace('\r\n', '\n')
+            each['vob_mi'] = MediaInfo.parse(vob, output='STRING', full=False, mediainfo_options={'inform_version': '1'}).replace('\r\n', '\n')
+            each['ifo_mi'] = MediaInfo.parse(ifo, output='STRING', full=False, mediainfo_options={'inform_version': '1'}).replace('\r\n', '\n')
             each['vob_mi_full'] = MediaInfo.parse(vob, output='STRING', full=False, mediainfo_options={'inform_version': '1'}).replace('\r\n', '\n')
             each['ifo_mi_full'] = MediaInfo.parse(ifo, output='STRING', full=False, mediainfo_options={'inform_version': '1'}).replace('\r\n', '\n')
 
-            size = sum(os.path.getsize(f) for f in os.listdir('.') if os.path.isfile(f)) / float(1 << 30)
+            size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file()) / float(1 << 30)
             if size <= 7.95:
                 dvd_size = "DVD9"
                 if size <= 4.37:
@@ -268,16 +267,15 @@ class DiscParse():
     async def get_hddvd_info(self, discs):
         for each in discs:
             path = each.get('path')
-            os.chdir(path)
-            files = glob("*.EVO")
+            files = [os.path.basename(f) for f in glob(os.path.join(escape(path), "*.EVO"))]
             size = 0
             largest = files[0]
             # get largest file from files
             for file in files:
-                file_size = os.path.getsize(file)
+                file_size = os.path.getsize(os.path.join(path, file))
                 if file_size > size:
                     largest = file
                     size = file_size
-            each['evo_mi'] = MediaInfo.parse(os.path.basename(largest), output='STRING', full=False, mediainfo_options={'inform_version': '1'})
+            each['evo_mi'] = MediaInfo.parse(os.path.join(path, largest), output='STRING', full=False, mediainfo_options={'inform_version': '1'})
             each['largest_evo'] = os.path.abspath(f"{path}/{largest}")
         return discs
\ No newline at end of file
@@ -0,0 +1,298 @@
+import asyncio
+import base64
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from src.console import console
+from src.lazyimport import lazy_import
+from src.network import get_http_client
+
+pyimgbox = lazy_import('pyimgbox')
+
+# Uploads in flight at once per image host, hosts not listed get task_limit
+IMAGE_HOST_LIMITS = {
+    "onlyimage": 6,
+    "ptscreens": 1,
+    "lensdump": 1,
+}
+# Bytes read from disk at a time, a multiple of 3 so base64 encoded chunks join up without padding
+CHUNK_SIZE = 3 * 65536
+
+
+class MultipartBody():
+    """
+    A multipart/form-data request body that reads its files from disk while
+    it's sent, so an image is never held in memory whole.
+
+    A file can be sent base64 encoded as a text field instead, for hosts that
+    want the image that way, and it's encoded a chunk at a time as it's read.
+    The length is worked out up front, so the body goes out with a
+    Content-Length rather than chunked.
+    """
+    def __init__(self, fields=None, files=None):
+        """
+        fields is {name: value}, files is [(name, path, filename, encode)], where a
+        filename of None sends the file as a text field and encode base64 encodes it.
+        """
+        self.boundary = uuid.uuid4().hex
+        self.parts = []
+        for name, value in (fields or {}).items():
+            self.parts.append(self._header(name) + str(value).encode('utf-8') + b"\r\n")
+        for name, path, filename, encode in files or []:
+            self.parts.append(self._header(name, filename))
+            self.parts.append((path, encode))
+            self.parts.append(b"\r\n")
+        self.parts.append(f"--{self.boundary}--\r\n".encode('utf-8'))
+        self.length = sum(self._part_length(part) for part in self.parts)
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.seek(0)
+
+    def _header(self, name, filename=None):
+        header = f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"'
+        if filename is not None:
+            header += f'; filename="{filename}"\r\nContent-Type: application/octet-stream'
+        return f"{header}\r\n\r\n".encode('utf-8')
+
+    def _part_length(self, part):
+        if isinstance(part, bytes):
+            return len(part)
+        path, encode = part
+        size = os.path.getsize(path)
+        return 4 * -(-size // 3) if encode else size
+
+    def _chunks(self):
+        for part in self.parts:
+            if isinstance(part, bytes):
+                yield part
+                continue
+            path, encode = part
+            with open(path, 'rb') as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    yield base64.b64encode(chunk) if encode else chunk
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+        pieces = []
+        while size != 0:
+            if self.position >= len(self.buffer):
+                self.buffer, self.position = next(self.chunks, b""), 0
+                if not self.buffer:
+                    break
+            end = len(self.buffer) if size < 0 else self.position + size
+            piece = self.buffer[self.position:end]
+            self.position += len(piece)
+            if size > 0:
+                size -= len(piece)
+            pieces.append(piece)
+        return b"".join(pieces)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        # Only rewinding is supported, for a request that is sent again
+        if offset != 0 or whence != os.SEEK_SET:
+            raise OSError("MultipartBody can only be rewound to the start")
+        self.chunks = self._chunks()
+        self.buffer = b""
+        self.position = 0
+        return 0
+
+
+class ImageUploader():
+    """
+    Uploads screenshots to the image hosts from one event loop.
+
+    Uploads go through the shared HTTPClient with streamed bodies, so the
+    uploads of a release cost no more than a few reads from disk and a thread
+    each while the request is out. IMAGE_HOST_LIMITS caps how many uploads a
+    host gets at once, on top of http_connections_per_host. imgbox is uploaded
+    to through pyimgbox, which brings its own client.
+    """
+    def __init__(self, config, meta):
+        self.config = config
+        self.meta = meta
+        self.http = get_http_client(config)
+
+    def _debug_response(self, response):
+        if self.meta['debug']:
+            console.print(f"[yellow]Response status code: {response.status_code}")
+            console.print(f"[yellow]Response content: {response.content.decode('utf-8')}")
+
+    async def _post(self, url, body, headers=None):
+        headers = dict(headers or {})
+        headers['Content-Type'] = body.content_type
+        response = await self.http.post(url, data=body, headers=headers)
+        self._debug_response(response)
+        return response
+
+    async def upload_imgbox(self, image):
+        async with pyimgbox.Gallery(thumb_width=350, square_thumbs=False) as gallery:
+            async for submission in gallery.add([image]):
+                if not submission['success']:
+                    console.print(f"[red]Error uploading to imgbox: [yellow]{submission['error']}[/yellow][/red]")
+                    return None
+                urls = (submission.get('thumbnail_url'), submission.get('image_url'), submission.get('web_url'))
+                if not all(urls):
+                    console.print(f"[red]Incomplete URLs received for image: {image}")
+                    return None
+                return urls
+        return None
+
+    async def upload_ptpimg(self, image):
+        body = MultipartBody(
+            fields={'format': 'json', 'api_key': self.config['DEFAULT']['ptpimg_api']},
+            files=[('file-upload[0]', image, os.path.basename(image), False)],
+        )
+        response = await self._post("https://ptpimg.me/upload.php", body, headers={'referer': 'https://ptpimg.me/index.php'})
+        response_data = response.json()
+        if not response_data:
+            return None
+        img_url = f"https://ptpimg.me/{response_data[0]['code']}.{response_data[0]['ext']}"
+        return img_url, img_url, img_url
+
+    async def upload_imgbb(self, image):
+        body = MultipartBody(
+            fields={'key': self.config['DEFAULT']['imgbb_api']},
+            files=[('image', image, None, True)],
+        )
+        response = await self._post("https://api.imgbb.com/1/upload", body)
+        response_data = response.json()
+        if response.status_code != 200 or not response_data.get('success'):
+            console.print("[yellow]imgbb failed, trying next image host")
+            return None
+        return response_data['data']['medium']['url'], response_data['data']['image']['url'], response_data['data']['url_viewer']
+
+    async def upload_ptscreens(self, image):
+        body = MultipartBody(files=[('source', image, 'file-upload[0]', False)])
+        response = await self._post("https://ptscreens.com/api/1/upload", body, headers={'X-API-Key': self.config['DEFAULT']['ptscreens_api']})
+        response_data = response.json()
+        if response_data.get('status_code') != 200:
+            console.print("[yellow]ptscreens failed, trying next image host")
+            return None
+        return response_data['image']['medium']['url'], response_data['image']['url'], response_data['image']['url_viewer']
+
+    async def upload_onlyimage(self, image):
+        body = MultipartBody(files=[('image', image, None, True)])
+        response = await self._post("https://onlyimage.org/api/1/upload", body, headers={'X-API-Key': self.config['DEFAULT']['onlyimage_api']})
+        response_data = response.json()
+        if response.status_code != 200 or not response_data.get('success'):
+            console.print("[yellow]OnlyImage failed, trying next image host")
+            return None
+        return response_data['data']['image']['url'], response_data['data']['image']['url'], response_data['data']['url_viewer']
+
+    async def upload_pixhost(self, image):
+        body = MultipartBody(
+            fields={'content_type': '0', 'max_th_size': 350},
+            files=[('img', image, 'file-upload[0]', False)],
+        )
+        response = await self._post("https://api.pixhost.to/images", body)
+        response_data = response.json()
+        if response.status_code != 200:
+            return None
+        raw_url = response_data['th_url'].replace('https://t', 'https://img').replace('/thumbs/', '/images/')
+        return response_data['th_url'], raw_url, response_data['show_url']
+
+    async def upload_lensdump(self, image):
+        body = MultipartBody(files=[('image', image, None, True)])
+        response = await self._post("https://lensdump.com/api/1/upload", body, headers={'X-API-Key': self.config['DEFAULT']['lensdump_api']})
+        response_data = response.json()
+        if response_data.get('status_code') != 200:
+            return None
+        return response_data['data']['image']['url'], response_data['data']['image']['url'], response_data['data']['url_viewer']
+
+    async def upload(self, image, img_host):
+        """
+        Uploads one image, and returns the status and URLs as a dict.
+        """
+        upload_to_host = getattr(self, f"upload_{img_host}", None)
+        if upload_to_host is None:
+            return {'status': 'failed', 'reason': f"Unsupported image host {img_host}"}
+        try:
+            urls = await upload_to_host(image)
+        except requests.exceptions.Timeout:
+            console.print("[red]Request timed out. The server took too long to respond.")
+            return {'status': 'failed', 'reason': 'Request timed out'}
+        except ValueError as e:  # JSON decoding error
+            console.print(f"[red]Invalid JSON response: {e}")
+            return {'status': 'failed', 'reason': 'Invalid JSON response'}
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]Request failed with error: {e}")
+            return {'status': 'failed', 'reason': str(e)}
+        except Exception as e:
+            return {'status': 'failed', 'reason': f"Error during {img_host} upload: {e}"}
+
+        if not urls:
+            return {'status': 'failed', 'reason': f"Failed to upload image to {img_host}. No URLs received."}
+        img_url, raw_url, web_url = urls
+        if self.meta['debug']:
+            console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
+        return {'status': 'success', 'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url, 'local_file_path': image}
+
+    async def upload_all(self, images, img_host, progress=None):
+        """
+        Uploads images to img_host, no more at once than the host allows, and
+        returns the results in the order they finished. progress is called with
+        each result.
+        """
+        limit = IMAGE_HOST_LIMITS.get(img_host, int(self.meta.get('task_limit', os.cpu_count())))
+        semaphore = asyncio.Semaphore(max(1, limit))
+        results = []
+
+        async def upload_one(image):
+            async with semaphore:
+                result = await self.upload(image, img_host)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+        await asyncio.gather(*(upload_one(image) for image in images))
+        return results
+
+    async def upload_with_fallback(self, images, img_host, img_host_num, fallback, progress=None, fallback_images=None):
+        """
+        Uploads images to img_host. With fallback, when fewer than the cutoff
+        make it, fallback_images (images by default) are uploaded to the next
+        configured image host instead.
+
+        progress is called with each image host tried and how many images it
+        gets, and returns the callback upload_all calls with that host's results.
+        Returns the image host used and its successful uploads, or None for the
+        uploads when there was no image host left to fall back to.
+        """
+        while True:
+            results = await self.upload_all(images, img_host, progress(img_host, len(images)) if progress else None)
+            successes = []
+            for result in results:
+                if result['status'] == 'success':
+                    successes.append(result)
+                else:
+                    console.print(f"[yellow]Failed to upload: {result.get('reason', 'Unknown error')}")
+
+            if not fallback or len(successes) >= self.meta.get('cutoff'):
+                return img_host, successes
+            img_host_num += 1
+            if f'img_host_{img_host_num}' not in self.config['DEFAULT']:
+                console.print("[red]No more image hosts available. Aborting upload process.")
+                return img_host, None
+            img_host = self.config['DEFAULT'][f'img_host_{img_host_num}']
+            console.print(f"[cyan]Switching to the next image host: {img_host}")
+            # The next host gets the whole set, whatever it uploads is kept
+            images = fallback_images or images
+            fallback = False
+
+
+def run_uploads(coro):
+    """
+    Runs coro to the end for synchronous code. A caller whose thread is already
+    running an event loop, like a tracker coroutine, gets a thread with a loop
+    of its own for it.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,100 @@
+import atexit
+import sys
+import threading
+import time
+
+# How many modules the breakdown lists, slowest first
+SHOWN_MODULES = 30
+
+
+class _TimedLoader():
+    """
+    Wraps a module's loader to time running the module's code.
+    """
+    def __init__(self, loader, profiler):
+        self.loader = loader
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Hand the module its real loader back, only the import itself is timed
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+        self.profiler.start(module.__name__)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profiler.stop()
+
+
+class ImportProfiler():
+    """
+    Times every module imported after it's installed, like python -X importtime.
+
+    It sits first on sys.meta_path, lets the other finders find each module, and
+    times the module's code as it runs. A module's own time leaves out the
+    modules it imported, its cumulative time includes them.
+    """
+    def __init__(self):
+        self.local = threading.local()
+        self.timings = {}
+
+    @property
+    def stack(self):
+        # Threads import at the same time, each has its own chain of imports
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def start(self, name):
+        self.stack.append([name, time.perf_counter(), 0.0])
+
+    def stop(self):
+        stack = self.stack
+        name, start, children = stack.pop()
+        cumulative = time.perf_counter() - start
+        self.timings[name] = (cumulative - children, cumulative)
+        if stack:
+            stack[-1][2] += cumulative
+
+    def print_breakdown(self):
+        from rich.table import Table
+        from src.console import console
+
+        table = Table(title="Import Profile", title_justify="left")
+        table.add_column("Module", style="bold cyan")
+        table.add_column("Self", justify="right")
+        table.add_column("Cumulative", justify="right")
+        slowest = sorted(self.timings.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (own, cumulative) in slowest[:SHOWN_MODULES]:
+            table.add_row(name, f"{own * 1000:.1f}ms", f"{cumulative * 1000:.1f}ms")
+        total = sum(own for own, _ in self.timings.values())
+        console.print(table)
+        console.print(f"[cyan]{len(self.timings)} modules imported in {total:.2f}s")
+
+
+def start_import_profile():
+    """
+    Starts timing imports, and prints the breakdown when the process exits.
+    """
+    profiler = ImportProfiler()
+    sys.meta_path.insert(0, profiler)
+    atexit.register(profiler.print_breakdown)
+    return profiler
@@ -0,0 +1,54 @@
+import importlib
+import importlib.util
+import threading
+
+
+class LazyImport():
+    """
+    Stands in for a module, or a name imported from one, until it's first used.
+
+    The module is only checked to exist up front, so a missing dependency is
+    still reported at startup, but it's imported the first time the stand-in
+    is called or one of its attributes is read or set. Processes that never
+    use it, like the screenshot workers, never pay for importing it.
+    """
+    def __init__(self, module, name=None):
+        top_level = module.partition('.')[0]
+        if importlib.util.find_spec(top_level) is None:
+            raise ModuleNotFoundError(f"No module named '{top_level}'", name=top_level)
+        object.__setattr__(self, '_module', module)
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_target', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _resolve(self):
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    target = importlib.import_module(self._module)
+                    if self._name is not None:
+                        target = getattr(target, self._name)
+                    object.__setattr__(self, '_target', target)
+        return target
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        target = self._module if self._name is None else f"{self._module}.{self._name}"
+        return f"<LazyImport {target}>"
+
+
+def lazy_import(module, name=None):
+    """
+    Returns a LazyImport of module, or of name from module.
+    """
+    return LazyImport(module, name)
@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+
+from pymediainfo import MediaInfo
+
+from src.console import console
+
+
+class FileMediaInfo():
+    """
+    MediaInfo of one file of a release, the text report the trackers show.
+    """
+    def __init__(self, path, text):
+        self.path = path
+        self.text = text
+
+
+class MediaInfoCache():
+    """
+    The MediaInfo of every file of one release, kept in MediaInfo_files.json in
+    its tmp dir.
+
+    A file is run through libmediainfo the first time any tracker asks for it,
+    and after that every tracker, and any later run on the same release, reads
+    the saved report. Entries are keyed by the file's path, size and mtime.
+    """
+    FILENAME = "MediaInfo_files.json"
+
+    def __init__(self, release_dir):
+        self.path = os.path.join(release_dir, self.FILENAME)
+        self.entries = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(path):
+        stat = os.stat(path)
+        return f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def _load(self):
+        if self.entries is None:
+            self.entries = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self.entries = json.load(f)
+                except (OSError, ValueError) as e:
+                    console.print(f"[yellow]Could not read the saved MediaInfo, it will be parsed again: {e}")
+        return self.entries
+
+    def _save(self):
+        try:
+            with open(f"{self.path}.tmp", 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(f"{self.path}.tmp", self.path)
+        except OSError as e:
+            console.print(f"[yellow]Could not save MediaInfo: {e}")
+
+    def add(self, path, text):
+        """
+        Saves MediaInfo that was already parsed, so it isn't parsed again.
+        """
+        key = self.key(path)
+        with self.lock:
+            self._load()[key] = {'text': text}
+            self._save()
+
+    def get(self, path):
+        """
+        Returns the FileMediaInfo of path, running libmediainfo only if it isn't saved yet.
+        """
+        key = self.key(path)
+        with self.lock:
+            text = self._load().get(key, {}).get('text')
+        if text is None:
+            text = MediaInfo.parse(path, output="STRING", full=False, mediainfo_options={'inform_version': '1'})
+            self.add(path, text)
+        return FileMediaInfo(path, text)
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_mediainfo_cache(base_dir, uuid):
+    """
+    Returns the MediaInfoCache of a release, creating it on first use.
+    """
+    release_dir = os.path.abspath(f"{base_dir}/tmp/{uuid}")
+    with _caches_lock:
+        if release_dir not in _caches:
+            _caches[release_dir] = MediaInfoCache(release_dir)
+        return _caches[release_dir]
+
+
+def get_file_mediainfo(meta, path):
+    """
+    Returns the FileMediaInfo of one file of the release in meta.
+    """
+    return get_mediainfo_cache(meta['base_dir'], meta['uuid']).get(path)
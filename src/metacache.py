@@ -0,0 +1,144 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from src.console import console
+
+# With --refresh-meta, anything cached before this run started is treated as stale
+_run_started = time.time()
+
+
+class MetadataCache():
+    """
+    SQLite backed cache for the TMDb/IMDb/TVmaze/AniList lookups made during prep.
+
+    Entries are keyed by provider, endpoint and the ID/query that was looked up,
+    expire after a per-provider TTL, and the least recently used entries are
+    evicted once the cache grows past max_entries.
+    """
+    # Hours an entry stays valid, per provider
+    DEFAULT_TTLS = {
+        'tmdb': 168,
+        'imdb': 168,
+        'tvmaze': 24,
+        'anilist': 168,
+    }
+
+    def __init__(self, config, base_dir=None):
+        default = config['DEFAULT']
+        if base_dir is None:
+            base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        self.path = os.path.join(base_dir, "tmp", "metadata_cache.db")
+        self.enabled = str(default.get('metadata_cache', True)).lower() != "false"
+        self.max_entries = int(default.get('metadata_cache_size', 5000))
+        self.ttls = dict(self.DEFAULT_TTLS)
+        self.ttls.update(default.get('metadata_cache_ttl', {}))
+        self.refresh = False
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Prep gets pickled into the worker pools, the connection can't go with it
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    provider TEXT NOT NULL,
+                    endpoint TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    PRIMARY KEY (provider, endpoint, key)
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _key(key):
+        if isinstance(key, (list, tuple, dict)):
+            return json.dumps(key, sort_keys=True, default=str)
+        return str(key)
+
+    def get(self, provider, endpoint, key):
+        """
+        Returns (True, value) on a fresh hit, (False, None) otherwise.
+        """
+        if not self.enabled:
+            return False, None
+        key = self._key(key)
+        ttl = float(self.ttls.get(provider, 24)) * 3600
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, created FROM cache WHERE provider = ? AND endpoint = ? AND key = ?",
+                    (provider, endpoint, key)
+                ).fetchone()
+                if row is None:
+                    return False, None
+                if self.refresh and row[1] < _run_started:
+                    return False, None
+                if now - row[1] > ttl:
+                    conn.execute("DELETE FROM cache WHERE provider = ? AND endpoint = ? AND key = ?", (provider, endpoint, key))
+                    conn.commit()
+                    return False, None
+                conn.execute(
+                    "UPDATE cache SET accessed = ? WHERE provider = ? AND endpoint = ? AND key = ?",
+                    (now, provider, endpoint, key)
+                )
+                conn.commit()
+            return True, json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            console.print(f"[yellow]Metadata cache read failed: {e}")
+            return False, None
+
+    def set(self, provider, endpoint, key, value):
+        if not self.enabled:
+            return
+        key = self._key(key)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (provider, endpoint, key, value, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                    (provider, endpoint, key, json.dumps(value, default=str), now, now)
+                )
+                count = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+                if count > self.max_entries:
+                    conn.execute(
+                        "DELETE FROM cache WHERE rowid IN (SELECT rowid FROM cache ORDER BY accessed ASC LIMIT ?)",
+                        (count - self.max_entries,)
+                    )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            console.print(f"[yellow]Metadata cache write failed: {e}")
+
+    def fetch(self, provider, endpoint, key, func):
+        """
+        Returns the cached value, or calls func() and caches what it returns.
+        Exceptions from func() are not cached and propagate to the caller.
+        """
+        hit, value = self.get(provider, endpoint, key)
+        if hit:
+            return value
+        value = func()
+        self.set(provider, endpoint, key, value)
+        return value
@@ -0,0 +1,219 @@
+import asyncio
+import threading
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Requests per second for hosts with a known limit, http_rate_limits in the config adds to or overrides these
+DEFAULT_RATE_LIMITS = {
+    'passthepopcorn.me': 1,
+}
+# Statuses that mean "slow down", retried after the site's Retry-After or an exponential backoff
+RETRY_STATUSES = (429, 503)
+# A 503 may come from a request the site did act on, so only retry it for methods that are safe to repeat
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+BACKOFF_BASE = 1
+BACKOFF_MAX = 60
+
+
+class TokenBucket():
+    """
+    Spaces requests to one host at most rate per second.
+
+    reserve() books the next free slot and returns how long the caller has to
+    wait for it, so waiting callers line up instead of all waking at once.
+    pause() holds every slot back, e.g. for a Retry-After.
+    """
+    def __init__(self, rate=None):
+        self.interval = 1 / float(rate) if rate else 0.0
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+            return slot - now
+
+    def pause(self, seconds):
+        with self.lock:
+            self.next_slot = max(self.next_slot, time.monotonic() + seconds)
+
+
+class HostRateLimiter():
+    """
+    One TokenBucket per host. Hosts without a configured rate aren't spaced out,
+    but are still held back by pause().
+    """
+    def __init__(self, limits):
+        self.limits = {host.lower(): float(rate) for host, rate in limits.items() if rate}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, host):
+        host = host.lower()
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.limits.get(host))
+            return self.buckets[host]
+
+
+def retry_after(response):
+    """
+    Returns the seconds a Retry-After header asks for, None without a usable one.
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that waits for the host's rate limit before each request, and
+    retries 429 and 503 responses, after Retry-After when the site sends one and
+    an exponential backoff when it doesn't. The wait holds back every other
+    request to that host too.
+    """
+    def __init__(self, limiter, retries=3, **kwargs):
+        self.limiter = limiter
+        self.retries = retries
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        bucket = self.limiter.bucket(urlparse(request.url).netloc)
+        attempt = 0
+        while True:
+            time.sleep(bucket.reserve())
+            response = super().send(request, **kwargs)
+            if (response.status_code not in RETRY_STATUSES or attempt >= self.retries
+                    or (response.status_code == 503 and request.method not in IDEMPOTENT_METHODS)):
+                return response
+            delay = retry_after(response)
+            if delay is None:
+                delay = BACKOFF_BASE * 2 ** attempt
+            bucket.pause(min(delay, BACKOFF_MAX))
+            response.close()
+            # A streamed body was used up by the first attempt
+            if hasattr(request.body, 'seek'):
+                request.body.seek(0)
+            attempt += 1
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(config):
+    """
+    Returns the HostRateLimiter shared by every session in the process, creating it on first use.
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            rate_limits = dict(DEFAULT_RATE_LIMITS)
+            rate_limits.update(config.get('DEFAULT', {}).get('http_rate_limits', {}))
+            _rate_limiter = HostRateLimiter(rate_limits)
+        return _rate_limiter
+
+
+def rate_limited_adapter(config, **kwargs):
+    """
+    Returns a RateLimitedAdapter on the shared limiter, to mount on a requests.Session.
+    """
+    retries = max(0, int(config.get('DEFAULT', {}).get('http_retries', 3)))
+    return RateLimitedAdapter(get_rate_limiter(config), retries=retries, **kwargs)
+
+
+class HTTPClient():
+    """
+    Process wide HTTP client shared by the tracker modules.
+
+    Wraps a single pooled requests.Session, so connections are kept alive and
+    reused between calls, and runs each request on a worker thread so the event
+    loop keeps going while a request is in flight. The number of requests open
+    against a single host at the same time is capped, and every request gets a
+    default timeout unless the caller passes its own. Requests and the time
+    spent on them are counted per host, for the release trace.
+
+    Requests go through a RateLimitedAdapter, so a host with a rate limit in
+    http_rate_limits is never asked more often than that, and a site that
+    answers 429 or 503 is given time before the request is retried.
+    """
+    def __init__(self, config):
+        self.config = config
+        default = config.get('DEFAULT', {})
+        self.timeout = float(default.get('http_timeout', 60))
+        self.connections_per_host = max(1, int(default.get('http_connections_per_host', 4)))
+        self.session = requests.Session()
+        adapter = rate_limited_adapter(config, pool_connections=64, pool_maxsize=self.connections_per_host)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._host_limits = weakref.WeakKeyDictionary()
+        self.stats = {}
+        self.stats_lock = threading.Lock()
+
+    def _host_limit(self, host):
+        # Semaphores belong to the loop they were first used on, and image uploads run on a loop of their own
+        host_limits = self._host_limits.setdefault(asyncio.get_running_loop(), {})
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(self.connections_per_host)
+        return host_limits[host]
+
+    async def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlparse(url).netloc.lower()
+        async with self._host_limit(host):
+            start = time.perf_counter()
+            try:
+                return await asyncio.to_thread(self.session.request, method, url, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self.stats_lock:
+                    requests_made, seconds = self.stats.get(host, (0, 0.0))
+                    self.stats[host] = (requests_made + 1, seconds + elapsed)
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client(config):
+    """
+    Returns the HTTPClient shared by the whole process, creating it on first use.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HTTPClient(config)
+        return _http_client
+
+
+def http_request_stats():
+    """
+    Returns {host: (requests, seconds)} for the requests the shared HTTPClient has made so far.
+    """
+    with _http_client_lock:
+        client = _http_client
+    if client is None:
+        return {}
+    with client.stats_lock:
+        return dict(client.stats)
@@ -0,0 +1,207 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from src.console import console
+
+# Files are read in blocks of whole pieces, at least this large
+READ_SIZE = 16 * 1024 * 1024
+# How often the partial hashes of a file are saved, so a crash doesn't lose them all
+CHECKPOINT_INTERVAL = 30
+
+
+class PieceCache():
+    """
+    SQLite backed cache of piece hashes, one entry per file.
+
+    Entries are keyed by the file's path, size, mtime, the piece size and where
+    the file starts inside its first piece. Only the pieces that lie entirely
+    inside the file are stored, since those don't depend on the files around it.
+    Incomplete entries hold the hashes of the first pieces of the file, so an
+    interrupted run can carry on from there.
+    """
+    def __init__(self, config, base_dir=None):
+        default = config['DEFAULT']
+        if base_dir is None:
+            base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        self.path = os.path.join(base_dir, "tmp", "piece_cache.db")
+        self.enabled = str(default.get('piece_cache', True)).lower() != "false"
+        self.max_entries = int(default.get('piece_cache_size', 2000))
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pieces (
+                    key TEXT PRIMARY KEY,
+                    hashes BLOB NOT NULL,
+                    complete INTEGER NOT NULL,
+                    accessed REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS pieces_accessed ON pieces (accessed)")
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def key(filepath, size, mtime, piece_size, offset):
+        return f"{os.path.abspath(filepath)}|{size}|{mtime}|{piece_size}|{offset}"
+
+    def get(self, key):
+        """
+        Returns (hashes, complete), hashes being the concatenated digests that are cached.
+        """
+        if not self.enabled:
+            return b"", False
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT hashes, complete FROM pieces WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return b"", False
+                conn.execute("UPDATE pieces SET accessed = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+            return bytes(row[0]), bool(row[1])
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Piece cache read failed: {e}")
+            return b"", False
+
+    def set(self, key, hashes, complete):
+        if not self.enabled:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO pieces (key, hashes, complete, accessed) VALUES (?, ?, ?, ?)",
+                    (key, sqlite3.Binary(hashes), int(complete), time.time())
+                )
+                count = conn.execute("SELECT COUNT(*) FROM pieces").fetchone()[0]
+                if count > self.max_entries:
+                    conn.execute(
+                        "DELETE FROM pieces WHERE rowid IN (SELECT rowid FROM pieces ORDER BY accessed ASC LIMIT ?)",
+                        (count - self.max_entries,)
+                    )
+                conn.commit()
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Piece cache write failed: {e}")
+
+
+class PieceHasher():
+    """
+    Hashes the pieces of a torrent.
+
+    Files are read one after another in large blocks of whole pieces, and the
+    blocks are hashed on a thread pool while the next one is read. Pieces that
+    lie entirely inside one file are looked up in, and saved to, the PieceCache.
+    Pieces that span two files are always hashed, there is at most one per file.
+    """
+    def __init__(self, cache, threads=None, callback=None, interval=1):
+        self.cache = cache
+        self.threads = max(1, int(threads or os.cpu_count() or 1))
+        self.callback = callback
+        self.interval = interval
+        self.bytes_total = 0
+        self.bytes_done = 0
+        self.bytes_read = 0
+        self.pieces_cached = 0
+        self._last_report = 0
+
+    def hash(self, files, piece_size):
+        """
+        files is a list of (filepath, size) in torrent order.
+        Returns the concatenated SHA1 digests of every piece.
+        """
+        self.bytes_total = sum(size for _, size in files)
+        pieces = []
+        pending = bytearray()  # Start of a piece that carries on into the next file
+        torrent_offset = 0
+
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            for filepath, size in files:
+                offset = torrent_offset % piece_size
+                head = min((piece_size - offset) % piece_size, size)
+                inner_count = (size - head) // piece_size
+                tail = size - head - inner_count * piece_size
+
+                with open(filepath, 'rb') as f:
+                    if head:
+                        pending += f.read(head)
+                        self._advance(head, read=True)
+                        if len(pending) == piece_size:
+                            pieces.append(hashlib.sha1(pending).digest())
+                            pending = bytearray()
+                    if inner_count:
+                        pieces.append(self._hash_inner(pool, f, filepath, size, piece_size, offset, head, inner_count))
+                    if tail:
+                        f.seek(head + inner_count * piece_size)
+                        pending += f.read(tail)
+                        self._advance(tail, read=True)
+                torrent_offset += size
+
+        if pending:
+            pieces.append(hashlib.sha1(pending).digest())
+        self._report(force=True)
+        return b"".join(pieces)
+
+    def _hash_inner(self, pool, f, filepath, size, piece_size, offset, start, count):
+        key = self.cache.key(filepath, size, os.stat(filepath).st_mtime_ns, piece_size, offset)
+        cached, complete = self.cache.get(key)
+        cached_count = min(len(cached) // 20, count)
+        cached = cached[:cached_count * 20]
+        self.pieces_cached += cached_count
+        self._advance(cached_count * piece_size)
+        if complete and cached_count == count:
+            return cached
+
+        hashes = [cached]
+        f.seek(start + cached_count * piece_size)
+        pieces_per_read = max(1, READ_SIZE // piece_size)
+        in_flight = deque()
+        remaining = count - cached_count
+        last_checkpoint = time.monotonic()
+        while remaining or in_flight:
+            while remaining and len(in_flight) < self.threads * 2:
+                wanted = min(remaining, pieces_per_read) * piece_size
+                block = f.read(wanted)
+                if len(block) < wanted:
+                    # The file is shorter than when the torrent's file list was made
+                    raise OSError(f"{filepath} ended {wanted - len(block)} bytes early while hashing, it may have been truncated or changed")
+                self.bytes_read += len(block)
+                in_flight.append((pool.submit(self._hash_block, block, piece_size), len(block)))
+                remaining -= len(block) // piece_size
+            future, length = in_flight.popleft()
+            hashes.append(future.result())
+            self._advance(length)
+            if time.monotonic() - last_checkpoint > CHECKPOINT_INTERVAL:
+                self.cache.set(key, b"".join(hashes), False)
+                last_checkpoint = time.monotonic()
+
+        hashes = b"".join(hashes)
+        self.cache.set(key, hashes, True)
+        return hashes
+
+    @staticmethod
+    def _hash_block(block, piece_size):
+        view = memoryview(block)
+        return b"".join(hashlib.sha1(view[i:i + piece_size]).digest() for i in range(0, len(view), piece_size))
+
+    def _advance(self, length, read=False):
+        self.bytes_done += length
+        if read:
+            self.bytes_read += length
+        self._report()
+
+    def _report(self, force=False):
+        now = time.monotonic()
+        if self.callback is None or (not force and now - self._last_report < self.interval):
+            return
+        self._last_report = now
+        self.callback(self.bytes_done, self.bytes_total, self.bytes_read)
@@ -2,29 +2,30 @@
 from src.args import Args
 from src.console import console
 from src.exceptions import *  # noqa: F403
-from src.trackers.PTP import PTP  # noqa F401
-from src.trackers.BLU import BLU  # noqa F401
-from src.trackers.AITHER import AITHER  # noqa F401
-from src.trackers.LST import LST  # noqa F401
-from src.trackers.OE import OE  # noqa F401
-from src.trackers.HDB import HDB  # noqa F401
-from src.trackers.TIK import TIK  # noqa F401
 from src.trackers.COMMON import COMMON
+from src.trackerregistry import tracker_class_map
 from src.clients import Clients
+from src.metacache import MetadataCache
+from src.mediainfocache import get_mediainfo_cache
+from src.piecehash import PieceHasher, PieceCache
+from src.workers import get_worker_pool
+from src.lazyimport import lazy_import
+from src.network import get_http_client
+from src.imageupload import ImageUploader, run_uploads
+from src.tracing import get_trace, span, traced
 from data.config import config
 
 try:
     import traceback
     from src.discparse import DiscParse
     import multiprocessing
-    from multiprocessing import get_context
     from tqdm import tqdm
     import os
     import re
     import math
     from str2bool import str2bool
     import asyncio
-    from guessit import guessit
+    guessit = lazy_import('guessit', 'guessit')
     import ntpath
     from pathlib import Path
     import urllib
@@ -34,26 +35,26 @@ try:
     import json
     import glob
     import requests
-    import pyimgbox
     from pymediainfo import MediaInfo
-    import tmdbsimple as tmdb
+    tmdb = lazy_import('tmdbsimple')
     from datetime import datetime
     from difflib import SequenceMatcher
     import torf
     from torf import Torrent
-    import base64
     import time
-    import anitopy
+    anitopy = lazy_import('anitopy')
     import shutil
-    from imdbinfo import get_movie, search_title
+    get_movie = lazy_import('imdbinfo', 'get_movie')
+    search_title = lazy_import('imdbinfo', 'search_title')
     import itertools
+    import copy
     import cli_ui
     from rich.progress import Progress, TextColumn, BarColumn, TimeRemainingColumn  # noqa F401
+    from rich.table import Table
     import platform
-    import aiohttp
-    from PIL import Image
+    aiohttp = lazy_import('aiohttp')
+    Image = lazy_import('PIL.Image')
     import io
-    from io import BytesIO
     import sys
 except ModuleNotFoundError:
     console.print(traceback.print_exc())
@@ -63,6 +64,9 @@ except ModuleNotFoundError:
 except KeyboardInterrupt:
     exit()
 
+# Enough of an image for PIL to read the header of a PNG or JPEG
+IMAGE_HEADER_BYTES = 65536
+
 
 class Prep():
     """
@@ -76,7 +80,10 @@ class Prep():
         self.screens = screens
         self.config = config
         self.img_host = img_host.lower()
+        self.meta_cache = MetadataCache(config)
         tmdb.API_KEY = config['DEFAULT']['tmdb_api']
+        # TMDb requests share the rate limited session, so a 429 is waited out and retried
+        tmdb.REQUESTS_SESSION = get_http_client(config).session
 
     async def prompt_user_for_confirmation(self, message: str) -> bool:
         try:
@@ -131,51 +138,43 @@ class Prep():
                 image_dict['web_url'] = img_url
 
             # Verify the image link
-            if await self.check_image_link(img_url):
-                # Check if the image is hosted on an approved image host
-                if not any(host in img_url for host in approved_image_hosts):
-                    nonlocal invalid_host_found
-                    invalid_host_found = True  # Mark that we found an invalid host
-
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(img_url) as response:
-                        if response.status == 200:
-                            image_content = await response.read()
-
-                            try:
-                                image = Image.open(BytesIO(image_content))
-                                vertical_resolution = image.height
-                                lower_bound = expected_vertical_resolution * 0.70  # 30% below
-                                if meta['is_disc'] == "DVD":
-                                    upper_bound = expected_vertical_resolution * 1.30
-                                else:
-                                    upper_bound = expected_vertical_resolution * 1.00
-
-                                if not (lower_bound <= vertical_resolution <= upper_bound):
-                                    console.print(
-                                        f"[red]Image {img_url} resolution ({vertical_resolution}p) "
-                                        f"is outside the allowed range ({int(lower_bound)}-{int(upper_bound)}p). Skipping.[/red]"
-                                    )
-                                    return None
-
-                                meta['image_sizes'][img_url] = len(image_content)
-                                console.print(
-                                    f"Valid image {img_url} with resolution {image.width}x{image.height} "
-                                    f"and size {len(image_content) / 1024:.2f} KiB"
-                                )
-                            except Exception as e:
-                                console.print(f"[red]Failed to process image {img_url}: {e}")
-                                return None
-                        else:
-                            console.print(f"[red]Failed to fetch image {img_url}. Skipping.")
+            async with limit:
+                image_info = await self.check_image_link(img_url, session)
+            if image_info is None:
+                return None
+
+            # Check if the image is hosted on an approved image host
+            if not any(host in img_url for host in approved_image_hosts):
+                nonlocal invalid_host_found
+                invalid_host_found = True  # Mark that we found an invalid host
 
-                return image_dict
+            width, vertical_resolution, image_size = image_info
+            lower_bound = expected_vertical_resolution * 0.70  # 30% below
+            if meta['is_disc'] == "DVD":
+                upper_bound = expected_vertical_resolution * 1.30
             else:
+                upper_bound = expected_vertical_resolution * 1.00
+
+            if not (lower_bound <= vertical_resolution <= upper_bound):
+                console.print(
+                    f"[red]Image {img_url} resolution ({vertical_resolution}p) "
+                    f"is outside the allowed range ({int(lower_bound)}-{int(upper_bound)}p). Skipping.[/red]"
+                )
                 return None
 
+            meta['image_sizes'][img_url] = image_size
+            console.print(
+                f"Valid image {img_url} with resolution {width}x{vertical_resolution} "
+                f"and size {image_size / 1024:.2f} KiB"
+            )
+            return image_dict
+
         # Run image verification concurrently
-        tasks = [check_and_collect(image_dict) for image_dict in imagelist]
-        results = await asyncio.gather(*tasks)
+        # One session for all the images, so connections to the same host are reused
+        limit = asyncio.Semaphore(8)
+        async with aiohttp.ClientSession() as session:
+            tasks = [check_and_collect(image_dict) for image_dict in imagelist]
+            results = await asyncio.gather(*tasks)
 
         # Collect valid images
         valid_images = [image for image in results if image is not None]
@@ -200,32 +199,51 @@ class Prep():
 
         return valid_images
 
-    async def check_image_link(self, url):
-        async with aiohttp.ClientSession() as session:
+    async def check_image_link(self, url, session):
+        """
+        Returns (width, height, size in bytes) of a linked image, None if it can't be used.
+        Only the start of the image is fetched and its header read, hosts that ignore
+        the Range header send the whole image, which is then verified in full.
+        """
+        try:
+            async with session.get(url, headers={'Range': f"bytes=0-{IMAGE_HEADER_BYTES - 1}"}) as response:
+                if response.status not in (200, 206):
+                    console.print(f"[red]Failed to retrieve image: {url} (status code: {response.status})[/red]")
+                    return None
+                content_type = response.headers.get('Content-Type', '').lower()
+                if 'image' not in content_type:
+                    console.print(f"[red]Content type is not an image: {url}[/red]")
+                    return None
+                image_data = await response.read()
+                # Content-Range: bytes 0-65535/<full size>
+                image_size = response.headers.get('Content-Range', '').rpartition('/')[2]
+                partial = response.status == 206 and image_size.isdigit() and int(image_size) > len(image_data)
+
+            if partial:
+                try:
+                    image = Image.open(io.BytesIO(image_data))
+                    console.print(f"[green]Image verified successfully: {url}[/green]")
+                    return image.width, image.height, int(image_size)
+                except (IOError, SyntaxError):
+                    # The header doesn't fit in the first block, get the whole image after all
+                    async with session.get(url) as response:
+                        if response.status != 200:
+                            console.print(f"[red]Failed to retrieve image: {url} (status code: {response.status})[/red]")
+                            return None
+                        image_data = await response.read()
+
             try:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get('Content-Type', '').lower()
-                        if 'image' in content_type:
-                            # Attempt to load the image
-                            image_data = await response.read()
-                            try:
-                                image = Image.open(io.BytesIO(image_data))
-                                image.verify()  # This will check if the image is broken
-                                console.print(f"[green]Image verified successfully: {url}[/green]")
-                                return True
-                            except (IOError, SyntaxError) as e:  # noqa #F841
-                                console.print(f"[red]Image verification failed (corrupt image): {url}[/red]")
-                                return False
-                        else:
-                            console.print(f"[red]Content type is not an image: {url}[/red]")
-                            return False
-                    else:
-                        console.print(f"[red]Failed to retrieve image: {url} (status code: {response.status})[/red]")
-                        return False
-            except Exception as e:
-                console.print(f"[red]Exception occurred while checking image: {url} - {str(e)}[/red]")
-                return False
+                image = Image.open(io.BytesIO(image_data))
+                width, height = image.size
+                image.verify()  # This will check if the image is broken
+                console.print(f"[green]Image verified successfully: {url}[/green]")
+                return width, height, len(image_data)
+            except (IOError, SyntaxError) as e:  # noqa #F841
+                console.print(f"[red]Image verification failed (corrupt image): {url}[/red]")
+                return None
+        except Exception as e:
+            console.print(f"[red]Exception occurred while checking image: {url} - {str(e)}[/red]")
+            return None
 
     async def update_meta_with_unit3d_data(self, meta, tracker_data, tracker_name):
         # Unpack the expected 9 elements, ignoring any additional ones
@@ -401,6 +419,78 @@ class Prep():
 
         return meta, found_match
 
+    async def probe_trackers_concurrently(self, tracker_order, meta, search_term, search_file_folder):
+        """
+        Search every tracker at once, each on its own copy of meta, and keep the
+        highest priority match. Lower priority searches still running are cancelled
+        as soon as a tracker ahead of them in tracker_order has matched.
+        """
+        results = {}
+
+        async def probe(tracker_name):
+            tracker_class = tracker_class_map.get(tracker_name)
+            if tracker_class is None:
+                print(f"Tracker class for {tracker_name} not found.")
+                return None
+            tracker_meta = copy.deepcopy(meta)
+            start_time = time.perf_counter()
+            try:
+                tracker_meta, match = await self.update_metadata_from_tracker(
+                    tracker_name, tracker_class(config=self.config), tracker_meta, search_term, search_file_folder
+                )
+                results[tracker_name] = ("Match" if match else "No match", time.perf_counter() - start_time)
+                return tracker_meta if match else None
+            except asyncio.CancelledError:
+                results[tracker_name] = ("Cancelled", time.perf_counter() - start_time)
+                raise
+            except aiohttp.ClientSSLError:
+                print(f"{tracker_name} tracker request failed due to SSL error.")
+                results[tracker_name] = ("Failed (SSL error)", time.perf_counter() - start_time)
+            except requests.exceptions.ConnectionError as conn_err:
+                print(f"{tracker_name} tracker request failed due to connection error: {conn_err}")
+                results[tracker_name] = ("Failed (connection error)", time.perf_counter() - start_time)
+            return None
+
+        tasks = {tracker_name: asyncio.create_task(probe(tracker_name)) for tracker_name in tracker_order}
+        matched_meta = None
+        try:
+            for index, tracker_name in enumerate(tracker_order):
+                matched_meta = await tasks[tracker_name]
+                if matched_meta is not None:
+                    console.print(f"[green]Match found on tracker: {tracker_name}[/green]")
+                    for straggler in tracker_order[index + 1:]:
+                        tasks[straggler].cancel()
+                    break
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        self.print_tracker_reuse_summary(tracker_order, results)
+        if matched_meta is None:
+            return meta, False
+
+        # The searches all share DESCRIPTION.txt, so put back the one from the match we kept
+        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'w', newline="", encoding='utf8') as description:
+            description.write((matched_meta.get('description') or "") + "\n")
+        return matched_meta, True
+
+    def print_tracker_reuse_summary(self, tracker_order, results):
+        table = Table(title="Tracker Search Summary", title_justify="left")
+        table.add_column("Tracker", style="bold cyan")
+        table.add_column("Result")
+        table.add_column("Time", justify="right")
+        for tracker_name in tracker_order:
+            status, elapsed = results.get(tracker_name, ("Not run", 0))
+            if status == "Match":
+                status = f"[green]{status}"
+            elif status.startswith("Failed"):
+                status = f"[red]{status}"
+            else:
+                status = f"[yellow]{status}"
+            table.add_row(tracker_name, status, f"{elapsed:.1f}s")
+        console.print(table)
+
     async def handle_image_list(self, meta, tracker_name):
         if meta.get('image_list'):
             console.print(f"[cyan]Found the following images from {tracker_name}:")
@@ -424,27 +514,31 @@ class Prep():
         if int(task_limit) > 0:
             meta['task_limit'] = task_limit
         meta['mode'] = mode
+        self.meta_cache.refresh = meta.get('refresh_meta', False)
         base_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
         meta['isdir'] = os.path.isdir(meta['path'])
         base_dir = meta['base_dir']
         meta['saved_description'] = False
+        timings = {}
+        prep_start = time.perf_counter()
 
         if meta.get('uuid', None) is None:
             folder_id = os.path.basename(meta['path'])
             meta['uuid'] = folder_id
         if not os.path.exists(f"{base_dir}/tmp/{meta['uuid']}"):
             Path(f"{base_dir}/tmp/{meta['uuid']}").mkdir(parents=True, exist_ok=True)
+        trace = get_trace(base_dir, meta['uuid'])
 
         if meta['debug']:
             console.print(f"[cyan]ID: {meta['uuid']}")
 
-        meta['is_disc'], videoloc, bdinfo, meta['discs'] = await self.get_disc(meta)
+        meta['is_disc'], videoloc, bdinfo, meta['discs'] = await self._timed(trace, timings, "Disc scan", self.get_disc(meta))
 
         # Debugging information
         # console.print(f"Debug: meta['filelist'] before population: {meta.get('filelist', 'Not Set')}")
 
         if meta['is_disc'] == "BDMV":
-            video, meta['scene'], meta['imdb'] = self.is_scene(meta['path'], meta, meta.get('imdb', None))
+            video, meta['scene'], meta['imdb'] = await self._timed(trace, timings, "srrdb", asyncio.to_thread(self.is_scene, meta['path'], meta, meta.get('imdb', None)))
             meta['filelist'] = []  # No filelist for discs, use path
             search_term = os.path.basename(meta['path'])
             search_file_folder = 'folder'
@@ -472,7 +566,16 @@ class Prep():
             mi = None
 
         elif meta['is_disc'] == "DVD":
-            video, meta['scene'], meta['imdb'] = self.is_scene(meta['path'], meta, meta.get('imdb', None))
+            # srrdb and mediainfo don't depend on each other
+            if not meta.get('edit', False):
+                mi_stage = asyncio.to_thread(self.exportInfo, f"{meta['discs'][0]['path']}/VTS_{meta['discs'][0]['main_set'][0][:2]}_1.VOB", False, meta['uuid'], meta['base_dir'], export_text=False)
+            else:
+                mi_stage = asyncio.sleep(0, result=meta['mediainfo'])
+            (video, meta['scene'], meta['imdb']), mi = await asyncio.gather(
+                self._timed(trace, timings, "srrdb", asyncio.to_thread(self.is_scene, meta['path'], meta, meta.get('imdb', None))),
+                self._timed(trace, timings, "MediaInfo", mi_stage)
+            )
+            meta['mediainfo'] = mi
             meta['filelist'] = []
             search_term = os.path.basename(meta['path'])
             search_file_folder = 'folder'
@@ -483,18 +586,21 @@ class Prep():
                 meta['search_year'] = guessit(meta['discs'][0]['path'])['year']
             except Exception:
                 meta['search_year'] = ""
-            if not meta.get('edit', False):
-                mi = self.exportInfo(f"{meta['discs'][0]['path']}/VTS_{meta['discs'][0]['main_set'][0][:2]}_1.VOB", False, meta['uuid'], meta['base_dir'], export_text=False)
-                meta['mediainfo'] = mi
-            else:
-                mi = meta['mediainfo']
 
             meta['dvd_size'] = await self.get_dvd_size(meta['discs'], meta.get('manual_dvds'))
             meta['resolution'] = self.get_resolution(guessit(video), meta['uuid'], base_dir)
             meta['sd'] = self.is_sd(meta['resolution'])
 
         elif meta['is_disc'] == "HDDVD":
-            video, meta['scene'], meta['imdb'] = self.is_scene(meta['path'], meta, meta.get('imdb', None))
+            if not meta.get('edit', False):
+                mi_stage = asyncio.to_thread(self.exportInfo, meta['discs'][0]['largest_evo'], False, meta['uuid'], meta['base_dir'], export_text=False)
+            else:
+                mi_stage = asyncio.sleep(0, result=meta['mediainfo'])
+            (video, meta['scene'], meta['imdb']), mi = await asyncio.gather(
+                self._timed(trace, timings, "srrdb", asyncio.to_thread(self.is_scene, meta['path'], meta, meta.get('imdb', None))),
+                self._timed(trace, timings, "MediaInfo", mi_stage)
+            )
+            meta['mediainfo'] = mi
             meta['filelist'] = []
             search_term = os.path.basename(meta['path'])
             search_file_folder = 'folder'
@@ -506,11 +612,6 @@ class Prep():
                 meta['search_year'] = guessit(meta['discs'][0]['path'])['year']
             except Exception:
                 meta['search_year'] = ""
-            if not meta.get('edit', False):
-                mi = self.exportInfo(meta['discs'][0]['largest_evo'], False, meta['uuid'], meta['base_dir'], export_text=False)
-                meta['mediainfo'] = mi
-            else:
-                mi = meta['mediainfo']
             meta['resolution'] = self.get_resolution(guessit(video), meta['uuid'], base_dir)
             meta['sd'] = self.is_sd(meta['resolution'])
 
@@ -518,7 +619,15 @@ class Prep():
             videopath, meta['filelist'] = self.get_video(videoloc, meta.get('mode', 'discord'))
             search_term = os.path.basename(meta['filelist'][0]) if meta['filelist'] else None
             search_file_folder = 'file'
-            video, meta['scene'], meta['imdb'] = self.is_scene(videopath, meta, meta.get('imdb', None))
+            if not meta.get('edit', False):
+                mi_stage = asyncio.to_thread(self.exportInfo, videopath, meta['isdir'], meta['uuid'], base_dir, export_text=True)
+            else:
+                mi_stage = asyncio.sleep(0, result=meta['mediainfo'])
+            (video, meta['scene'], meta['imdb']), mi = await asyncio.gather(
+                self._timed(trace, timings, "srrdb", asyncio.to_thread(self.is_scene, videopath, meta, meta.get('imdb', None))),
+                self._timed(trace, timings, "MediaInfo", mi_stage)
+            )
+            meta['mediainfo'] = mi
             guess_name = ntpath.basename(video).replace('-', ' ')
             filename = guessit(re.sub(r"[^0-9a-zA-Z\[\\]]+", " ", guess_name), {"excludes": ["country", "language"]}).get("title", guessit(re.sub("[^0-9a-zA-Z]+", " ", guess_name), {"excludes": ["country", "language"]})["title"])
             untouched_filename = os.path.basename(video)
@@ -527,12 +636,6 @@ class Prep():
             except Exception:
                 meta['search_year'] = ""
 
-            if not meta.get('edit', False):
-                mi = self.exportInfo(videopath, meta['isdir'], meta['uuid'], base_dir, export_text=True)
-                meta['mediainfo'] = mi
-            else:
-                mi = meta['mediainfo']
-
             if meta.get('resolution', None) is None:
                 meta['resolution'] = self.get_resolution(guessit(video), meta['uuid'], base_dir)
             meta['sd'] = self.is_sd(meta['resolution'])
@@ -559,6 +662,7 @@ class Prep():
         if meta.get('infohash') is not None:
             meta = await client.get_ptp_from_hash(meta)
 
+        reuse_start = time.perf_counter()
         if not meta.get('image_list'):
             # Reuse information from trackers with fallback
             found_match = False
@@ -578,7 +682,7 @@ class Prep():
 
                 async def process_tracker(tracker_name, meta):
                     nonlocal found_match
-                    tracker_class = globals().get(tracker_name)
+                    tracker_class = tracker_class_map.get(tracker_name)
                     if tracker_class is None:
                         print(f"Tracker class for {tracker_name} not found.")
                         return meta
@@ -605,11 +709,16 @@ class Prep():
                     # Process all trackers with API = true if no specific tracker is set in meta
                     tracker_order = ["PTP", "BLU", "AITHER", "LST", "OE", "TIK", "HDB"]
 
-                    for tracker_name in tracker_order:
-                        if not found_match:  # Stop checking once a match is found
-                            tracker_config = self.config['TRACKERS'].get(tracker_name, {})
-                            if str(tracker_config.get('useAPI', 'false')).lower() == "true":
-                                meta = await process_tracker(tracker_name, meta)
+                    if meta['unattended'] and self.config['DEFAULT'].get('parallel_tracker_reuse', False):
+                        api_trackers = [tracker_name for tracker_name in tracker_order
+                                        if str(self.config['TRACKERS'].get(tracker_name, {}).get('useAPI', 'false')).lower() == "true"]
+                        meta, found_match = await self.probe_trackers_concurrently(api_trackers, meta, search_term, search_file_folder)
+                    else:
+                        for tracker_name in tracker_order:
+                            if not found_match:  # Stop checking once a match is found
+                                tracker_config = self.config['TRACKERS'].get(tracker_name, {})
+                                if str(tracker_config.get('useAPI', 'false')).lower() == "true":
+                                    meta = await process_tracker(tracker_name, meta)
 
                 if not found_match:
                     console.print("[yellow]No matches found on any trackers.[/yellow]")
@@ -617,78 +726,81 @@ class Prep():
                 console.print("[yellow]Warning: No valid search term available, skipping tracker updates.[/yellow]")
         else:
             console.print("Skipping existing search as meta already populated")
+        reuse_end = time.perf_counter()
+        timings["Tracker reuse"] = reuse_end - reuse_start
+        trace.add("Tracker reuse", reuse_start, reuse_end)
 
         if 'manual_frames' not in meta:
             meta['manual_frames'] = {}
         manual_frames = meta['manual_frames']
-        # Take Screenshots
-        if meta['is_disc'] == "BDMV":
-            if meta.get('edit', False) is False:
-                if meta.get('vapoursynth', False) is True:
-                    use_vs = True
-                else:
-                    use_vs = False
-                try:
-                    ds = multiprocessing.Process(target=self.disc_screenshots, args=(meta, filename, bdinfo, meta['uuid'], base_dir, use_vs, meta.get('image_list', []), meta.get('ffdebug', False), None))
-                    ds.start()
-                    while ds.is_alive() is True:
-                        await asyncio.sleep(1)
-                except KeyboardInterrupt:
-                    ds.terminate()
-        elif meta['is_disc'] == "DVD":
-            if meta.get('edit', False) is False:
-                try:
-                    ds = multiprocessing.Process(target=self.dvd_screenshots, args=(meta, 0, None, None))
-                    ds.start()
-                    while ds.is_alive() is True:
-                        await asyncio.sleep(1)
-                except KeyboardInterrupt:
-                    ds.terminate()
-        else:
-            if meta.get('edit', False) is False:
-                try:
-                    s = multiprocessing.Process(
-                        target=self.screenshots,
-                        args=(videopath, filename, meta['uuid'], base_dir, meta),  # Positional arguments
-                        kwargs={'manual_frames': manual_frames}  # Keyword argument
-                    )
-                    s.start()
-                    while s.is_alive() is True:
-                        await asyncio.sleep(3)
-                except KeyboardInterrupt:
-                    s.terminate()
 
-        meta['tmdb'] = meta.get('tmdb_manual', None)
-        meta['type'] = self.get_type(video, meta['scene'], meta['is_disc'], meta)
-        if meta.get('category', None) is None:
-            meta['category'] = self.get_cat(video)
-        else:
-            meta['category'] = meta['category'].upper()
-        if meta.get('tmdb', None) is None and meta.get('imdb', None) is None:
-            meta['category'], meta['tmdb'], meta['imdb'] = self.get_tmdb_imdb_from_mediainfo(mi, meta['category'], meta['is_disc'], meta['tmdb'], meta['imdb'])
-        if meta.get('tmdb', None) is None and meta.get('imdb', None) is None:
-            meta = await self.get_tmdb_id(filename, meta['search_year'], meta, meta['category'], untouched_filename)
-        elif meta.get('imdb', None) is not None and meta.get('tmdb_manual', None) is None:
-            meta['imdb_id'] = str(meta['imdb']).replace('tt', '')
-            meta = await self.get_tmdb_from_imdb(meta, filename)
-        else:
-            meta['tmdb_manual'] = meta.get('tmdb', None)
+        # Screenshots run on a thread, so the database lookups can happen while they are taken.
+        # They get a copy of meta, the image_list of local files they build isn't the release's
+        async def take_screenshots():
+            if meta['is_disc'] == "BDMV":
+                if meta.get('edit', False) is False:
+                    if meta.get('vapoursynth', False) is True:
+                        use_vs = True
+                    else:
+                        use_vs = False
+                    await asyncio.to_thread(self.disc_screenshots, copy.deepcopy(meta), filename, bdinfo, meta['uuid'], base_dir, use_vs, meta.get('image_list', []), meta.get('ffdebug', False), None)
+            elif meta['is_disc'] == "DVD":
+                if meta.get('edit', False) is False:
+                    await asyncio.to_thread(self.dvd_screenshots, copy.deepcopy(meta), 0, None, None)
+            else:
+                if meta.get('edit', False) is False:
+                    await asyncio.to_thread(self.screenshots, videopath, filename, meta['uuid'], base_dir, copy.deepcopy(meta), manual_frames=manual_frames)
+
+        async def gather_ids():
+            nonlocal meta
+            meta['tmdb'] = meta.get('tmdb_manual', None)
+            meta['type'] = self.get_type(video, meta['scene'], meta['is_disc'], meta)
+            if meta.get('category', None) is None:
+                meta['category'] = self.get_cat(video)
+            else:
+                meta['category'] = meta['category'].upper()
+            if meta.get('tmdb', None) is None and meta.get('imdb', None) is None:
+                meta['category'], meta['tmdb'], meta['imdb'] = self.get_tmdb_imdb_from_mediainfo(mi, meta['category'], meta['is_disc'], meta['tmdb'], meta['imdb'])
+            if meta.get('tmdb', None) is None and meta.get('imdb', None) is None:
+                meta = await self._timed(trace, timings, "TMDb search", self.get_tmdb_id(filename, meta['search_year'], meta, meta['category'], untouched_filename))
+            elif meta.get('imdb', None) is not None and meta.get('tmdb_manual', None) is None:
+                meta['imdb_id'] = str(meta['imdb']).replace('tt', '')
+                meta = await self._timed(trace, timings, "TMDb from IMDb", self.get_tmdb_from_imdb(meta, filename))
+            else:
+                meta['tmdb_manual'] = meta.get('tmdb', None)
+
+            # If no tmdb, use imdb for meta
+            if int(meta['tmdb']) == 0:
+                meta = await self._timed(trace, timings, "IMDb details", self.imdb_other_meta(meta))
+            else:
+                meta = await self._timed(trace, timings, "TMDb details", self.tmdb_other_meta(meta))
+
+            # TVmaze and the IMDb details only need the IDs found above, so look them up together
+            # Search tvmaze (TVmaze indexes TV only, so a movie can only ever get a false match)
+            lookups = {}
+            if meta['category'] == "TV":
+                lookups['tvmaze'] = self._timed(trace, timings, "TVmaze", self.search_tvmaze(filename, meta['search_year'], meta.get('imdb_id', '0'), meta.get('tvdb_id', 0), meta))
+            else:
+                meta['tvmaze_id'] = 0
+            if meta.get('imdb_id', None) is not None and meta.get('imdb_info', None) is None and int(meta['imdb_id']) != 0:
+                lookups['imdb_info'] = self._timed(trace, timings, "IMDb info", self.get_imdb_info(meta['imdb_id'], meta))
+            results = dict(zip(lookups, await asyncio.gather(*lookups.values())))
+            if 'tvmaze' in results:
+                meta['tvmaze_id'], meta['imdb_id'], meta['tvdb_id'] = results['tvmaze']
+            if 'imdb_info' in results:
+                meta['imdb_info'] = results['imdb_info']
+
+            # If no imdb, search for it
+            if meta.get('imdb_id', None) is None:
+                meta['imdb_id'] = await self._timed(trace, timings, "IMDb search", self.search_imdb(filename, meta['search_year']))
+            if meta.get('imdb_info', None) is None and int(meta['imdb_id']) != 0:
+                meta['imdb_info'] = await self._timed(trace, timings, "IMDb info", self.get_imdb_info(meta['imdb_id'], meta))
+
+        await asyncio.gather(
+            self._timed(trace, timings, "Screenshots", take_screenshots()),
+            self._timed(trace, timings, "Database IDs", gather_ids())
+        )
 
-        # If no tmdb, use imdb for meta
-        if int(meta['tmdb']) == 0:
-            meta = await self.imdb_other_meta(meta)
-        else:
-            meta = await self.tmdb_other_meta(meta)
-        # Search tvmaze (TVmaze indexes TV only, so a movie can only ever get a false match)
-        if meta['category'] == "TV":
-            meta['tvmaze_id'], meta['imdb_id'], meta['tvdb_id'] = await self.search_tvmaze(filename, meta['search_year'], meta.get('imdb_id', '0'), meta.get('tvdb_id', 0), meta)
-        else:
-            meta['tvmaze_id'] = 0
-        # If no imdb, search for it
-        if meta.get('imdb_id', None) is None:
-            meta['imdb_id'] = await self.search_imdb(filename, meta['search_year'])
-        if meta.get('imdb_info', None) is None and int(meta['imdb_id']) != 0:
-            meta['imdb_info'] = await self.get_imdb_info(meta['imdb_id'], meta)
         if meta.get('tag', None) is None:
             meta['tag'] = self.get_tag(video, meta)
         else:
@@ -743,9 +855,30 @@ class Prep():
         meta.get('anon', False)
         meta['anon'] = self.is_anon(meta['anon'])
         if meta['saved_description'] is False:
-            meta = await self.gen_desc(meta)
+            meta = await self._timed(trace, timings, "Description", self.gen_desc(meta))
+
+        trace.add("Prep", prep_start, time.perf_counter())
+        if meta['debug']:
+            self.print_timings(timings)
         return meta
 
+    async def _timed(self, trace, timings, name, awaitable):
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            end = time.perf_counter()
+            timings[name] = end - start
+            trace.add(name, start, end)
+
+    def print_timings(self, timings):
+        table = Table(title="Prep timings", title_justify="left")
+        table.add_column("Stage", style="cyan")
+        table.add_column("Time", justify="right")
+        for name, elapsed in timings.items():
+            table.add_row(name, f"{elapsed:.2f}s")
+        console.print(table)
+
     """
     Determine if disc and if so, get bdinfo
     """
@@ -838,6 +971,7 @@ class Prep():
     """
     Get and parse mediainfo
     """
+    @traced("MediaInfo export")
     def exportInfo(self, video, isdir, folder_id, base_dir, export_text):
         def filter_mediainfo(data):
             filtered = {
@@ -1008,13 +1142,12 @@ class Prep():
 
         if not os.path.exists(f"{base_dir}/tmp/{folder_id}/MEDIAINFO.txt") and export_text:
             console.print("[bold yellow]Exporting MediaInfo...")
-            if not isdir:
-                os.chdir(os.path.dirname(video))
             media_info = MediaInfo.parse(video, output="STRING", full=False, mediainfo_options={'inform_version': '1'})
             with open(f"{base_dir}/tmp/{folder_id}/MEDIAINFO.txt", 'w', newline="", encoding='utf-8') as export:
                 export.write(media_info)
             with open(f"{base_dir}/tmp/{folder_id}/MEDIAINFO_CLEANPATH.txt", 'w', newline="", encoding='utf-8') as export_cleanpath:
                 export_cleanpath.write(media_info.replace(video, os.path.basename(video)))
+            get_mediainfo_cache(base_dir, folder_id).add(video, media_info)
             console.print("[bold green]MediaInfo Exported.")
 
         if not os.path.exists(f"{base_dir}/tmp/{folder_id}/MediaInfo.json.txt"):
@@ -1148,7 +1281,7 @@ class Prep():
         url = f"https://api.srrdb.com/v1/search/r:{base}"
 
         try:
-            response = requests.get(url, timeout=30)
+            response = get_http_client(self.config).session.get(url, timeout=30)
             response_json = response.json()
 
             if int(response_json.get('resultsCount', 0)) > 0:
@@ -1172,7 +1305,7 @@ class Prep():
                         nfo_file_path = os.path.join(save_path, f"{release_lower}.nfo")
 
                         # Download the NFO file
-                        nfo_response = requests.get(nfo_url, timeout=30)
+                        nfo_response = get_http_client(self.config).session.get(nfo_url, timeout=30)
                         if nfo_response.status_code == 200:
                             with open(nfo_file_path, 'wb') as f:
                                 f.write(nfo_response.content)
@@ -1186,7 +1319,7 @@ class Prep():
 
                 # IMDb Handling
                 try:
-                    r = requests.get(f"https://api.srrdb.com/v1/imdb/{base}")
+                    r = get_http_client(self.config).session.get(f"https://api.srrdb.com/v1/imdb/{base}")
                     r = r.json()
 
                     if r['releases'] != [] and imdb is None:
@@ -1238,8 +1371,7 @@ class Prep():
 
         keyframe = 'nokey' if "VC-1" in bdinfo['video'][0]['codec'] or bdinfo['video'][0]['hdr_dv'] != "" else 'none'
 
-        os.chdir(f"{base_dir}/tmp/{folder_id}")
-        existing_screens = glob.glob(f"{sanitized_filename}-*.png")
+        existing_screens = glob.glob(os.path.join(glob.escape(f"{base_dir}/tmp/{folder_id}"), f"{sanitized_filename}-*.png"))
         total_existing = len(existing_screens) + len(existing_images)
         num_screens = max(0, self.screens - total_existing)
 
@@ -1275,20 +1407,20 @@ class Prep():
                 for i in range(num_screens + 1)
             ]
 
-            with get_context("spawn").Pool(processes=min(len(capture_tasks), task_limit)) as pool:
-                try:
-                    capture_results = list(
+            with span(meta, "Capture screenshots", cat="screenshots", screens=len(capture_tasks)):
+                capture_results = self.capture_single_pass(file, [(task[1], task[2]) for task in capture_tasks], keyframes_only=keyframe == 'nokey', debug=meta['debug'])
+                # Fall back to one ffmpeg process per frame for anything the single pass didn't capture
+                remaining_tasks = [task for task in capture_tasks if task[2] not in capture_results]
+                if remaining_tasks:
+                    capture_results += list(
                         tqdm(
-                            pool.imap_unordered(self.capture_disc_task, capture_tasks),
-                            total=len(capture_tasks),
+                            get_worker_pool(task_limit).imap_unordered(self.capture_disc_task, remaining_tasks),
+                            total=len(remaining_tasks),
                             desc="Capturing Screenshots",
                             ascii=" #",
                             dynamic_ncols=False
                         )
                     )
-                finally:
-                    pool.close()
-                    pool.join()
 
             if capture_results:
                 if len(capture_tasks) > num_screens:
@@ -1299,20 +1431,16 @@ class Prep():
                     capture_results.remove(smallest)
             optimized_results = []
             optimize_tasks = [(result, self.config) for result in capture_results if result and os.path.exists(result)]
-            with get_context("spawn").Pool(processes=min(len(optimize_tasks), task_limit)) as pool:
-                try:
-                    optimized_results = list(
-                        tqdm(
-                            pool.imap_unordered(self.optimize_image_task, optimize_tasks),
-                            total=len(optimize_tasks),
-                            desc="Optimizing Images",
-                            ascii=" #",
-                            dynamic_ncols=False
-                        )
+            with span(meta, "Optimize screenshots", cat="screenshots", screens=len(optimize_tasks)):
+                optimized_results = list(
+                    tqdm(
+                        get_worker_pool(task_limit).imap_unordered(self.optimize_image_task, optimize_tasks),
+                        total=len(optimize_tasks),
+                        desc="Optimizing Images",
+                        ascii=" #",
+                        dynamic_ncols=False
                     )
-                finally:
-                    pool.close()
-                    pool.join()
+                )
 
             valid_results = []
             for image_path in optimized_results:
@@ -1447,7 +1575,6 @@ class Prep():
             return fallback_duration, 0
 
         main_set = meta['discs'][disc_num]['main_set'][1:] if len(meta['discs'][disc_num]['main_set']) > 1 else meta['discs'][disc_num]['main_set']
-        os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
         voblength, n = _is_vob_good(0, 0, num_screens)
         ss_times = self.valid_ss_time([], num_screens + 1, voblength)
         tasks = []
@@ -1457,12 +1584,8 @@ class Prep():
             input_file = f"{meta['discs'][disc_num]['path']}/VTS_{main_set[i % len(main_set)]}"
             tasks.append((input_file, image, ss_times[i], meta, width, height, w_sar, h_sar))
 
-        with get_context("spawn").Pool(processes=min(num_screens + 1, task_limit)) as pool:
-            try:
-                results = list(tqdm(pool.imap_unordered(self.capture_dvd_screenshot, tasks), total=len(tasks), desc="Capturing Screenshots", ascii=" #", dynamic_ncols=False))
-            finally:
-                pool.close()
-                pool.join()
+        with span(meta, "Capture screenshots", cat="screenshots", screens=len(tasks)):
+            results = list(tqdm(get_worker_pool(task_limit).imap_unordered(self.capture_dvd_screenshot, tasks), total=len(tasks), desc="Capturing Screenshots", ascii=" #", dynamic_ncols=False))
 
         if len(glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}/", f"{meta['discs'][disc_num]['name']}-*")) > num_screens:
             smallest = None
@@ -1485,20 +1608,16 @@ class Prep():
 
         optimize_tasks = [(image, self.config) for image in results if image and os.path.exists(image)]
 
-        with get_context("spawn").Pool(processes=min(len(optimize_tasks), task_limit)) as pool:
-            try:
-                optimize_results = list(  # noqa F841
-                    tqdm(
-                        pool.imap_unordered(self.optimize_image_task, optimize_tasks),
-                        total=len(optimize_tasks),
-                        desc="Optimizing Images",
-                        ascii=" #",
-                        dynamic_ncols=False
-                    )
+        with span(meta, "Optimize screenshots", cat="screenshots", screens=len(optimize_tasks)):
+            optimize_results = list(  # noqa F841
+                tqdm(
+                    get_worker_pool(task_limit).imap_unordered(self.optimize_image_task, optimize_tasks),
+                    total=len(optimize_tasks),
+                    desc="Optimizing Images",
+                    ascii=" #",
+                    dynamic_ncols=False
                 )
-            finally:
-                pool.close()
-                pool.join()
+            )
 
         valid_results = []
         retry_attempts = 3
@@ -1634,7 +1753,6 @@ class Prep():
             return
 
         loglevel = 'verbose' if meta.get('ffdebug', False) else 'quiet'
-        os.chdir(f"{base_dir}/tmp/{folder_id}")
 
         # The capture loop below reads num_screens + 1 times
         ss_times = [int(frame) / frame_rate for frame in manual_frames] if manual_frames else []
@@ -1663,26 +1781,23 @@ class Prep():
             if not capture_tasks:
                 console.print("[yellow]All screenshots already exist. Skipping capture process.")
             else:
-                if use_tqdm():
-                    with tqdm(total=len(capture_tasks), desc="Capturing Screenshots", ascii=" #", dynamic_ncols=False) as pbar:
-                        with get_context("spawn").Pool(processes=min(len(capture_tasks), task_limit)) as pool:
-                            try:
-                                for result in pool.imap_unordered(self.capture_screenshot, capture_tasks):
-                                    capture_results.append(result)
-                                    pbar.update(1)
-                            finally:
-                                pool.close()
-                                pool.join()
-                else:
-                    console.print("[blue]Non-TTY environment detected. Progress bar disabled.")
-                    with get_context("spawn").Pool(processes=min(len(capture_tasks), task_limit)) as pool:
-                        try:
-                            for i, result in enumerate(pool.imap_unordered(self.capture_screenshot, capture_tasks), 1):
+                size = None
+                if w_sar != 1 or h_sar != 1:
+                    size = (int(round(width * w_sar)), int(round(height * h_sar)))
+                with span(meta, "Capture screenshots", cat="screenshots", screens=len(capture_tasks)):
+                    capture_results = self.capture_single_pass(path, [(task[1], task[2]) for task in capture_tasks], size=size, debug=meta['debug'])
+                    # Fall back to one ffmpeg process per frame for anything the single pass didn't capture
+                    remaining_tasks = [task for task in capture_tasks if task[2] not in capture_results]
+                    if remaining_tasks and use_tqdm():
+                        with tqdm(total=len(remaining_tasks), desc="Capturing Screenshots", ascii=" #", dynamic_ncols=False) as pbar:
+                            for result in get_worker_pool(task_limit).imap_unordered(self.capture_screenshot, remaining_tasks):
                                 capture_results.append(result)
-                                console.print(f"Processed {i}/{len(capture_tasks)} screenshots")
-                        finally:
-                            pool.close()
-                            pool.join()
+                                pbar.update(1)
+                    elif remaining_tasks:
+                        console.print("[blue]Non-TTY environment detected. Progress bar disabled.")
+                        for i, result in enumerate(get_worker_pool(task_limit).imap_unordered(self.capture_screenshot, remaining_tasks), 1):
+                            capture_results.append(result)
+                            console.print(f"Processed {i}/{len(remaining_tasks)} screenshots")
 
                 if capture_results and (len(capture_results) + existing_images) > num_screens and not force_screenshots:
                     smallest = min(capture_results, key=os.path.getsize)
@@ -1694,25 +1809,16 @@ class Prep():
         optimize_tasks = [(result, self.config) for result in capture_results if "Error" not in result]
         optimize_results = []
         if optimize_tasks:
-            if use_tqdm():
-                with tqdm(total=len(optimize_tasks), desc="Optimizing Images", ascii=" #", dynamic_ncols=False) as pbar:
-                    with get_context("spawn").Pool(processes=min(len(optimize_tasks), task_limit)) as pool:
-                        try:
-                            for result in pool.imap_unordered(self.optimize_image_task, optimize_tasks):
-                                optimize_results.append(result)
-                                pbar.update(1)
-                        finally:
-                            pool.close()
-                            pool.join()
-            else:
-                with get_context("spawn").Pool(processes=min(len(optimize_tasks), task_limit)) as pool:
-                    try:
-                        for i, result in enumerate(pool.imap_unordered(self.optimize_image_task, optimize_tasks), 1):
+            with span(meta, "Optimize screenshots", cat="screenshots", screens=len(optimize_tasks)):
+                if use_tqdm():
+                    with tqdm(total=len(optimize_tasks), desc="Optimizing Images", ascii=" #", dynamic_ncols=False) as pbar:
+                        for result in get_worker_pool(task_limit).imap_unordered(self.optimize_image_task, optimize_tasks):
                             optimize_results.append(result)
-                            console.print(f"Optimized {i}/{len(optimize_tasks)} images")
-                    finally:
-                        pool.close()
-                        pool.join()
+                            pbar.update(1)
+                else:
+                    for i, result in enumerate(get_worker_pool(task_limit).imap_unordered(self.optimize_image_task, optimize_tasks), 1):
+                        optimize_results.append(result)
+                        console.print(f"Optimized {i}/{len(optimize_tasks)} images")
 
         valid_results = []
         for image_path in optimize_results:
@@ -1813,6 +1919,47 @@ class Prep():
         except Exception as e:
             return f"Error: {str(e)}"
 
+    def capture_single_pass(self, path, captures, size=None, keyframes_only=False, debug=False):
+        """
+        Capture every (ss_time, image_path) in captures from one open of path, seeking
+        forward through the file in time order with a single decoder.
+        Returns the image paths that were written. Anything missing, including everything
+        when PyAV isn't installed, is left for the per-frame ffmpeg capture.
+        """
+        try:
+            import av
+        except ImportError:
+            if debug:
+                console.print("[yellow]PyAV is not installed, capturing each screenshot with its own ffmpeg process")
+            return []
+
+        captured = []
+        try:
+            with av.open(path) as container:
+                stream = container.streams.video[0]
+                stream.thread_type = "AUTO"
+                if keyframes_only:
+                    stream.codec_context.skip_frame = "NONKEY"
+                start = stream.start_time or 0
+                for ss_time, image_path in sorted(captures):
+                    target = start + int(ss_time / stream.time_base)
+                    container.seek(target, stream=stream)
+                    for frame in container.decode(stream):
+                        # A keyframe is as close as a VC-1/DV disc gets, like ffmpeg's skip_frame
+                        if keyframes_only or frame.pts is None or frame.pts >= target:
+                            break
+                    else:
+                        continue
+                    if size:
+                        image = frame.to_image(width=size[0], height=size[1], interpolation="BICUBIC")
+                    else:
+                        image = frame.to_image()
+                    image.save(image_path)
+                    captured.append(image_path)
+        except Exception as e:
+            console.print(f"[yellow]Single pass capture stopped, capturing the rest frame by frame: {e}")
+        return captured
+
     def optimize_image_task(self, args):
         image, config = args
         try:
@@ -1885,8 +2032,7 @@ class Prep():
         imdb_id = meta['imdb']
         if str(imdb_id)[:2].lower() != "tt":
             imdb_id = f"tt{imdb_id}"
-        find = tmdb.Find(id=imdb_id)
-        info = find.info(external_source="imdb_id")
+        info = await asyncio.to_thread(self.meta_cache.fetch, 'tmdb', 'find', imdb_id, lambda: tmdb.Find(id=imdb_id).info(external_source="imdb_id"))
         if len(info['movie_results']) >= 1:
             meta['category'] = "MOVIE"
             meta['tmdb'] = info['movie_results'][0]['id']
@@ -1909,28 +2055,23 @@ class Prep():
                     tmdb_id = console.input("Please enter tmdb id: ")
                     parser = Args(config=self.config)
                     meta['category'], meta['tmdb'] = parser.parse_tmdb_id(id=tmdb_id, category=meta.get('category'))
-        await asyncio.sleep(2)
         return meta
 
     async def get_tmdb_id(self, filename, search_year, meta, category, untouched_filename="", attempted=0):
-        search = tmdb.Search()
         try:
             if category == "MOVIE":
-                search.movie(query=filename, year=search_year)
+                results = await asyncio.to_thread(self.tmdb_search, category, query=filename, year=search_year)
             elif category == "TV":
-                search.tv(query=filename, first_air_date_year=search_year)
+                results = await asyncio.to_thread(self.tmdb_search, category, query=filename, first_air_date_year=search_year)
             if meta.get('tmdb_manual') is not None:
                 meta['tmdb'] = meta['tmdb_manual']
             else:
-                meta['tmdb'] = search.results[0]['id']
+                meta['tmdb'] = results[0]['id']
                 meta['category'] = category
         except IndexError:
             try:
-                if category == "MOVIE":
-                    search.movie(query=filename)
-                elif category == "TV":
-                    search.tv(query=filename)
-                meta['tmdb'] = search.results[0]['id']
+                results = await asyncio.to_thread(self.tmdb_search, category, query=filename)
+                meta['tmdb'] = results[0]['id']
                 meta['category'] = category
             except IndexError:
                 if category == "MOVIE":
@@ -1971,15 +2112,14 @@ class Prep():
                     console.print("[bold red]Unable to find tmdb entry")
                     return meta
         if meta['category'] == "MOVIE":
-            movie = tmdb.Movies(meta['tmdb'])
-            response = movie.info()
+            response = await asyncio.to_thread(self.tmdb_request, "MOVIE", meta['tmdb'], 'info')
             meta['title'] = response['title']
             if response['release_date']:
                 meta['year'] = datetime.strptime(response['release_date'], '%Y-%m-%d').year
             else:
                 console.print('[yellow]TMDB does not have a release date, using year from filename instead (if it exists)')
                 meta['year'] = meta['search_year']
-            external = movie.external_ids()
+            external, videos, keywords, credits = await self.tmdb_details("MOVIE", meta['tmdb'])
             if meta.get('imdb', None) is None:
                 imdb_id = external.get('imdb_id', "0")
                 if imdb_id == "" or imdb_id is None:
@@ -1995,14 +2135,13 @@ class Prep():
                     meta['tvdb_id'] = external.get('tvdb_id', '0')
                     if meta['tvdb_id'] in ["", None, " ", "None"]:
                         meta['tvdb_id'] = '0'
-            try:
-                videos = movie.videos()
+            if videos is None:
+                console.print('[yellow]Unable to grab videos from TMDb.')
+            else:
                 for each in videos.get('results', []):
                     if each.get('site', "") == 'YouTube' and each.get('type', "") == "Trailer":
                         meta['youtube'] = f"https://www.youtube.com/watch?v={each.get('key')}"
                         break
-            except Exception:
-                console.print('[yellow]Unable to grab videos from TMDb.')
 
             meta['aka'], original_language = await self.get_imdb_aka(meta['imdb_id'])
             if original_language is not None:
@@ -2011,11 +2150,11 @@ class Prep():
                 meta['original_language'] = response['original_language']
 
             meta['original_title'] = response.get('original_title', meta['title'])
-            meta['keywords'] = self.get_keywords(movie)
+            meta['keywords'] = self.get_keywords(keywords)
             meta['genres'] = self.get_genres(response)
-            meta['tmdb_directors'] = self.get_directors(movie)
+            meta['tmdb_directors'] = self.get_directors(credits)
             if meta.get('anime', False) is False:
-                meta['mal_id'], meta['aka'], meta['anime'] = self.get_anime(response, meta)
+                meta['mal_id'], meta['aka'], meta['anime'] = await asyncio.to_thread(self.get_anime, response, meta)
             if meta.get('mal') is not None:
                 meta['mal_id'] = meta['mal']
             meta['poster'] = response.get('poster_path', "")
@@ -2024,15 +2163,14 @@ class Prep():
             meta['tmdb_type'] = 'Movie'
             meta['runtime'] = response.get('episode_run_time', 60)
         elif meta['category'] == "TV":
-            tv = tmdb.TV(meta['tmdb'])
-            response = tv.info()
+            response = await asyncio.to_thread(self.tmdb_request, "TV", meta['tmdb'], 'info')
             meta['title'] = response['name']
             if response['first_air_date']:
                 meta['year'] = datetime.strptime(response['first_air_date'], '%Y-%m-%d').year
             else:
                 console.print('[yellow]TMDB does not have a release date, using year from filename instead (if it exists)')
                 meta['year'] = meta['search_year']
-            external = tv.external_ids()
+            external, videos, keywords, credits = await self.tmdb_details("TV", meta['tmdb'])
             if meta.get('imdb', None) is None:
                 imdb_id = external.get('imdb_id', "0")
                 if imdb_id == "" or imdb_id is None:
@@ -2048,14 +2186,13 @@ class Prep():
                     meta['tvdb_id'] = external.get('tvdb_id', '0')
                     if meta['tvdb_id'] in ["", None, " ", "None"]:
                         meta['tvdb_id'] = '0'
-            try:
-                videos = tv.videos()
+            if videos is None:
+                console.print('[yellow]Unable to grab videos from TMDb.')
+            else:
                 for each in videos.get('results', []):
                     if each.get('site', "") == 'YouTube' and each.get('type', "") == "Trailer":
                         meta['youtube'] = f"https://www.youtube.com/watch?v={each.get('key')}"
                         break
-            except Exception:
-                console.print('[yellow]Unable to grab videos from TMDb.')
 
             # meta['aka'] = f" AKA {response['original_name']}"
             meta['aka'], original_language = await self.get_imdb_aka(meta['imdb_id'])
@@ -2064,10 +2201,10 @@ class Prep():
             else:
                 meta['original_language'] = response['original_language']
             meta['original_title'] = response.get('original_name', meta['title'])
-            meta['keywords'] = self.get_keywords(tv)
+            meta['keywords'] = self.get_keywords(keywords)
             meta['genres'] = self.get_genres(response)
-            meta['tmdb_directors'] = self.get_directors(tv)
-            meta['mal_id'], meta['aka'], meta['anime'] = self.get_anime(response, meta)
+            meta['tmdb_directors'] = self.get_directors(credits)
+            meta['mal_id'], meta['aka'], meta['anime'] = await asyncio.to_thread(self.get_anime, response, meta)
             if meta.get('mal') is not None:
                 meta['mal_id'] = meta['mal']
             meta['poster'] = response.get('poster_path', '')
@@ -2089,9 +2226,46 @@ class Prep():
 
         return meta
 
-    def get_keywords(self, tmdb_info):
-        if tmdb_info is not None:
-            tmdb_keywords = tmdb_info.keywords()
+    async def tmdb_details(self, category, tmdb_id):
+        """
+        The external IDs, videos, keywords and credits of a TMDb entry, requested side by side.
+        videos is None when it couldn't be fetched, it only adds the trailer.
+        """
+        async def videos():
+            try:
+                return await asyncio.to_thread(self.tmdb_request, category, tmdb_id, 'videos')
+            except Exception:
+                return None
+        return await asyncio.gather(
+            asyncio.to_thread(self.tmdb_request, category, tmdb_id, 'external_ids'),
+            videos(),
+            asyncio.to_thread(self.tmdb_request, category, tmdb_id, 'keywords'),
+            asyncio.to_thread(self.tmdb_request, category, tmdb_id, 'credits'),
+        )
+
+    def tmdb_request(self, category, tmdb_id, endpoint):
+        """
+        Cached TMDb lookup, endpoint is the tmdbsimple method to call (info, external_ids, videos, keywords, credits)
+        """
+        def fetch():
+            item = tmdb.Movies(tmdb_id) if category == "MOVIE" else tmdb.TV(tmdb_id)
+            return getattr(item, endpoint)()
+        return self.meta_cache.fetch('tmdb', f"{category.lower()}/{endpoint}", tmdb_id, fetch)
+
+    def tmdb_search(self, category, **kwargs):
+        def fetch():
+            search = tmdb.Search()
+            if category == "MOVIE":
+                search.movie(**kwargs)
+            elif category == "TV":
+                search.tv(**kwargs)
+            else:
+                return []
+            return search.results
+        return self.meta_cache.fetch('tmdb', f"search/{str(category).lower()}", kwargs, fetch)
+
+    def get_keywords(self, tmdb_keywords):
+        if tmdb_keywords is not None:
             if tmdb_keywords.get('keywords') is not None:
                 keywords = [f"{keyword['name'].replace(',', ' ')}" for keyword in tmdb_keywords.get('keywords')]
             elif tmdb_keywords.get('results') is not None:
@@ -2109,9 +2283,8 @@ class Prep():
         else:
             return ''
 
-    def get_directors(self, tmdb_info):
-        if tmdb_info is not None:
-            tmdb_credits = tmdb_info.credits()
+    def get_directors(self, tmdb_credits):
+        if tmdb_credits is not None:
             directors = []
             if tmdb_credits.get('cast', []) != []:
                 for each in tmdb_credits['cast']:
@@ -2204,13 +2377,17 @@ class Prep():
 
         # Make the HTTP Api request
         url = 'https://graphql.anilist.co'
-        try:
-            response = requests.post(url, json={'query': query, 'variables': variables})
-            json = response.json()
-            media = json['data']['Page']['media']
-        except Exception:
-            console.print('[red]Failed to get anime specific info from anilist. Continuing without it...')
-            media = []
+        cache_key = {'mal': mal, 'search': variables['search']}
+        hit, media = self.meta_cache.get('anilist', 'media', cache_key)
+        if not hit:
+            try:
+                response = requests.post(url, json={'query': query, 'variables': variables})
+                json = response.json()
+                media = json['data']['Page']['media']
+                self.meta_cache.set('anilist', 'media', cache_key, media)
+            except Exception:
+                console.print('[red]Failed to get anime specific info from anilist. Continuing without it...')
+                media = []
         if media not in (None, []):
             result = {'title': {}}
             difference = 0
@@ -2899,6 +3076,7 @@ class Prep():
                 self.piece_size = self.calculate_piece_size(self._calculate_total_size(), self.piece_size_min, self.piece_size_max, self.files)
             self.metainfo['info']['piece length'] = self.piece_size  # Ensure 'piece length' is set
 
+    @traced("Create {output_filename}.torrent", cat="torrent")
     def create_torrent(self, meta, path, output_filename):
         # Handle directories and file inclusion logic
         if meta['isdir']:
@@ -2906,7 +3084,6 @@ class Prep():
                 cli_ui.info('--keep-folder was specified. Using complete folder for torrent creation.')
                 path = path
             else:
-                os.chdir(path)
                 globs = glob.glob1(path, "*.mkv") + glob.glob1(path, "*.mp4") + glob.glob1(path, "*.ts")
                 no_sample_globs = []
                 for file in globs:
@@ -2938,16 +3115,34 @@ class Prep():
         torrent.validate_piece_size()
 
         # Generate and write the new torrent
-        torrent.generate(callback=self.torf_cb, interval=5)
+        self.hash_torrent(torrent, meta)
         torrent.write(f"{meta['base_dir']}/tmp/{meta['uuid']}/{output_filename}.torrent", overwrite=True)
         torrent.verify_filesize(path)
 
         console.print("[bold green].torrent created", end="\r")
         return torrent
 
-    def torf_cb(self, torrent, filepath, pieces_done, pieces_total):
-        # print(f'{pieces_done/pieces_total*100:3.0f} % done')
-        cli_ui.info_progress("Hashing...", pieces_done, pieces_total)
+    def hash_torrent(self, torrent, meta):
+        info = torrent.metainfo['info']
+        if 'files' in info:
+            files = [(os.path.join(torrent.path, *each['path']), each['length']) for each in info['files']]
+        else:
+            files = [(str(torrent.path), info['length'])]
+        threads = self.config['DEFAULT'].get('hash_threads') or meta.get('task_limit') or os.cpu_count()
+        hasher = PieceHasher(PieceCache(self.config, meta['base_dir']), threads=threads, callback=self.hash_cb)
+        self._hash_started = time.perf_counter()
+        info['pieces'] = hasher.hash(files, torrent.piece_size)
+
+        elapsed = time.perf_counter() - self._hash_started
+        speed = hasher.bytes_read / elapsed / 1048576 if elapsed else 0
+        console.print(f"[cyan]Hashed {hasher.bytes_total / 1073741824:.2f} GiB in {elapsed:.1f}s, read {hasher.bytes_read / 1073741824:.2f} GiB at {speed:.0f} MiB/s")
+        if hasher.pieces_cached:
+            console.print(f"[cyan]{hasher.pieces_cached} of {torrent.pieces} pieces were reused from the piece cache")
+
+    def hash_cb(self, bytes_done, bytes_total, bytes_read):
+        elapsed = time.perf_counter() - self._hash_started
+        speed = bytes_read / elapsed / 1048576 if elapsed else 0
+        cli_ui.info_progress(f"Hashing... {speed:.0f} MiB/s", bytes_done, bytes_total)
 
     def create_random_torrents(self, base_dir, uuid, num, path):
         manual_name = re.sub(r"[^0-9a-zA-Z\[\]\'\-]+", ".", os.path.basename(path))
@@ -2977,212 +3172,7 @@ class Prep():
     """
     Upload Screenshots
     """
-    def upload_image_task(self, args):
-        image, img_host, config, meta = args
-        try:
-            timeout = 60  # Default timeout
-            img_url, raw_url, web_url = None, None, None
-
-            if img_host == "imgbox":
-                try:
-                    # Call the asynchronous imgbox_upload function
-                    loop = asyncio.get_event_loop()
-                    image_list = loop.run_until_complete(
-                        self.imgbox_upload(os.getcwd(), [image], meta, return_dict={})
-                    )
-                    if image_list and all(
-                        'img_url' in img and 'raw_url' in img and 'web_url' in img for img in image_list
-                    ):
-                        img_url = image_list[0]['img_url']
-                        raw_url = image_list[0]['raw_url']
-                        web_url = image_list[0]['web_url']
-                    else:
-                        return {
-                            'status': 'failed',
-                            'reason': "Imgbox upload failed. No valid URLs returned."
-                        }
-                except Exception as e:
-                    return {
-                        'status': 'failed',
-                        'reason': f"Error during Imgbox upload: {str(e)}"
-                    }
-
-            elif img_host == "ptpimg":
-                payload = {
-                    'format': 'json',
-                    'api_key': config['DEFAULT']['ptpimg_api']
-                }
-                files = [('file-upload[0]', open(image, 'rb'))]
-                headers = {'referer': 'https://ptpimg.me/index.php'}
-                response = requests.post(
-                    "https://ptpimg.me/upload.php", headers=headers, data=payload, files=files, timeout=timeout
-                )
-                response_data = response.json()
-                if response_data:
-                    code = response_data[0]['code']
-                    ext = response_data[0]['ext']
-                    img_url = f"https://ptpimg.me/{code}.{ext}"
-                    raw_url = img_url
-                    web_url = img_url
-
-            elif img_host == "imgbb":
-                url = "https://api.imgbb.com/1/upload"
-                try:
-                    with open(image, "rb") as img_file:
-                        encoded_image = base64.b64encode(img_file.read()).decode('utf8')
-
-                    data = {
-                        'key': config['DEFAULT']['imgbb_api'],
-                        'image': encoded_image,
-                    }
-
-                    response = requests.post(url, data=data, timeout=timeout)
-
-                    if meta['debug']:
-                        console.print(f"[yellow]Response status code: {response.status_code}")
-                        console.print(f"[yellow]Response content: {response.content.decode('utf-8')}")
-
-                    response_data = response.json()
-                    if response.status_code != 200 or not response_data.get('success'):
-                        console.print("[yellow]imgbb failed, trying next image host")
-                        return {'status': 'failed', 'reason': 'imgbb upload failed'}
-
-                    img_url = response_data['data']['medium']['url']
-                    raw_url = response_data['data']['image']['url']
-                    web_url = response_data['data']['url_viewer']
-
-                    if meta['debug']:
-                        console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
-
-                    return {'status': 'success', 'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url}
-
-                except requests.exceptions.Timeout:
-                    console.print("[red]Request timed out. The server took too long to respond.")
-                    return {'status': 'failed', 'reason': 'Request timed out'}
-
-                except ValueError as e:  # JSON decoding error
-                    console.print(f"[red]Invalid JSON response: {e}")
-                    return {'status': 'failed', 'reason': 'Invalid JSON response'}
-
-                except requests.exceptions.RequestException as e:
-                    console.print(f"[red]Request failed with error: {e}")
-                    return {'status': 'failed', 'reason': str(e)}
-
-            elif img_host == "ptscreens":
-                url = "https://ptscreens.com/api/1/upload"
-                try:
-                    files = {
-                        'source': ('file-upload[0]', open(image, 'rb')),
-                    }
-                    headers = {
-                        'X-API-Key': config['DEFAULT']['ptscreens_api']
-                    }
-                    response = requests.post(url, headers=headers, files=files, timeout=timeout)
-                    if meta['debug']:
-                        console.print(f"[yellow]Response status code: {response.status_code}")
-                        console.print(f"[yellow]Response content: {response.content.decode('utf-8')}")
-
-                    response_data = response.json()
-                    if response_data.get('status_code') != 200:
-                        console.print("[yellow]ptscreens failed, trying next image host")
-                        return {'status': 'failed', 'reason': 'ptscreens upload failed'}
-
-                    img_url = response_data['image']['medium']['url']
-                    raw_url = response_data['image']['url']
-                    web_url = response_data['image']['url_viewer']
-                    if meta['debug']:
-                        console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
-
-                except requests.exceptions.Timeout:
-                    console.print("[red]Request timed out. The server took too long to respond.")
-                    return {'status': 'failed', 'reason': 'Request timed out'}
-                except requests.exceptions.RequestException as e:
-                    console.print(f"[red]Request failed with error: {e}")
-                    return {'status': 'failed', 'reason': str(e)}
-
-            elif img_host == "onlyimage":
-                url = "https://onlyimage.org/api/1/upload"
-                try:
-                    data = {
-                        'image': base64.b64encode(open(image, "rb").read()).decode('utf8')
-                    }
-                    headers = {
-                        'X-API-Key': self.config['DEFAULT']['onlyimage_api'],
-                    }
-                    response = requests.post(url, data=data, headers=headers, timeout=timeout)
-                    if meta['debug']:
-                        console.print(f"[yellow]Response status code: {response.status_code}")
-                        console.print(f"[yellow]Response content: {response.content.decode('utf-8')}")
-
-                    response_data = response.json()
-                    if response.status_code != 200 or not response_data.get('success'):
-                        console.print("[yellow]OnlyImage failed, trying next image host")
-                        return {'status': 'failed', 'reason': 'OnlyImage upload failed'}
-
-                    img_url = response_data['data']['image']['url']
-                    raw_url = response_data['data']['image']['url']
-                    web_url = response_data['data']['url_viewer']
-                    if meta['debug']:
-                        console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
-
-                except requests.exceptions.Timeout:
-                    console.print("[red]Request timed out. The server took too long to respond.")
-                    return {'status': 'failed', 'reason': 'Request timed out'}
-                except requests.exceptions.RequestException as e:
-                    console.print(f"[red]Request failed with error: {e}")
-                    return {'status': 'failed', 'reason': str(e)}
-
-            elif img_host == "pixhost":
-                url = "https://api.pixhost.to/images"
-                data = {
-                    'content_type': '0',
-                    'max_th_size': 350
-                }
-                files = {
-                    'img': ('file-upload[0]', open(image, 'rb'))
-                }
-                response = requests.post(url, data=data, files=files, timeout=timeout)
-                response_data = response.json()
-                if response.status_code == 200:
-                    raw_url = response_data['th_url'].replace('https://t', 'https://img').replace('/thumbs/', '/images/')
-                    img_url = response_data['th_url']
-                    web_url = response_data['show_url']
-
-            elif img_host == "lensdump":
-                url = "https://lensdump.com/api/1/upload"
-                data = {
-                    'image': base64.b64encode(open(image, "rb").read()).decode('utf8')
-                }
-                headers = {
-                    'X-API-Key': config['DEFAULT']['lensdump_api']
-                }
-                response = requests.post(url, data=data, headers=headers, timeout=timeout)
-                response_data = response.json()
-                if response_data.get('status_code') == 200:
-                    img_url = response_data['data']['image']['url']
-                    raw_url = response_data['data']['image']['url']
-                    web_url = response_data['data']['url_viewer']
-
-            if img_url and raw_url and web_url:
-                return {
-                    'status': 'success',
-                    'img_url': img_url,
-                    'raw_url': raw_url,
-                    'web_url': web_url,
-                    'local_file_path': image
-                }
-            else:
-                return {
-                    'status': 'failed',
-                    'reason': f"Failed to upload image to {img_host}. No URLs received."
-                }
-
-        except Exception as e:
-            return {
-                'status': 'failed',
-                'reason': str(e)
-            }
-
+    @traced("Upload screenshots", cat="images")
     def upload_screens(self, meta, screens, img_host_num, i, total_screens, custom_img_list, return_dict, retry_mode=False, max_retries=3):
         def use_tqdm():
             """Check if the environment supports TTY (interactive progress bar)."""
@@ -3191,9 +3181,6 @@ class Prep():
         if meta['debug']:
             upload_start_time = time.time()
 
-        import nest_asyncio
-        nest_asyncio.apply()
-        os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
         initial_img_host = self.config['DEFAULT'][f'img_host_{img_host_num}']
         img_host = meta['imghost']
         using_custom_img_list = isinstance(custom_img_list, list) and bool(custom_img_list)
@@ -3206,7 +3193,7 @@ class Prep():
             existing_images = []
             existing_count = 0
         else:
-            image_glob = glob.glob("*.png")
+            image_glob = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", "*.png")
             if 'POSTER.png' in image_glob:
                 image_glob.remove('POSTER.png')
             image_glob = list(set(image_glob))
@@ -3225,60 +3212,36 @@ class Prep():
             console.print(f"[yellow]Skipping upload because enough images are already uploaded to {img_host}. Existing images: {existing_count}, Required: {total_screens}")
             return meta['image_list'], total_screens
 
-        upload_tasks = [(image, img_host, self.config, meta) for image in image_glob[:images_needed]]
+        image_paths = [os.path.join(meta['base_dir'], "tmp", meta['uuid'], image) for image in image_glob]
+        fallback = not retry_mode and img_host == initial_img_host and not using_custom_img_list
 
-        host_limits = {
-            "onlyimage": 6,
-            "ptscreens": 1,
-            "lensdump": 1,
-        }
-        default_pool_size = int(meta.get('task_limit', os.cpu_count()))
-        pool_size = host_limits.get(img_host, default_pool_size)
+        def progress(img_host, total):
+            uploaded = []
+            if use_tqdm():
+                bar = tqdm(total=total, desc=f"Uploading Images to {img_host}", ascii=" #", dynamic_ncols=False)
+            else:
+                console.print(f"[blue]Non-TTY environment detected. Progress bar disabled. Uploading images to {img_host}.")
 
-        try:
-            with get_context("spawn").Pool(processes=max(1, min(len(upload_tasks), pool_size))) as pool:
+            def update(result):
+                uploaded.append(result)
                 if use_tqdm():
-                    try:
-                        results = list(
-                            tqdm(
-                                pool.imap_unordered(self.upload_image_task, upload_tasks),
-                                total=len(upload_tasks),
-                                desc=f"Uploading Images to {img_host}",
-                                ascii=" #",
-                                dynamic_ncols=False
-                            )
-                        )
-                    finally:
-                        pool.close()
-                        pool.join()
+                    bar.update(1)
+                    if len(uploaded) == total:
+                        bar.close()
                 else:
-                    console.print(f"[blue]Non-TTY environment detected. Progress bar disabled. Uploading images to {img_host}.")
-                    results = []
-                    for i, result in enumerate(pool.imap_unordered(self.upload_image_task, upload_tasks), 1):
-                        results.append(result)
-                        console.print(f"Uploaded {i}/{len(upload_tasks)} images to {img_host}")
+                    console.print(f"Uploaded {len(uploaded)}/{total} images to {img_host}")
+            return update
+
+        uploader = ImageUploader(self.config, meta)
+        try:
+            img_host, successfully_uploaded = run_uploads(uploader.upload_with_fallback(
+                image_paths[:images_needed], img_host, img_host_num, fallback, progress, fallback_images=image_paths[:total_screens]))
         except KeyboardInterrupt:
             console.print("[red]Upload process interrupted by user. Exiting...")
-            pool.terminate()
-            pool.join()
             return meta['image_list'], len(meta['image_list'])
-
-        successfully_uploaded = []
-        for result in results:
-            if result['status'] == 'success':
-                successfully_uploaded.append(result)
-            else:
-                console.print(f"[yellow]Failed to upload: {result.get('reason', 'Unknown error')}")
-
-        if len(successfully_uploaded) < meta.get('cutoff') and not retry_mode and img_host == initial_img_host and not using_custom_img_list:
-            img_host_num += 1
-            if f'img_host_{img_host_num}' in self.config['DEFAULT']:
-                meta['imghost'] = self.config['DEFAULT'][f'img_host_{img_host_num}']
-                console.print(f"[cyan]Switching to the next image host: {meta['imghost']}")
-                return self.upload_screens(meta, screens, img_host_num, i, total_screens, custom_img_list, return_dict, retry_mode=True)
-            else:
-                console.print("[red]No more image hosts available. Aborting upload process.")
-                return meta['image_list'], len(meta['image_list'])
+        meta['imghost'] = img_host
+        if successfully_uploaded is None:
+            return meta['image_list'], len(meta['image_list'])
 
         new_images = []
         for upload in successfully_uploaded:
@@ -3308,40 +3271,6 @@ class Prep():
 
         return meta['image_list'], len(successfully_uploaded)
 
-    async def imgbox_upload(self, chdir, image_glob, meta, return_dict):
-        try:
-            os.chdir(chdir)
-            image_list = []
-
-            async with pyimgbox.Gallery(thumb_width=350, square_thumbs=False) as gallery:
-                for image in image_glob:
-                    try:
-                        async for submission in gallery.add([image]):
-                            if not submission['success']:
-                                console.print(f"[red]Error uploading to imgbox: [yellow]{submission['error']}[/yellow][/red]")
-                            else:
-                                web_url = submission.get('web_url')
-                                img_url = submission.get('thumbnail_url')
-                                raw_url = submission.get('image_url')
-                                if web_url and img_url and raw_url:
-                                    image_dict = {
-                                        'web_url': web_url,
-                                        'img_url': img_url,
-                                        'raw_url': raw_url
-                                    }
-                                    image_list.append(image_dict)
-                                else:
-                                    console.print(f"[red]Incomplete URLs received for image: {image}")
-                    except Exception as e:
-                        console.print(f"[red]Error during upload for {image}: {str(e)}")
-
-            return_dict['image_list'] = image_list
-            return image_list
-
-        except Exception as e:
-            console.print(f"[red]An error occurred while uploading images to imgbox: {str(e)}")
-            return []
-
     async def get_name(self, meta):
         type = meta.get('type', "").upper()
         title = meta.get('title', "")
@@ -3494,7 +3423,7 @@ class Prep():
                             meta['manual_date'] = daily_match.group().replace('.', '-')
                         is_daily = True
                         guess_date = meta.get('manual_date', guessit(video).get('date')) if meta.get('manual_date') else guessit(video).get('date')
-                        season_int, episode_int = self.daily_to_tmdb_season_episode(meta.get('tmdb'), guess_date)
+                        season_int, episode_int = await asyncio.to_thread(self.daily_to_tmdb_season_episode, meta.get('tmdb'), guess_date)
 
                         season = f"S{str(season_int).zfill(2)}"
                         episode = f"E{str(episode_int).zfill(2)}"
@@ -3549,7 +3478,7 @@ class Prep():
             else:
                 # If Anime
                 parsed = anitopy.parse(Path(video).name)
-                romaji, mal_id, eng_title, seasonYear, anilist_episodes = self.get_romaji(parsed['anime_title'], meta.get('mal', None))
+                romaji, mal_id, eng_title, seasonYear, anilist_episodes = await asyncio.to_thread(self.get_romaji, parsed['anime_title'], meta.get('mal', None))
                 if mal_id:
                     meta['mal_id'] = mal_id
                 if meta.get('mal') is not None:
@@ -3825,7 +3754,8 @@ class Prep():
 
             base_dir = meta['base_dir']
             uuid = meta['uuid']
-            current_dir_path = "*.nfo"
+            video_dir = meta['path'] if os.path.isdir(meta['path']) else os.path.dirname(meta['path'])
+            current_dir_path = os.path.join(glob.escape(video_dir), "*.nfo")
             specified_dir_path = os.path.join(base_dir, "tmp", uuid, "*.nfo")
             if meta['debug']:
                 console.print(f"specified_dir_path: {specified_dir_path}")
@@ -4012,9 +3942,12 @@ class Prep():
     async def get_imdb_aka(self, imdb_id):
         if imdb_id == "0":
             return "", None
+        hit, cached = self.meta_cache.get('imdb', 'aka', imdb_id)
+        if hit:
+            return cached[0], cached[1]
         try:
             # Get movie details using imdbinfo
-            movie = get_movie(imdb_id)
+            movie = await asyncio.to_thread(get_movie, imdb_id)
             
             if not movie:
                 return "", None
@@ -4035,7 +3968,8 @@ class Prep():
                 aka = f" AKA {aka}"
             else:
                 aka = ""
-                
+
+            self.meta_cache.set('imdb', 'aka', imdb_id, [aka, original_language])
             return aka, original_language
         except Exception as e:
             console.print(f"[yellow]IMDB: Error getting AKA for {imdb_id}: {str(e)}[/yellow]")
@@ -4097,9 +4031,13 @@ class Prep():
     async def get_imdb_info(self, imdbID, meta):
         imdb_info = {}
         if int(str(imdbID).replace('tt', '')) != 0:
+            imdb_key = str(imdbID).replace('tt', '').zfill(7)
+            hit, cached = self.meta_cache.get('imdb', 'info', imdb_key)
+            if hit:
+                return cached
             try:
                 # imdbinfo accepts both "tt0133093" and "0133093" formats
-                movie = get_movie(imdbID)
+                movie = await asyncio.to_thread(get_movie, imdbID)
                 
                 if not movie or not hasattr(movie, 'title'):
                     console.print(f"[yellow]IMDB: Could not retrieve movie data for IMDB ID: {imdbID}[/yellow]")
@@ -4124,7 +4062,8 @@ class Prep():
                     # IMDb credits most series to creators rather than directors
                     series_info = getattr(movie, 'info_series', None)
                     imdb_info['directors'] = [p.name for p in (getattr(series_info, 'creators', None) or []) if getattr(p, 'name', None)]
-                                
+                self.meta_cache.set('imdb', 'info', imdb_key, imdb_info)
+
             except Exception as e:
                 console.print(f"[yellow]IMDB: Error fetching data for IMDB ID {imdbID}: {str(e)}[/yellow]")
         else:
@@ -4145,7 +4084,7 @@ class Prep():
         imdbID = '0'
         try:
             # Search for titles matching the filename
-            results = search_title(filename)
+            results = await asyncio.to_thread(search_title, filename)
             
             if results and hasattr(results, 'titles'):
                 # Find the best match
@@ -4198,17 +4137,17 @@ class Prep():
             imdbID = '0'
 
         if int(tvdbID) != 0:
-            tvdb_resp = self._make_tvmaze_request("https://api.tvmaze.com/lookup/shows", {"thetvdb": tvdbID}, meta)
+            tvdb_resp = await asyncio.to_thread(self._make_tvmaze_request, "https://api.tvmaze.com/lookup/shows", {"thetvdb": tvdbID}, meta)
             if tvdb_resp:
                 results.append(tvdb_resp)
         if not results and int(imdbID) != 0:
-            imdb_resp = self._make_tvmaze_request("https://api.tvmaze.com/lookup/shows", {"imdb": f"tt{imdbID}"}, meta)
+            imdb_resp = await asyncio.to_thread(self._make_tvmaze_request, "https://api.tvmaze.com/lookup/shows", {"imdb": f"tt{imdbID}"}, meta)
             if imdb_resp:
                 results.append(imdb_resp)
         # Fuzzy title search is a last resort: results[0] is auto-selected with no
         # confidence scoring, so never let it compete with an authoritative ID match.
         if not results:
-            search_resp = self._make_tvmaze_request("https://api.tvmaze.com/search/shows", {"q": filename}, meta)
+            search_resp = await asyncio.to_thread(self._make_tvmaze_request, "https://api.tvmaze.com/search/shows", {"q": filename}, meta)
             if search_resp:
                 if isinstance(search_resp, list):
                     results.extend([each['show'] for each in search_resp if 'show' in each])
@@ -4272,16 +4211,22 @@ class Prep():
         return tvmazeID, imdbID, tvdbID
 
     def _make_tvmaze_request(self, url, params, meta):
+        hit, cached = self.meta_cache.get('tvmaze', url, params)
+        if hit:
+            return cached
         if meta['debug']:
             print(f"Requesting TVmaze API: {url} with params: {params}")
         try:
-            resp = requests.get(url, params=params)
+            resp = get_http_client(self.config).session.get(url, params=params)
             if resp.ok:
-                return resp.json()
+                data = resp.json()
+                self.meta_cache.set('tvmaze', url, params, data)
+                return data
             elif resp.status_code == 404:
                 # TVmaze documents 404 as "no match" for lookups, not a failure
                 if meta['debug']:
                     print(f"No TVmaze match for {url} with params: {params}")
+                self.meta_cache.set('tvmaze', url, params, None)
                 return None
             else:
                 print(f"HTTP Request failed with status code: {resp.status_code}, response: {resp.text}")
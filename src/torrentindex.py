@@ -0,0 +1,190 @@
+import asyncio
+import os
+import threading
+import time
+import xmlrpc.client
+from abc import ABC, abstractmethod
+
+from src.clientsessions import get_client_session
+
+
+class TorrentIndex(ABC):
+    """
+    Maps the content path of every torrent in a client to its infohash.
+
+    The index is built on first use and kept for the life of the process, so a
+    queue of uploads only pulls the full torrent list once. Subclasses fill it
+    from their client in refresh(), over the client's shared session.
+    """
+    def __init__(self, client_name, client):
+        self.client = client
+        self.session = get_client_session(client_name, client)
+        self.hashes = {}  # infohash -> normalized content path
+        self.paths = {}  # normalized content path -> set of infohashes
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def normalize(path):
+        return os.path.normpath(str(path)).replace('\\', '/').rstrip('/').lower()
+
+    def _add(self, torrenthash, content_path):
+        self._remove(torrenthash)
+        if not content_path:
+            return
+        content_path = self.normalize(content_path)
+        self.hashes[torrenthash] = content_path
+        self.paths.setdefault(content_path, set()).add(torrenthash)
+
+    def _remove(self, torrenthash):
+        content_path = self.hashes.pop(torrenthash, None)
+        if content_path is not None:
+            self.paths[content_path].discard(torrenthash)
+            if not self.paths[content_path]:
+                del self.paths[content_path]
+
+    def _clear(self):
+        self.hashes = {}
+        self.paths = {}
+
+    @abstractmethod
+    def refresh(self):
+        """
+        Brings the index up to date with the client.
+        """
+
+    def lookup(self, content_path):
+        """
+        Refreshes the index and returns the infohashes of torrents with this content path.
+        """
+        with self.lock:
+            self.refresh()
+            return sorted(self.paths.get(self.normalize(content_path), ()))
+
+    def has_torrent(self, torrenthash):
+        """
+        True once the client has a torrent with this infohash.
+        """
+        with self.lock:
+            self.refresh()
+            return torrenthash in self.hashes
+
+
+class QbitIndex(TorrentIndex):
+    """
+    qBittorrent index, kept up to date with the sync/maindata API. After the
+    first call only the torrents added, changed or removed since are sent.
+    """
+    def __init__(self, client_name, client):
+        super().__init__(client_name, client)
+        self.rid = 0
+        self.records = {}  # infohash -> the path fields maindata has sent so far
+
+    def refresh(self):
+        with self.session as qbt_client:
+            maindata = qbt_client.sync_maindata(rid=self.rid)
+        if maindata.get('full_update'):
+            self._clear()
+            self.records = {}
+        for torrenthash, fields in (maindata.get('torrents') or {}).items():
+            record = self.records.setdefault(torrenthash, {})
+            record.update({key: fields[key] for key in ('content_path', 'save_path', 'name') if key in fields})
+            content_path = record.get('content_path')
+            if not content_path and record.get('save_path') and record.get('name'):
+                content_path = os.path.join(record['save_path'], record['name'])
+            self._add(torrenthash, content_path)
+        for torrenthash in maindata.get('torrents_removed') or []:
+            self.records.pop(torrenthash, None)
+            self._remove(torrenthash)
+        self.rid = maindata.get('rid', self.rid)
+
+    def has_torrent(self, torrenthash):
+        # maindata reports a new torrent before its content path is known
+        with self.lock:
+            self.refresh()
+            return torrenthash.lower() in self.records
+
+
+class RtorrentIndex(TorrentIndex):
+    """
+    rTorrent index. rTorrent has no delta API, so the hash and location of every
+    torrent are fetched in a single d.multicall2 call. d.base_path is empty for
+    a closed or stopped torrent, so the content path is made from
+    d.directory_base, which is the torrent's folder for a multi file torrent
+    and the folder the file is in otherwise.
+    """
+    def refresh(self):
+        with self.session as rtorrent:
+            torrents = rtorrent.d.multicall2('', 'main', 'd.hash=', 'd.directory_base=', 'd.name=', 'd.is_multi_file=')
+        self._clear()
+        for torrenthash, directory_base, name, is_multi_file in torrents:
+            if not directory_base:
+                continue
+            self._add(torrenthash, directory_base if int(is_multi_file) else os.path.join(directory_base, name))
+
+    def has_torrent(self, torrenthash):
+        # Asks for this one torrent rather than listing them all
+        try:
+            with self.session as rtorrent:
+                rtorrent.d.hash(torrenthash.upper())
+            return True
+        except xmlrpc.client.Fault:
+            return False
+
+
+class DelugeIndex(TorrentIndex):
+    """
+    Deluge index. Deluge has no delta API, so only the save path and name of
+    every torrent are fetched, in a single core.get_torrents_status call.
+    """
+    def refresh(self):
+        with self.session as deluge:
+            torrents = deluge.call('core.get_torrents_status', {}, ['save_path', 'name'])
+        self._clear()
+        for torrenthash, status in torrents.items():
+            self._add(torrenthash, os.path.join(status['save_path'], status['name']))
+
+    def has_torrent(self, torrenthash):
+        with self.session as deluge:
+            return bool(deluge.call('core.get_torrent_status', torrenthash.lower(), ['name']))
+
+
+_index_classes = {
+    'qbit': QbitIndex,
+    'rtorrent': RtorrentIndex,
+    'deluge': DelugeIndex,
+}
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_torrent_index(client_name, client):
+    """
+    Returns the index for a configured torrent client, creating it on first use.
+    None if the client type can't be searched.
+    """
+    index_class = _index_classes.get(client.get('torrent_client', '').lower())
+    if index_class is None:
+        return None
+    with _indexes_lock:
+        if client_name not in _indexes:
+            _indexes[client_name] = index_class(client_name, client)
+        return _indexes[client_name]
+
+
+async def wait_for_torrent(index, torrenthash, timeout=30, first_delay=0.005, max_delay=1):
+    """
+    Waits until the client has picked up a torrent that was just added.
+    Checks again after first_delay seconds, doubling the wait each time up to
+    max_delay. The checks run in a thread, so the event loop keeps going.
+    Returns False if the torrent hasn't shown up after timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+    delay = first_delay
+    while True:
+        if await asyncio.to_thread(index.has_torrent, torrenthash):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
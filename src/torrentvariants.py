@@ -0,0 +1,123 @@
+import os
+import threading
+
+# How many decoded .torrent files are kept, a queue only needs the current release's
+CACHE_SIZE = 4
+_KEEP = object()
+
+
+def _value_end(data, i):
+    """
+    Returns where the bencoded value starting at i ends, without decoding it.
+    """
+    kind = data[i:i + 1]
+    if kind == b'i':
+        return data.index(b'e', i) + 1
+    if kind in (b'l', b'd'):
+        i += 1
+        while data[i:i + 1] != b'e':
+            i = _value_end(data, i)
+        return i + 1
+    colon = data.index(b':', i)
+    return colon + 1 + int(data[i:colon])
+
+
+def _dict_entries(data, view, start):
+    """
+    Returns {key: raw bencoded value} for the dictionary starting at start.
+    The values are views into data, nothing is copied.
+    """
+    if data[start:start + 1] != b'd':
+        raise ValueError("Not a bencoded dictionary")
+    entries = {}
+    i = start + 1
+    while data[i:i + 1] != b'e':
+        key_end = _value_end(data, i)
+        key = data[data.index(b':', i) + 1:key_end]
+        value_end = _value_end(data, key_end)
+        entries[key] = (key_end, view[key_end:value_end])
+        i = value_end
+    return entries
+
+
+def _encode(value):
+    if isinstance(value, int):
+        return b"i%de" % value
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    return b"%d:%s" % (len(value), value)
+
+
+def _encode_dict(entries):
+    # Bencoded dictionaries are sorted by their raw keys
+    parts = [b"d"]
+    for key, value in sorted(entries.items()):
+        parts += (_encode(key), value)
+    parts.append(b"e")
+    return b"".join(parts)
+
+
+class TorrentVariants():
+    """
+    Builds the tracker copies of a .torrent, which only differ in announce,
+    comment and source flag.
+
+    The file is split once into the raw bencoded values of its top level and
+    info keys. Each copy joins those values back together around its own
+    announce, comment and source, so the pieces table is never decoded or
+    copied into a new Torrent.
+    """
+    def __init__(self, data):
+        self.data = data
+        view = memoryview(data)
+        outer = _dict_entries(data, view, 0)
+        if b'info' not in outer:
+            raise ValueError("Torrent has no info dictionary")
+        info_start, _ = outer[b'info']
+        self.outer = {key: value for key, (_, value) in outer.items()}
+        self.info = {key: value for key, (_, value) in _dict_entries(data, view, info_start).items()}
+
+    def build(self, announce, source, comment=_KEEP, keep=None):
+        """
+        Returns the bencoded copy. keep limits which top level keys of the original are kept,
+        a comment of None drops it.
+        """
+        outer = {key: value for key, value in self.outer.items() if keep is None or key in keep}
+        info = dict(self.info)
+        if source is None:
+            info.pop(b'source', None)
+        else:
+            info[b'source'] = _encode(source)
+        outer[b'info'] = _encode_dict(info)
+        outer[b'announce'] = _encode(announce)
+        if comment is None:
+            outer.pop(b'comment', None)
+        elif comment is not _KEEP:
+            outer[b'comment'] = _encode(comment)
+        return _encode_dict(outer)
+
+    def write(self, path, announce, source, comment=_KEEP, keep=None):
+        with open(path, 'wb') as f:
+            f.write(self.build(announce, source, comment=comment, keep=keep))
+
+
+_variants = {}
+_variants_lock = threading.Lock()
+
+
+def get_torrent_variants(torrent_path):
+    """
+    Returns the TorrentVariants of a .torrent, reading it again only when the file has changed.
+    """
+    stat = os.stat(torrent_path)
+    key = os.path.abspath(torrent_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _variants_lock:
+        cached = _variants.pop(key, None)
+        if cached is None or cached[0] != version:
+            with open(torrent_path, 'rb') as f:
+                cached = (version, TorrentVariants(f.read()))
+        _variants[key] = cached
+        while len(_variants) > CACHE_SIZE:
+            _variants.pop(next(iter(_variants)))
+        return cached[1]
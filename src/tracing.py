@@ -0,0 +1,298 @@
+import asyncio
+import functools
+import glob
+import inspect
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from rich.console import Console
+from rich.table import Table
+
+from src.console import console
+from src.network import http_request_stats
+
+try:
+    import resource
+except ImportError:
+    # Windows, where only the uploader's own CPU time is reported
+    resource = None
+
+
+def _usage():
+    usage = {'wall': time.perf_counter(), 'cpu': time.process_time(), 'children_cpu': None, 'peak_rss': None, 'http': http_request_stats()}
+    if resource is not None:
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        usage['children_cpu'] = children.ru_utime + children.ru_stime
+        # ru_maxrss is in KiB, except on macOS where it's in bytes
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        usage['peak_rss'] = peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+    return usage
+
+
+class Trace():
+    """
+    Timed spans of one release, saved as trace.json in its tmp dir in Chrome's
+    trace event format (open it in chrome://tracing or ui.perfetto.dev), with a
+    summary table next to it in trace_summary.txt. The summary also has the
+    CPU time, peak RSS and HTTP requests per host of the run. Those come from
+    process wide counters, so when a queue pipeline works on releases side by
+    side, each release's figures include the others'.
+
+    The trace is started in the main process. A forked process, like the
+    discord bot's upload process, gets its own Trace for the release, which
+    appends each span to a part file that the main process merges in when it
+    saves. Anywhere the trace wasn't
+    started, spans cost nothing and are dropped.
+    """
+    FILENAME = "trace.json"
+    SUMMARY_FILENAME = "trace_summary.txt"
+
+    def __init__(self, release_dir, mode=None):
+        self.release_dir = release_dir
+        self.mode = mode
+        self.pid = os.getpid()
+        self.events = []
+        self.lanes = {}
+        self.lock = threading.Lock()
+        self.started = _usage() if mode == 'owner' else None
+
+    @property
+    def part_path(self):
+        return os.path.join(self.release_dir, f"trace.{self.pid}.part")
+
+    def _lane(self):
+        # Concurrent tasks on one thread each get a row, or their spans would overlap
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            key, name = ('task', id(task)), task.get_name()
+        else:
+            key, name = ('thread', threading.get_ident()), threading.current_thread().name
+        events = []
+        if not self.lanes:
+            events.append({'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0, 'args': {'name': multiprocessing.current_process().name}})
+        if key not in self.lanes:
+            self.lanes[key] = len(self.lanes) + 1
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': self.lanes[key], 'args': {'name': name}})
+        return self.lanes[key], events
+
+    def add(self, name, start, end, cat="prep", args=None):
+        """
+        Records a span that ran from start to end, both from time.perf_counter().
+        """
+        if self.mode is None:
+            return
+        with self.lock:
+            tid, events = self._lane()
+            events.append({
+                'name': name,
+                'cat': cat,
+                'ph': 'X',
+                'ts': round(start * 1e6, 1),
+                'dur': round((end - start) * 1e6, 1),
+                'pid': self.pid,
+                'tid': tid,
+                'args': args or {},
+            })
+            if self.mode == 'part':
+                try:
+                    with open(self.part_path, 'a', encoding='utf-8') as f:
+                        f.writelines(f"{json.dumps(event)}\n" for event in events)
+                except OSError:
+                    pass
+            else:
+                self.events += events
+
+    @contextmanager
+    def span(self, name, cat="prep", **args):
+        """
+        Records the with block as a span, whether it returns or raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter(), cat=cat, args=args)
+
+    def _merge_parts(self):
+        for part in glob.glob(os.path.join(glob.escape(self.release_dir), "trace.*.part")):
+            try:
+                with open(part, 'r', encoding='utf-8') as f:
+                    self.events += [json.loads(line) for line in f if line.strip()]
+                os.remove(part)
+            except (OSError, ValueError) as e:
+                console.print(f"[yellow]Could not read screenshot trace {part}: {e}")
+
+    def summary(self):
+        totals = {}
+        for event in self.events:
+            if event['ph'] == 'X':
+                count, total, longest = totals.get(event['name'], (0, 0, 0))
+                totals[event['name']] = (count + 1, total + event['dur'], max(longest, event['dur']))
+        table = Table(title="Release timings", title_justify="left")
+        table.add_column("Span", style="cyan")
+        table.add_column("Count", justify="right")
+        table.add_column("Total", justify="right")
+        table.add_column("Longest", justify="right")
+        for name, (count, total, longest) in sorted(totals.items(), key=lambda item: item[1][1], reverse=True):
+            table.add_row(name, str(count), f"{total / 1e6:.2f}s", f"{longest / 1e6:.2f}s")
+        return table
+
+    def resources(self):
+        """
+        Returns what the run used since the trace was started.
+        """
+        now = _usage()
+        resources = {
+            'wall_seconds': round(now['wall'] - self.started['wall'], 3),
+            'cpu_seconds': round(now['cpu'] - self.started['cpu'], 3),
+            'children_cpu_seconds': None,
+            'peak_rss_mib': None,
+            'http_requests': {},
+        }
+        if now['children_cpu'] is not None:
+            resources['children_cpu_seconds'] = round(now['children_cpu'] - self.started['children_cpu'], 3)
+            resources['peak_rss_mib'] = round(now['peak_rss'] / 1048576, 1)
+        for host, (requests_made, seconds) in now['http'].items():
+            started_requests, started_seconds = self.started['http'].get(host, (0, 0.0))
+            if requests_made > started_requests:
+                resources['http_requests'][host] = {'requests': requests_made - started_requests, 'seconds': round(seconds - started_seconds, 3)}
+        return resources
+
+    def resources_table(self, resources):
+        table = Table(title="Release resources", title_justify="left")
+        table.add_column("Resource", style="cyan")
+        table.add_column("Used", justify="right")
+        table.add_row("Wall time", f"{resources['wall_seconds']:.2f}s")
+        table.add_row("CPU time", f"{resources['cpu_seconds']:.2f}s")
+        if resources['children_cpu_seconds'] is not None:
+            table.add_row("CPU time of child processes", f"{resources['children_cpu_seconds']:.2f}s")
+            table.add_row("Peak RSS", f"{resources['peak_rss_mib']:.1f} MiB")
+        for host, stats in sorted(resources['http_requests'].items()):
+            table.add_row(f"HTTP {host}", f"{stats['requests']} requests, {stats['seconds']:.2f}s")
+        return table
+
+    def save(self, debug=False):
+        """
+        Writes trace.json and trace_summary.txt, and prints the summary in debug mode.
+        """
+        if self.mode != 'owner':
+            return
+        with self.lock:
+            self._merge_parts()
+            resources = self.resources()
+            tables = (self.summary(), self.resources_table(resources))
+            try:
+                os.makedirs(self.release_dir, exist_ok=True)
+                trace_path = os.path.join(self.release_dir, self.FILENAME)
+                with open(f"{trace_path}.tmp", 'w', encoding='utf-8') as f:
+                    json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms', 'otherData': resources}, f)
+                os.replace(f"{trace_path}.tmp", trace_path)
+                with open(os.path.join(self.release_dir, self.SUMMARY_FILENAME), 'w', encoding='utf-8') as f:
+                    summary_console = Console(file=f, width=120, color_system=None)
+                    for table in tables:
+                        summary_console.print(table)
+            except OSError as e:
+                console.print(f"[yellow]Could not save the trace: {e}")
+        if debug:
+            for table in tables:
+                console.print(table)
+
+
+_traces = {}
+_traces_lock = threading.Lock()
+
+
+def _release_dir(base_dir, uuid):
+    return os.path.abspath(f"{base_dir}/tmp/{uuid}")
+
+
+def start_trace(meta):
+    """
+    Starts a new trace for the release in meta, dropping spans left from an earlier run.
+    """
+    release_dir = _release_dir(meta['base_dir'], meta['uuid'])
+    for part in glob.glob(os.path.join(glob.escape(release_dir), "trace.*.part")):
+        try:
+            os.remove(part)
+        except OSError:
+            pass
+    with _traces_lock:
+        _traces[release_dir] = Trace(release_dir, mode='owner')
+        return _traces[release_dir]
+
+
+def get_trace(base_dir, uuid):
+    """
+    Returns the trace of a release in this process.
+    """
+    release_dir = _release_dir(base_dir, uuid)
+    with _traces_lock:
+        trace = _traces.get(release_dir)
+        if trace is None:
+            return Trace(release_dir)
+        # A forked process inherits its parent's trace, and writes its own spans to a part file
+        if trace.pid != os.getpid():
+            trace = Trace(release_dir, mode='part' if trace.mode else None)
+            _traces[release_dir] = trace
+        return trace
+
+
+def span(meta, name, cat="prep", **args):
+    """
+    Records a with block as a span of the trace of the release in meta.
+    """
+    return get_trace(meta['base_dir'], meta['uuid']).span(name, cat=cat, **args)
+
+
+def save_trace(meta):
+    """
+    Saves the trace of the release in meta, and stops it.
+    """
+    release_dir = _release_dir(meta['base_dir'], meta['uuid'])
+    with _traces_lock:
+        trace = _traces.pop(release_dir, None)
+    if trace is not None:
+        trace.save(debug=meta.get('debug', False))
+
+
+def traced(name, cat="prep"):
+    """
+    Decorator recording each call as a span. The release comes from the meta
+    argument, or the base_dir and folder_id arguments, and name is formatted
+    with the arguments, e.g. "Add to client ({tracker})".
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def call_span(args, kwargs):
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            meta = arguments.get('meta')
+            if isinstance(meta, dict) and meta.get('uuid'):
+                trace = get_trace(meta['base_dir'], meta['uuid'])
+            elif arguments.get('base_dir') and arguments.get('folder_id'):
+                trace = get_trace(arguments['base_dir'], arguments['folder_id'])
+            else:
+                trace = Trace(None)
+            return trace.span(name.format_map(arguments), cat=cat)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with call_span(args, kwargs):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with call_span(args, kwargs):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,45 @@
+import importlib
+import threading
+from collections.abc import Mapping
+
+TRACKERS = (
+    'ACM', 'AITHER', 'AL', 'ANT', 'BHD', 'BHDTV', 'BLU', 'CBR', 'DP', 'FL', 'FNP', 'HDB', 'HDT', 'HHD',
+    'HP', 'HUNO', 'IHD', 'JPTV', 'LCD', 'LST', 'LT', 'LUME', 'MS', 'MTV', 'NBL', 'OE', 'OTW', 'PG',
+    'PSS', 'PTER', 'PTP', 'PTT', 'R4E', 'RF', 'RMC', 'RTF', 'SHRI', 'SN', 'SP', 'SPD', 'STC', 'THR',
+    'TIK', 'TL', 'TTG', 'TVC', 'ULCX', 'UTP', 'YOINK', 'YUS', 'ZNTH',
+)
+
+
+class TrackerRegistry(Mapping):
+    """
+    Tracker name -> tracker class, for every module under src/trackers.
+
+    A tracker's module is imported the first time its class is looked up, so a
+    run only imports the trackers it uploads to or searches. Membership tests
+    and iterating over the names import nothing.
+    """
+    def __init__(self, names):
+        self.names = tuple(names)
+        self.classes = {}
+        self.lock = threading.Lock()
+
+    def __getitem__(self, name):
+        if name not in self.names:
+            raise KeyError(name)
+        with self.lock:
+            if name not in self.classes:
+                module = importlib.import_module(f"src.trackers.{name}")
+                self.classes[name] = getattr(module, name)
+            return self.classes[name]
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+tracker_class_map = TrackerRegistry(TRACKERS)
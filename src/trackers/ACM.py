@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 import os
 import platform
 from str2bool import str2bool
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 import bencodepy
 
@@ -21,6 +21,7 @@ class ACM():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'ACM'
         self.source_flag = 'AsianCinema'
         self.upload_url = 'https://eiga.moi/api/torrents/upload'
@@ -256,7 +257,7 @@ class ACM():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 console.print(response.json())
             except Exception:
@@ -281,7 +282,7 @@ class ACM():
         }
         # Adding Name to search seems to override tmdb
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
@@ -290,7 +291,6 @@ class ACM():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -387,7 +387,7 @@ class ACM():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
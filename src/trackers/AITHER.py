@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 from str2bool import str2bool
 import platform
@@ -10,6 +9,7 @@ import os
 import glob
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -23,6 +23,7 @@ class AITHER():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'AITHER'
         self.source_flag = 'Aither'
         self.search_url = 'https://aither.cc/api/torrents/filter'
@@ -113,7 +114,7 @@ class AITHER():
             data['season_number'] = meta.get('season_int', '0')
             data['episode_number'] = meta.get('episode_int', '0')
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 resp_json = response.json()
                 console.print(resp_json)
@@ -257,7 +258,7 @@ class AITHER():
             params['name'] = params['name'] + f" {meta['edition']}"
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
@@ -266,7 +267,6 @@ class AITHER():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -281,7 +281,7 @@ class AITHER():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 import platform
 from str2bool import str2bool
@@ -9,6 +8,7 @@ import os
 import glob
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -23,6 +23,7 @@ class AL():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'AL'
         self.source_flag = 'AnimeLovers'
         self.upload_url = 'https://animelovers.club/api/torrents/upload'
@@ -149,7 +150,7 @@ class AL():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 console.print(response.json())
             except Exception:
@@ -174,7 +175,7 @@ class AL():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
@@ -183,7 +184,6 @@ class AL():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -203,7 +203,7 @@ class AL():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
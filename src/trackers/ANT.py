@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 # import discord
-import os
 import asyncio
-import requests
+import os
 import platform
 from str2bool import str2bool
 from pymediainfo import MediaInfo
 from pathlib import Path
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -22,6 +22,7 @@ class ANT():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'ANT'
         self.source_flag = 'ANT'
         self.search_url = 'https://anthelion.me/api.php'
@@ -98,7 +99,7 @@ class ANT():
             from src.prep import Prep
             prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=self.config)
             meta['max_piece_size'] = '256'  # 256 MiB
-            prep.create_torrent(meta, Path(meta['path']), "ANT")
+            await asyncio.to_thread(prep.create_torrent, meta, Path(meta['path']), "ANT")
             torrent_filename = "ANT"
 
         await common.edit_torrent(meta, self.tracker, self.source_flag, torrent_filename=torrent_filename)
@@ -152,7 +153,7 @@ class ANT():
 
         try:
             if not meta['debug']:
-                response = requests.post(url=self.upload_url, files=files, data=data, headers=headers)
+                response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers)
                 if response.status_code in [200, 201]:
                     response_data = response.json()
                 else:
@@ -191,7 +192,7 @@ class ANT():
         elif int(meta['imdb_id'].replace('tt', '')) != 0:
             params['imdb'] = meta['imdb_id']
         try:
-            response = requests.get(url='https://anthelion.me/api', params=params)
+            response = await self.http.get(url='https://anthelion.me/api', params=params)
             response = response.json()
             for each in response['item']:
                 largest = [each][0]['files'][0]
@@ -202,6 +203,5 @@ class ANT():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
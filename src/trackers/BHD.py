@@ -9,10 +9,11 @@ import platform
 import hashlib
 import bencodepy
 import glob
-import multiprocessing
+import copy
 from urllib.parse import urlparse
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -26,6 +27,7 @@ class BHD():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'BHD'
         self.source_flag = 'BHD'
         self.upload_url = 'https://beyond-hd.me/api/upload/'
@@ -154,7 +156,7 @@ class BHD():
 
         url = self.upload_url + self.config['TRACKERS'][self.tracker]['api_key'].strip()
         if meta['debug'] is False:
-            response = requests.post(url=url, files=files, data=data, headers=headers)
+            response = await self.http.post(url=url, files=files, data=data, headers=headers)
             try:
                 response = response.json()
                 if int(response['status_code']) == 0:
@@ -162,7 +164,7 @@ class BHD():
                     if response['status_message'].startswith('Invalid imdb_id'):
                         console.print('[yellow]RETRYING UPLOAD')
                         data['imdb_id'] = 1
-                        response = requests.post(url=url, files=files, data=data, headers=headers)
+                        response = await self.http.post(url=url, files=files, data=data, headers=headers)
                         response = response.json()
                     elif response['satus_message'].startswith('Invalid name value'):
                         console.print(f"[bold yellow]Submitted Name: {bhd_name}")
@@ -220,26 +222,13 @@ class BHD():
                     console.print(f"[yellow]Insufficient screenshots found: generating {multi_screens} screenshots.")
 
                 if meta['is_disc'] == "BDMV":
-                    s = multiprocessing.Process(
-                        target=prep.disc_screenshots,
-                        args=(f"FILE_{img_host_index}", meta['bdinfo'], folder_id, base_dir,
-                              meta.get('vapoursynth', False), [], meta.get('ffdebug', False), img_host_index)
-                    )
+                    await asyncio.to_thread(prep.disc_screenshots, copy.deepcopy(meta), f"FILE_{img_host_index}", meta['bdinfo'], folder_id, base_dir,
+                                            meta.get('vapoursynth', False), [], meta.get('ffdebug', False), img_host_index)
                 elif meta['is_disc'] == "DVD":
-                    s = multiprocessing.Process(
-                        target=prep.dvd_screenshots,
-                        args=(meta, 0, None, True)
-                    )
+                    await asyncio.to_thread(prep.dvd_screenshots, copy.deepcopy(meta), 0, None, True)
                 else:
-                    s = multiprocessing.Process(
-                        target=prep.screenshots,
-                        args=(path, f"{filename}", meta['uuid'], base_dir,
-                              meta, multi_screens + 1, True, None)
-                    )
-
-                s.start()
-                while s.is_alive():
-                    await asyncio.sleep(1)
+                    await asyncio.to_thread(prep.screenshots, path, f"{filename}", meta['uuid'], base_dir,
+                                            copy.deepcopy(meta), multi_screens + 1, True, None)
 
                 if meta['is_disc'] == "DVD":
                     existing_screens = glob.glob(f"{meta['base_dir']}/tmp/{meta['uuid']}/{meta['discs'][0]['name']}-*.png")
@@ -429,7 +418,7 @@ class BHD():
             data['search'] = f"{meta.get('season', '')}{meta.get('episode', '')}"
         url = f"https://beyond-hd.me/api/torrents/{self.config['TRACKERS']['BHD']['api_key'].strip()}"
         try:
-            response = requests.post(url=url, data=data)
+            response = await self.http.post(url=url, data=data)
             response = response.json()
             if response.get('status_code') == 1:
                 for each in response['results']:
@@ -439,10 +428,8 @@ class BHD():
                         dupes.append(result)
             else:
                 console.print(f"[yellow]{response.get('status_message')}")
-                await asyncio.sleep(5)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Most likely the site is down.')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -534,7 +521,7 @@ class BHD():
         }
         url = f"https://beyond-hd.me/api/torrents/{self.config['TRACKERS']['BHD']['api_key'].strip()}"
         try:
-            response = requests.post(url=url, json=params)
+            response = await self.http.post(url=url, json=params)
             response_data = response.json()
             # console.print(f"[yellow]Response Data: {response_data}")
 
@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 # import discord
-import requests
 from src.console import console
 from str2bool import str2bool
 from pprint import pprint
 import os
 import traceback
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from pymediainfo import MediaInfo
 
 
@@ -21,6 +21,7 @@ class BHDTV():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'BHDTV'
         self.source_flag = 'BIT-HDTV'
         # search not implemented
@@ -88,7 +89,7 @@ class BHDTV():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, data=data, files=files)
+            response = await self.http.post(url=self.upload_url, data=data, files=files)
             try:
                 # pprint(data)
                 console.print(response.json())
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 import platform
 from str2bool import str2bool
@@ -9,6 +8,7 @@ import os
 import glob
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -22,6 +22,7 @@ class BLU():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'BLU'
         self.source_flag = 'BLU'
         self.search_url = 'https://blutopia.cc/api/torrents/filter'
@@ -126,7 +127,7 @@ class BLU():
         params = {}
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 resp_json = response.json()
                 console.print(resp_json)
@@ -238,7 +239,7 @@ class BLU():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            response = requests.get(url=self.search_url, params=params, headers=headers)
+            response = await self.http.get(url=self.search_url, params=params, headers=headers)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
@@ -247,7 +248,6 @@ class BLU():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -262,7 +262,7 @@ class BLU():
         headers = self.get_headers()
 
         try:
-            response = requests.get(url=self.search_url, params=params, headers=headers)
+            response = await self.http.get(url=self.search_url, params=params, headers=headers)
             response.raise_for_status()
             response_data = response.json()
 
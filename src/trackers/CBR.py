@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 from str2bool import str2bool
 import platform
@@ -9,6 +8,7 @@ import os
 import glob
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -22,6 +22,7 @@ class CBR():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'CBR'
         self.source_flag = 'CapybaraBR'
         self.search_url = 'https://capybarabr.com/api/torrents/filter'
@@ -108,7 +109,7 @@ class CBR():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 console.print(response.json())
             except Exception:
@@ -171,7 +172,7 @@ class CBR():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
@@ -180,7 +181,6 @@ class CBR():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Não foi possivel buscar no tracker torrents duplicados. O tracker está offline ou sua api está incorreta')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -201,7 +201,7 @@ class CBR():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
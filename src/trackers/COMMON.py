@@ -1,34 +1,44 @@
-from torf import Torrent
 import os
+import io
+import hashlib
 import requests
 import re
 import json
 import click
 import sys
 import glob
-from pymediainfo import MediaInfo
-import multiprocessing
+import copy
 import asyncio
 
 from src.bbcode import BBCODE
 from src.console import console
+from src.network import get_http_client
+from src.torrentvariants import get_torrent_variants
+from src.mediainfocache import get_file_mediainfo
+from src.cookiesessions import parse_cookie_file
+
+# Rendered UNIT3D description bodies and the meta they updated, by COMMON.unit3d_desc_key
+_unit3d_desc_bodies = {}
+_unit3d_desc_locks = {}
 
 
 class COMMON():
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.parser = self.MediaInfoParser()
         pass
 
     async def edit_torrent(self, meta, tracker, source_flag, torrent_filename="BASE"):
         if os.path.exists(f"{meta['base_dir']}/tmp/{meta['uuid']}/{torrent_filename}.torrent"):
-            new_torrent = Torrent.read(f"{meta['base_dir']}/tmp/{meta['uuid']}/{torrent_filename}.torrent")
-            for each in list(new_torrent.metainfo):
-                if each not in ('announce', 'comment', 'creation date', 'created by', 'encoding', 'info'):
-                    new_torrent.metainfo.pop(each, None)
-            new_torrent.metainfo['announce'] = self.config['TRACKERS'][tracker].get('announce_url', "https://fake.tracker").strip()
-            new_torrent.metainfo['info']['source'] = source_flag
-            Torrent.copy(new_torrent).write(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]{meta['clean_name']}.torrent", overwrite=True)
+            # BASE is decoded once per release, every tracker's copy reuses its info dict as is
+            variants = get_torrent_variants(f"{meta['base_dir']}/tmp/{meta['uuid']}/{torrent_filename}.torrent")
+            variants.write(
+                f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]{meta['clean_name']}.torrent",
+                announce=self.config['TRACKERS'][tracker].get('announce_url', "https://fake.tracker").strip(),
+                source=source_flag,
+                keep=(b'announce', b'comment', b'creation date', b'created by', b'encoding', b'info')
+            )
 
     # used to add tracker url, comment and source flag to torrent file
     async def add_tracker_torrent(self, meta, tracker, source_flag, new_tracker, comment, headers=None, params=None, downurl=None):
@@ -50,16 +60,58 @@ class COMMON():
                 return
 
         if os.path.exists(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent"):
-            new_torrent = Torrent.read(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
-            new_torrent.metainfo['announce'] = new_tracker
-            new_torrent.metainfo['comment'] = comment
-            new_torrent.metainfo['info']['source'] = source_flag
-            Torrent.copy(new_torrent).write(path, overwrite=True)
+            variants = get_torrent_variants(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
+            variants.write(path, announce=new_tracker, source=source_flag, comment=comment)
 
     async def unit3d_edit_desc(self, meta, tracker, signature, comparison=False, desc_header=""):
+        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf8').read()
+        # The UNIT3D trackers only differ by header and signature, so the body is rendered once per release.
+        # Trackers uploaded to at the same time each have a copy of meta, so they wait for the one rendering
+        # and take the screenshots it uploaded along with the body.
+        key = self.unit3d_desc_key(meta, base, comparison)
+        async with _unit3d_desc_locks.setdefault(key, asyncio.Lock()):
+            if key in _unit3d_desc_bodies:
+                body, updates = _unit3d_desc_bodies[key]
+                meta.update(copy.deepcopy(updates))
+            else:
+                before = copy.deepcopy(meta)
+                body = await self.unit3d_desc_body(meta, base, comparison)
+                updates = copy.deepcopy({k: v for k, v in meta.items() if k not in before or before[k] != v})
+                # Also kept under the key of the updated meta, for the next tracker when meta is shared
+                for rendered_key in (key, self.unit3d_desc_key(meta, base, comparison)):
+                    _unit3d_desc_bodies[rendered_key] = (body, updates)
+                while len(_unit3d_desc_bodies) > 16:
+                    _unit3d_desc_locks.pop(next(iter(_unit3d_desc_bodies)), None)
+                    _unit3d_desc_bodies.pop(next(iter(_unit3d_desc_bodies)))
+        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]DESCRIPTION.txt", 'w', encoding='utf8') as descfile:
+            if desc_header:
+                descfile.write(desc_header)
+            descfile.write(body)
+
+            # Append signature if provided
+            if signature:
+                descfile.write(signature)
+        return
+
+    def unit3d_desc_key(self, meta, base, comparison):
+        """
+        Everything the shared body depends on, as it is before the body is rendered.
+        """
+        default = self.config['DEFAULT']
+        inputs = [
+            meta['uuid'], base, comparison,
+            [default.get(key) for key in ('multiScreens', 'charLimit', 'fileLimit', 'pack_thumb_size', 'processLimit', 'screenshot_header', 'thumbnail_size')],
+            meta.get('discs', []), meta.get('filelist', []), meta.get('image_list', []), meta.get('screens'), meta.get('debug'),
+            {key: value for key, value in meta.items() if key.startswith('new_images_')},
+        ]
+        return hashlib.sha1(json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    async def unit3d_desc_body(self, meta, base, comparison=False):
+        """
+        Renders the description shared by the UNIT3D trackers, everything between their header and signature.
+        """
         from src.prep import Prep
         prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=self.config)
-        base = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", 'r', encoding='utf8').read()
         multi_screens = int(self.config['DEFAULT'].get('multiScreens', 2))
         char_limit = int(self.config['DEFAULT'].get('charLimit', 14000))
         file_limit = int(self.config['DEFAULT'].get('fileLimit', 5))
@@ -69,10 +121,7 @@ class COMMON():
             screenheader = self.config['DEFAULT']['screenshot_header']
         except Exception:
             screenheader = None
-        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}]DESCRIPTION.txt", 'w', encoding='utf8') as descfile:
-            if desc_header:
-                descfile.write(desc_header)
-
+        with io.StringIO() as descfile:
             bbcode = BBCODE()
             discs = meta.get('discs', [])
             filelist = meta.get('filelist', [])
@@ -175,16 +224,10 @@ class COMMON():
                                 # Run prep.screenshots if no screenshots are present
                                 if each['type'] == "BDMV":
                                     use_vs = meta.get('vapoursynth', False)
-                                    s = multiprocessing.Process(target=prep.disc_screenshots, args=(meta, f"FILE_{i}", each['bdinfo'], meta['uuid'], meta['base_dir'], use_vs, [], meta.get('ffdebug', False), multi_screens, True))
-                                    s.start()
-                                    while s.is_alive():
-                                        await asyncio.sleep(1)
+                                    await asyncio.to_thread(prep.disc_screenshots, copy.deepcopy(meta), f"FILE_{i}", each['bdinfo'], meta['uuid'], meta['base_dir'], use_vs, [], meta.get('ffdebug', False), multi_screens, True)
                                     new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"FILE_{i}-*.png")
                                 elif each['type'] == "DVD":
-                                    s = multiprocessing.Process(target=prep.dvd_screenshots, args=(meta, i, multi_screens, True))
-                                    s.start()
-                                    while s.is_alive() is True:
-                                        await asyncio.sleep(1)
+                                    await asyncio.to_thread(prep.dvd_screenshots, copy.deepcopy(meta), i, multi_screens, True)
                                     new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"{meta['discs'][i]['name']}-*.png")
 
                             if new_screens:
@@ -256,10 +299,7 @@ class COMMON():
                             if not new_screens:
                                 if meta['debug']:
                                     console.print(f"[yellow]No existing screenshots for {new_images_key}; generating new ones.")
-                                s = multiprocessing.Process(target=prep.screenshots, args=(file, f"FILE_{i}", meta['uuid'], meta['base_dir'], meta, multi_screens + 1, True, None))
-                                s.start()
-                                while s.is_alive():
-                                    await asyncio.sleep(1)
+                                await asyncio.to_thread(prep.screenshots, file, f"FILE_{i}", meta['uuid'], meta['base_dir'], copy.deepcopy(meta), multi_screens + 1, True, None)
 
                                 new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"FILE_{i}-*.png")
 
@@ -298,7 +338,7 @@ class COMMON():
                     # Write filename in BBCode format with MediaInfo in spoiler if not the first file
                     if multi_screens != 0:
                         if i > 0 and char_count < max_char_limit:
-                            mi_dump = MediaInfo.parse(file, output="STRING", full=False, mediainfo_options={'inform_version': '1'})
+                            mi_dump = get_file_mediainfo(meta, file).text
                             parsed_mediainfo = self.parser.parse_mediainfo(mi_dump)
                             formatted_bbcode = self.parser.format_bbcode(parsed_mediainfo)
                             descfile.write(f"[center][spoiler={filename}]{formatted_bbcode}[/spoiler][/center]\n")
@@ -340,12 +380,7 @@ class COMMON():
                     char_count += len("[/spoiler][/center]\n")
 
             console.print(f"[yellow]Total characters written to description: {char_count}")
-
-            # Append signature if provided
-            if signature:
-                descfile.write(signature)
-            descfile.close()
-        return
+            return descfile.getvalue()
 
     async def unit3d_region_ids(self, region):
         region_id = {
@@ -467,7 +502,7 @@ class COMMON():
             console.print("[red]No ID or file name provided for search.[/red]")
             return None, None, None, None, None, None, None, None, None
 
-        response = requests.get(url=url, params=params)
+        response = await self.http.get(url=url, params=params)
         # console.print(f"[blue]Raw API Response: {response}[/blue]")
 
         try:
@@ -577,15 +612,7 @@ class COMMON():
     async def parseCookieFile(self, cookiefile):
         """Parse a cookies.txt file and return a dictionary of key value pairs
         compatible with requests."""
-
-        cookies = {}
-        with open(cookiefile, 'r') as fp:
-            for line in fp:
-                if not line.startswith(("# ", "\n", "#\n")):
-                    lineFields = re.split(' |\t', line.strip())
-                    lineFields = [x for x in lineFields if x != ""]
-                    cookies[lineFields[5]] = lineFields[6]
-        return cookies
+        return parse_cookie_file(cookiefile)
 
     async def ptgen(self, meta, ptgen_site="", ptgen_retry=3):
         ptgen = ""
@@ -597,11 +624,11 @@ class COMMON():
         # get douban url
         if int(meta.get('imdb_id', '0')) != 0:
             data['search'] = f"tt{meta['imdb_id']}"
-            ptgen = requests.get(url, params=data)
+            ptgen = await self.http.get(url, params=data)
             if ptgen.json()["error"] is not None:
                 for retry in range(ptgen_retry):
                     try:
-                        ptgen = requests.get(url, params=params)
+                        ptgen = await self.http.get(url, params=params)
                         if ptgen.json()["error"] is None:
                             break
                     except requests.exceptions.JSONDecodeError:
@@ -615,10 +642,10 @@ class COMMON():
             console.print("[red]No IMDb id was found.")
             params['url'] = console.input("[red]Please enter [yellow]Douban[/yellow] link: ")
         try:
-            ptgen = requests.get(url, params=params)
+            ptgen = await self.http.get(url, params=params)
             if ptgen.json()["error"] is not None:
                 for retry in range(ptgen_retry):
-                    ptgen = requests.get(url, params=params)
+                    ptgen = await self.http.get(url, params=params)
                     if ptgen.json()["error"] is None:
                         break
             ptgen = ptgen.json()
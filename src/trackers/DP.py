@@ -1,5 +1,4 @@
 # import discord
-import asyncio
 import glob
 import os
 import platform
@@ -11,6 +10,7 @@ from str2bool import str2bool
 
 from src.console import console
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 
 
 class DP:
@@ -24,6 +24,7 @@ class DP:
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = "DP"
         self.source_flag = "DP"
         self.upload_url = "https://darkpeers.org/api/torrents/upload"
@@ -194,7 +195,7 @@ class DP:
             data["season_number"] = meta.get("season_int", "0")
             data["episode_number"] = meta.get("episode_int", "0")
         if meta["debug"] is False:
-            response = requests.post(
+            response = await self.http.post(
                 url=self.upload_url,
                 files=files,
                 data=data,
@@ -372,7 +373,7 @@ class DP:
             params["name"] = params["name"] + f" {meta['edition']}"
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response["data"]:
                 result = [each][0]["attributes"]["name"]
@@ -383,7 +384,6 @@ class DP:
             console.print(
                 "[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect"
             )
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -398,7 +398,7 @@ class DP:
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
@@ -4,13 +4,14 @@ import re
 import os
 from str2bool import str2bool
 import glob
-import pickle
 from unidecode import unidecode
 from urllib.parse import urlparse
 import cli_ui
 from bs4 import BeautifulSoup
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
+from src.cookiesessions import get_cookie_session, save_cookies
 from src.exceptions import *  # noqa F403
 from src.console import console
 
@@ -19,6 +20,7 @@ class FL():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'FL'
         self.source_flag = 'FL'
         self.username = config['TRACKERS'][self.tracker].get('username', '').strip()
@@ -171,11 +173,9 @@ class FL():
                 console.print(url)
                 console.print(data)
             else:
-                with requests.Session() as session:
-                    cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/FL.pkl")
-                    with open(cookiefile, 'rb') as cf:
-                        session.cookies.update(pickle.load(cf))
-                    up = session.post(url=url, data=data, files=files)
+                cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/FL.pkl")
+                with get_cookie_session(self.tracker, cookiefile) as session:
+                    up = await asyncio.to_thread(session.post, url=url, data=data, files=files)
                     torrentFile.close()
 
                     # Match url to verify successful upload
@@ -192,11 +192,8 @@ class FL():
 
     async def search_existing(self, meta, disctype):
         dupes = []
-        with requests.Session() as session:
-            cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/FL.pkl")
-            with open(cookiefile, 'rb') as cf:
-                session.cookies.update(pickle.load(cf))
-
+        cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/FL.pkl")
+        with get_cookie_session(self.tracker, cookiefile) as session:
             search_url = "https://filelist.io/browse.php"
             if int(meta['imdb_id'].replace('tt', '')) != 0:
                 params = {
@@ -211,8 +208,7 @@ class FL():
                     'searchin': '0'
                 }
 
-            r = session.get(search_url, params=params)
-            await asyncio.sleep(0.5)
+            r = await asyncio.to_thread(session.get, search_url, params=params)
             soup = BeautifulSoup(r.text, 'html.parser')
             find = soup.find_all('a', href=True)
             for each in find:
@@ -242,15 +238,17 @@ class FL():
     async def validate_cookies(self, meta, cookiefile):
         url = "https://filelist.io/index.php"
         if os.path.exists(cookiefile):
-            with requests.Session() as session:
-                with open(cookiefile, 'rb') as cf:
-                    session.cookies.update(pickle.load(cf))
-                resp = session.get(url=url)
+            cookie_session = get_cookie_session(self.tracker, cookiefile)
+            with cookie_session as session:
+                if cookie_session.validated:
+                    return True
+                resp = await asyncio.to_thread(session.get, url=url)
                 if meta['debug']:
                     console.print('[cyan]Cookies:')
                     console.print(session.cookies.get_dict())
                     console.print(resp.url)
                 if resp.text.find("Logout") != -1:
+                    cookie_session.validated = True
                     return True
                 else:
                     return False
@@ -259,7 +257,7 @@ class FL():
 
     async def login(self, cookiefile):
         with requests.Session() as session:
-            r = session.get("https://filelist.io/login.php")
+            r = await asyncio.to_thread(session.get, "https://filelist.io/login.php")
             await asyncio.sleep(0.5)
             soup = BeautifulSoup(r.text, 'html.parser')
             validator = soup.find('input', {'name': 'validator'}).get('value')
@@ -269,14 +267,13 @@ class FL():
                 'password': self.password,
                 'unlock': '1',
             }
-            response = session.post('https://filelist.io/takelogin.php', data=data)
+            response = await asyncio.to_thread(session.post, 'https://filelist.io/takelogin.php', data=data)
             await asyncio.sleep(0.5)
             index = 'https://filelist.io/index.php'
-            response = session.get(index)
+            response = await asyncio.to_thread(session.get, index)
             if response.text.find("Logout") != -1:
                 console.print('[green]Successfully logged into FL')
-                with open(cookiefile, 'wb') as cf:
-                    pickle.dump(session.cookies, cf)
+                save_cookies(cookiefile, session.cookies)
             else:
                 console.print('[bold red]Something went wrong while trying to log into FL')
                 await asyncio.sleep(1)
@@ -285,7 +282,7 @@ class FL():
 
     async def download_new_torrent(self, session, id, torrent_path):
         download_url = f"https://filelist.io/download.php?id={id}"
-        r = session.get(url=download_url)
+        r = await asyncio.to_thread(session.get, url=download_url)
         if r.status_code == 200:
             with open(torrent_path, "wb") as tor:
                 tor.write(r.content)
@@ -317,7 +314,7 @@ class FL():
                 files = []
                 for screen in screen_glob:
                     files.append(('images', (os.path.basename(screen), open(f"{meta['base_dir']}/tmp/{meta['uuid']}/{screen}", 'rb'), 'image/png')))
-                response = requests.post(url, data=data, files=files, auth=(self.fltools['user'], self.fltools['pass']))
+                response = await self.http.post(url, data=data, files=files, auth=(self.fltools['user'], self.fltools['pass']))
                 final_desc = response.text.replace('\r\n', '\n')
             else:
                 # BD Description Generator
@@ -332,7 +329,7 @@ class FL():
                     files = []
                     for screen in screen_glob:
                         files.append(('images', (os.path.basename(screen), open(f"{meta['base_dir']}/tmp/{meta['uuid']}/{screen}", 'rb'), 'image/png')))
-                    response = requests.post(url, files=files, auth=(self.fltools['user'], self.fltools['pass']))
+                    response = await self.http.post(url, files=files, auth=(self.fltools['user'], self.fltools['pass']))
                     final_desc += response.text.replace('\r\n', '\n')
             descfile.write(final_desc)
 
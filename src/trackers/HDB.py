@@ -1,4 +1,3 @@
-import requests
 import asyncio
 import re
 import os
@@ -8,6 +7,8 @@ import glob
 from unidecode import unidecode
 from urllib.parse import urlparse, quote
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
+from src.cookiesessions import get_cookie_session
 from src.exceptions import *  # noqa F403
 from src.console import console
 from datetime import datetime
@@ -18,6 +19,7 @@ class HDB():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'HDB'
         self.source_flag = 'HDBits'
         self.username = config['TRACKERS']['HDB'].get('username', '').strip()
@@ -253,7 +255,7 @@ class HDB():
 
             # Validate and write the new torrent
             new_torrent.validate_piece_size()
-            new_torrent.generate(callback=prep.torf_cb, interval=5)
+            await asyncio.to_thread(prep.hash_torrent, new_torrent, meta)
             new_torrent.write(torrent_path, overwrite=True)
 
         # Proceed with the upload process
@@ -299,10 +301,9 @@ class HDB():
                 console.print(url)
                 console.print(data)
             else:
-                with requests.Session() as session:
-                    cookiefile = f"{meta['base_dir']}/data/cookies/HDB.txt"
-                    session.cookies.update(await common.parseCookieFile(cookiefile))
-                    up = session.post(url=url, data=data, files=files)
+                cookiefile = f"{meta['base_dir']}/data/cookies/HDB.txt"
+                with get_cookie_session(self.tracker, cookiefile) as session:
+                    up = await asyncio.to_thread(session.post, url=url, data=data, files=files)
                     torrentFile.close()
 
                     # Match url to verify successful upload
@@ -334,14 +335,13 @@ class HDB():
         if int(meta.get('tvdb_id', '0')) != 0:
             data['tvdb'] = {'id': meta['tvdb_id']}
         try:
-            response = requests.get(url=url, data=json.dumps(data))
+            response = await self.http.get(url=url, data=json.dumps(data))
             response = response.json()
             for each in response['data']:
                 result = each['name']
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your passkey is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -363,7 +363,7 @@ class HDB():
             'passkey': self.passkey
         }
         try:
-            r = requests.post(url, data=json.dumps(data)).json()
+            r = (await self.http.post(url, data=json.dumps(data))).json()
             if r.get('status', 5) == 0:
                 return True
             return False
@@ -371,19 +371,21 @@ class HDB():
             return False
 
     async def validate_cookies(self, meta):
-        common = COMMON(config=self.config)
         url = "https://hdbits.org"
         cookiefile = f"{meta['base_dir']}/data/cookies/HDB.txt"
         if os.path.exists(cookiefile):
-            with requests.Session() as session:
-                session.cookies.update(await common.parseCookieFile(cookiefile))
-                resp = session.get(url=url)
+            cookie_session = get_cookie_session(self.tracker, cookiefile)
+            with cookie_session as session:
+                if cookie_session.validated:
+                    return True
+                resp = await asyncio.to_thread(session.get, url=url)
                 if meta['debug']:
                     console.print('[cyan]Cookies:')
                     console.print(session.cookies.get_dict())
                     console.print("\n\n")
                     console.print(resp.text)
                 if resp.text.find("""<a href="/logout.php">Logout</a>""") != -1:
+                    cookie_session.validated = True
                     return True
                 else:
                     return False
@@ -399,7 +401,7 @@ class HDB():
             'passkey': self.passkey,
             'id': id
         }
-        r = requests.get(url=api_url, data=json.dumps(data))
+        r = await self.http.get(url=api_url, data=json.dumps(data))
         filename = r.json()['data'][0]['filename']
 
         # Download new .torrent
@@ -409,7 +411,7 @@ class HDB():
             'id': id
         }
 
-        r = requests.get(url=download_url, params=params)
+        r = await self.http.get(url=download_url, params=params)
         with open(torrent_path, "wb") as tor:
             tor.write(r.content)
         return
@@ -481,7 +483,7 @@ class HDB():
             hdbimg_screen_count = len(images)
         for i in range(hdbimg_screen_count):
             files[f'images_files[{i}]'] = open(images[i], 'rb')
-        r = requests.post(url=url, data=data, files=files)
+        r = await self.http.post(url=url, data=data, files=files)
         image_bbcode = r.text
         return image_bbcode
 
@@ -493,7 +495,7 @@ class HDB():
             "passkey": self.passkey,
             "id": hdb_id
         }
-        response = requests.get(url, json=data)
+        response = await self.http.get(url, json=data)
         if response.ok:
             try:
                 response = response.json()
@@ -553,7 +555,7 @@ class HDB():
             console.print(f"[green]Searching HDB for file: [bold yellow]{os.path.basename(search_term)}[/bold yellow]")
             # console.print(f"[yellow]Using this data: {data}")
 
-        response = requests.get(url, json=data)
+        response = await self.http.get(url, json=data)
 
         if response.ok:
             try:
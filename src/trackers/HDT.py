@@ -1,4 +1,3 @@
-import requests
 import asyncio
 import re
 import os
@@ -9,6 +8,8 @@ from bs4 import BeautifulSoup
 from unidecode import unidecode
 from pymediainfo import MediaInfo
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
+from src.cookiesessions import get_cookie_session
 from src.exceptions import *  # noqa F403
 from src.console import console
 
@@ -17,6 +18,7 @@ class HDT():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'HDT'
         self.source_flag = 'hd-torrents.org'
         self.username = config['TRACKERS'][self.tracker].get('username', '').strip()
@@ -179,18 +181,13 @@ class HDT():
                 console.print(data)
                 console.print("Files being sent:", style="bold blue")
                 console.print(files)
-            with requests.Session() as session:
-                cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/HDT.txt")
-
+            cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/HDT.txt")
+            with get_cookie_session(self.tracker, cookiefile) as session:
                 if meta['debug']:
                     console.print(f"Cookie file path: {cookiefile}")
-
-                session.cookies.update(await common.parseCookieFile(cookiefile))
-
-                if meta['debug']:
                     console.print(f"Session cookies: {session.cookies}")
 
-                up = session.post(url=url, data=data, files=files, headers=headers)
+                up = await asyncio.to_thread(session.post, url=url, data=data, files=files, headers=headers)
                 torrentFile.close()
 
                 # Debug response
@@ -224,11 +221,8 @@ class HDT():
         headers = {
             'User-Agent': f'Upload Assistant/2.2 ({platform.system()} {platform.release()})'
         }
-        with requests.Session() as session:
-            common = COMMON(config=self.config)
-            cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/HDT.txt")
-            session.cookies.update(await common.parseCookieFile(cookiefile))
-
+        cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/HDT.txt")
+        with get_cookie_session(self.tracker, cookiefile) as session:
             search_url = "https://hd-torrents.net/torrents.php"
             csrfToken = await self.get_csrfToken(session, search_url)
             if int(meta['imdb_id'].replace('tt', '')) != 0:
@@ -247,8 +241,7 @@ class HDT():
                     'options': '3'
                 }
 
-            r = session.get(search_url, params=params, headers=headers)
-            await asyncio.sleep(0.5)
+            r = await asyncio.to_thread(session.get, search_url, params=params, headers=headers)
             soup = BeautifulSoup(r.text, 'html.parser')
             find = soup.find_all('a', href=True)
             for each in find:
@@ -266,21 +259,23 @@ class HDT():
         return True
 
     async def validate_cookies(self, meta, cookiefile):
-        common = COMMON(config=self.config)
         url = "https://hd-torrents.net/index.php"
         headers = {
             'User-Agent': f'Upload Assistant/2.2 ({platform.system()} {platform.release()})'
         }
         cookiefile = f"{meta['base_dir']}/data/cookies/HDT.txt"
         if os.path.exists(cookiefile):
-            with requests.Session() as session:
-                session.cookies.update(await common.parseCookieFile(cookiefile))
-                res = session.get(url=url, headers=headers)
+            cookie_session = get_cookie_session(self.tracker, cookiefile)
+            with cookie_session as session:
+                if cookie_session.validated:
+                    return True
+                res = await asyncio.to_thread(session.get, url=url, headers=headers)
                 if meta['debug']:
                     console.print('[cyan]Cookies:')
                     console.print(session.cookies.get_dict())
                     console.print(res.url)
                 if res.text.find("Logout") != -1:
+                    cookie_session.validated = True
                     return True
                 else:
                     return False
@@ -291,8 +286,7 @@ class HDT():
         headers = {
             'User-Agent': f'Upload Assistant/2.2 ({platform.system()} {platform.release()})'
         }
-        r = session.get(url, headers=headers)
-        await asyncio.sleep(0.5)
+        r = await asyncio.to_thread(session.get, url, headers=headers)
         soup = BeautifulSoup(r.text, 'html.parser')
         csrfToken = soup.find('input', {'name': 'csrfToken'}).get('value')
         return csrfToken
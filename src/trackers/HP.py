@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 import platform
 from str2bool import str2bool
 import bencodepy
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -21,6 +21,7 @@ class HP():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'HP'
         self.source_flag = 'Hidden-Palace'
         self.upload_url = 'https://hidden-palace.net/api/torrents/upload'
@@ -130,7 +131,7 @@ class HP():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 console.print(response.json())
             except Exception:
@@ -158,7 +159,7 @@ class HP():
             params['name'] = params['name'] + meta['edition']
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
@@ -167,7 +168,6 @@ class HP():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -182,7 +182,7 @@ class HP():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 from str2bool import str2bool
 import os
@@ -10,6 +9,7 @@ import bencodepy
 import cli_ui
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -23,6 +23,7 @@ class HUNO():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'HUNO'
         self.source_flag = 'HUNO'
         self.search_url = 'https://hawke.uno/api/torrents/filter'
@@ -444,7 +445,7 @@ class HUNO():
 
         if meta['debug'] is False:
             try:
-                response = requests.post(
+                response = await self.http.post(
                     url=self.upload_url,
                     files=files,
                     data=data,
@@ -694,7 +695,7 @@ class HUNO():
         if meta.get('edition', "") != "":
             params['name'] + meta['edition']
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
@@ -703,7 +704,6 @@ class HUNO():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -718,7 +718,7 @@ class HUNO():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
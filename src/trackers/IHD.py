@@ -1,5 +1,4 @@
 # import discord
-import asyncio
 import glob
 import os
 import platform
@@ -11,6 +10,7 @@ from str2bool import str2bool
 
 from src.console import console
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 
 
 class IHD:
@@ -24,6 +24,7 @@ class IHD:
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = "IHD"
         self.source_flag = "IHD"
         self.upload_url = "https://infinityhd.net/api/torrents/upload"
@@ -254,7 +255,7 @@ class IHD:
             data["season_number"] = meta.get("season_int", "0")
             data["episode_number"] = meta.get("episode_int", "0")
         if meta["debug"] is False:
-            response = requests.post(
+            response = await self.http.post(
                 url=self.upload_url,
                 files=files,
                 data=data,
@@ -436,7 +437,7 @@ class IHD:
             params["name"] = params["name"] + f" {meta['edition']}"
 
         try:
-            response = requests.get(url=self.search_url, params=params, headers=headers)
+            response = await self.http.get(url=self.search_url, params=params, headers=headers)
             response = response.json()
             for each in response["data"]:
                 result = [each][0]["attributes"]["name"]
@@ -447,7 +448,6 @@ class IHD:
             console.print(
                 "[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect"
             )
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -462,7 +462,7 @@ class IHD:
         headers = self.get_headers()
 
         try:
-            response = requests.get(url=self.search_url, params=params, headers=headers)
+            response = await self.http.get(url=self.search_url, params=params, headers=headers)
             response.raise_for_status()
             response_data = response.json()
 
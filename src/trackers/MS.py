@@ -1,5 +1,4 @@
 # import discord
-import asyncio
 import glob
 import os
 import platform
@@ -11,6 +10,7 @@ from str2bool import str2bool
 
 from src.console import console
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 
 
 class MS:
@@ -24,6 +24,7 @@ class MS:
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = "MS"
         self.source_flag = "MidnightScene"
         self.upload_url = "https://midnightscene.cc/api/torrents/upload"
@@ -136,7 +137,7 @@ class MS:
             data["season_number"] = meta.get("season_int", "0")
             data["episode_number"] = meta.get("episode_int", "0")
         if meta["debug"] is False:
-            response = requests.post(
+            response = await self.http.post(
                 url=self.upload_url,
                 files=files,
                 data=data,
@@ -314,7 +315,7 @@ class MS:
             params["name"] = params["name"] + f" {meta['edition']}"
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response["data"]:
                 result = [each][0]["attributes"]["name"]
@@ -325,7 +326,6 @@ class MS:
             console.print(
                 "[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect"
             )
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -340,7 +340,7 @@ class MS:
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
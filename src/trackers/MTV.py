@@ -6,14 +6,15 @@ from torf import Torrent
 import xml.etree.ElementTree
 import os
 import cli_ui
-import pickle
 import re
 from pathlib import Path
 from str2bool import str2bool
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
+from src.cookiesessions import get_cookie_session, save_cookies
 from datetime import datetime
 import glob
-import multiprocessing
+import copy
 from urllib.parse import urlparse
 
 
@@ -28,6 +29,7 @@ class MTV():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'MTV'
         self.source_flag = 'MTV'
         self.upload_url = 'https://www.morethantv.me/upload.php'
@@ -116,7 +118,7 @@ class MTV():
 
                 new_torrent.piece_size = 8 * 1024 * 1024
                 new_torrent.validate_piece_size()
-                new_torrent.generate(callback=prep.torf_cb, interval=5)
+                await asyncio.to_thread(prep.hash_torrent, new_torrent, meta)
                 new_torrent.write(f"{meta['base_dir']}/tmp/{meta['uuid']}/MTV.torrent", overwrite=True)
 
                 torrent_filename = "MTV"
@@ -166,10 +168,8 @@ class MTV():
         }
 
         if not meta['debug']:
-            with requests.Session() as session:
-                with open(cookiefile, 'rb') as cf:
-                    session.cookies.update(pickle.load(cf))
-                response = session.post(url=self.upload_url, data=data, files=files)
+            with get_cookie_session(self.tracker, cookiefile) as session:
+                response = await asyncio.to_thread(session.post, url=self.upload_url, data=data, files=files)
                 try:
                     if "torrents.php" in response.url:
                         console.print(response.url)
@@ -235,26 +235,13 @@ class MTV():
                     console.print(f"[yellow]Insufficient screenshots found: generating {multi_screens} screenshots.")
 
                 if meta['is_disc'] == "BDMV":
-                    s = multiprocessing.Process(
-                        target=prep.disc_screenshots,
-                        args=(f"FILE_{img_host_index}", meta['bdinfo'], folder_id, base_dir,
-                              meta.get('vapoursynth', False), [], meta.get('ffdebug', False), img_host_index)
-                    )
+                    await asyncio.to_thread(prep.disc_screenshots, copy.deepcopy(meta), f"FILE_{img_host_index}", meta['bdinfo'], folder_id, base_dir,
+                                            meta.get('vapoursynth', False), [], meta.get('ffdebug', False), img_host_index)
                 elif meta['is_disc'] == "DVD":
-                    s = multiprocessing.Process(
-                        target=prep.dvd_screenshots,
-                        args=(meta, 0, None, True)
-                    )
+                    await asyncio.to_thread(prep.dvd_screenshots, copy.deepcopy(meta), 0, None, True)
                 else:
-                    s = multiprocessing.Process(
-                        target=prep.screenshots,
-                        args=(path, f"{filename}", meta['uuid'], base_dir,
-                              meta, multi_screens + 1, True, None)
-                    )
-
-                s.start()
-                while s.is_alive():
-                    await asyncio.sleep(1)
+                    await asyncio.to_thread(prep.screenshots, path, f"{filename}", meta['uuid'], base_dir,
+                                            copy.deepcopy(meta), multi_screens + 1, True, None)
 
                 if meta['is_disc'] == "DVD":
                     existing_screens = glob.glob(f"{meta['base_dir']}/tmp/{meta['uuid']}/{meta['discs'][0]['name']}-*.png")
@@ -558,7 +545,7 @@ class MTV():
             'apikey': self.config['TRACKERS'][self.tracker]['api_key'].strip(),
         }
         try:
-            r = requests.get(url, params=params)
+            r = await self.http.get(url, params=params)
             if not r.ok:
                 if "unauthorized api key" in r.text.lower():
                     console.print("[red]Invalid API Key")
@@ -570,15 +557,17 @@ class MTV():
     async def validate_cookies(self, meta, cookiefile):
         url = "https://www.morethantv.me/index.php"
         if os.path.exists(cookiefile):
-            with requests.Session() as session:
-                with open(cookiefile, 'rb') as cf:
-                    session.cookies.update(pickle.load(cf))
-                resp = session.get(url=url)
+            cookie_session = get_cookie_session(self.tracker, cookiefile)
+            with cookie_session as session:
+                if cookie_session.validated:
+                    return True
+                resp = await asyncio.to_thread(session.get, url=url)
                 if meta['debug']:
                     console.log('[cyan]Validate Cookies:')
                     console.log(session.cookies.get_dict())
                     console.log(resp.url)
                 if resp.text.find("Logout") != -1:
+                    cookie_session.validated = True
                     return True
                 else:
                     return False
@@ -588,10 +577,8 @@ class MTV():
     async def get_auth(self, cookiefile):
         url = "https://www.morethantv.me/index.php"
         if os.path.exists(cookiefile):
-            with requests.Session() as session:
-                with open(cookiefile, 'rb') as cf:
-                    session.cookies.update(pickle.load(cf))
-                resp = session.get(url=url)
+            with get_cookie_session(self.tracker, cookiefile) as session:
+                resp = await asyncio.to_thread(session.get, url=url)
                 auth = resp.text.rsplit('authkey=', 1)[1][:32]
                 return auth
 
@@ -607,11 +594,11 @@ class MTV():
                 'iplocked': 1,
                 # 'ssl' : 'yes'
             }
-            res = session.get(url="https://www.morethantv.me/login")
+            res = await asyncio.to_thread(session.get, url="https://www.morethantv.me/login")
             token = res.text.rsplit('name="token" value="', 1)[1][:48]
             # token and CID from cookie needed for post to login
             payload["token"] = token
-            resp = session.post(url=url, data=payload)
+            resp = await asyncio.to_thread(session.post, url=url, data=payload)
 
             # handle 2fa
             if resp.url.endswith('twofactor/login'):
@@ -627,12 +614,11 @@ class MTV():
                     'code': mfa_code,
                     'submit': 'login'
                 }
-                resp = session.post(url="https://www.morethantv.me/twofactor/login", data=two_factor_payload)
+                resp = await asyncio.to_thread(session.post, url="https://www.morethantv.me/twofactor/login", data=two_factor_payload)
             # checking if logged in
             if 'authkey=' in resp.text:
                 console.print('[green]Successfully logged in to MTV')
-                with open(cookiefile, 'wb') as cf:
-                    pickle.dump(session.cookies, cf)
+                save_cookies(cookiefile, session.cookies)
             else:
                 console.print('[bold red]Something went wrong while trying to log into MTV')
                 await asyncio.sleep(1)
@@ -657,7 +643,7 @@ class MTV():
             params['q'] = meta['title'].replace(': ', ' ').replace("'", '').replace("'", '')
 
         try:
-            rr = requests.get(url=self.search_url, params=params)
+            rr = await self.http.get(url=self.search_url, params=params)
             if rr is not None:
                 # process search results
                 response_xml = xml.etree.ElementTree.fromstring(rr.text)
@@ -667,13 +653,11 @@ class MTV():
             else:
                 if 'status_message' in rr:
                     console.print(f"[yellow]{rr.get('status_message')}")
-                    await asyncio.sleep(5)
                 else:
                     console.print("[red]Site Seems to be down or not responding to API")
         except Exception:
             console.print("[red]Unable to search for existing torrents on site. Most likely the site is down.")
             dupes.append("FAILED SEARCH")
             print(traceback.print_exc())
-            await asyncio.sleep(5)
 
         return dupes
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 from guessit import guessit
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -18,6 +18,7 @@ class NBL():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'NBL'
         self.source_flag = 'NBL'
         self.upload_url = 'https://nebulance.io/upload.php'
@@ -62,7 +63,7 @@ class NBL():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data)
+            response = await self.http.post(url=self.upload_url, files=files, data=data)
             try:
                 if response.ok:
                     response = response.json()
@@ -102,7 +103,7 @@ class NBL():
             ]
         }
         try:
-            response = requests.get(url=self.search_url, json=json)
+            response = await self.http.get(url=self.search_url, json=json)
             response = response.json()
             for each in response['result']['items']:
                 if meta['resolution'] in each['tags']:
@@ -113,7 +114,6 @@ class NBL():
                         dupes.append(each['rls_name'])
         except requests.exceptions.JSONDecodeError:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
         except KeyError as e:
             console.print(response)
             console.print("\n\n\n")
@@ -121,7 +121,6 @@ class NBL():
                 console.print(f"Search Term: {search_term}")
                 console.print('[red]NBL API Returned an unexpected response, please manually check for dupes')
                 dupes.append("ERROR: PLEASE CHECK FOR EXISTING RELEASES MANUALLY")
-                await asyncio.sleep(5)
             else:
                 console.print_exception()
         except Exception:
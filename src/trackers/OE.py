@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 from str2bool import str2bool
 import platform
@@ -9,6 +8,7 @@ import os
 import cli_ui
 from src.bbcode import BBCODE
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 import bencodepy
 
@@ -23,6 +23,7 @@ class OE():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'OE'
         self.source_flag = 'OE'
         self.search_url = 'https://onlyencodes.cc/api/torrents/filter'
@@ -116,7 +117,7 @@ class OE():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 resp_json = response.json()
                 console.print(resp_json)
@@ -349,14 +350,13 @@ class OE():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -371,7 +371,7 @@ class OE():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
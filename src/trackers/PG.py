@@ -1,5 +1,4 @@
 # import discord
-import asyncio
 import glob
 import os
 import platform
@@ -11,6 +10,7 @@ from str2bool import str2bool
 
 from src.console import console
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 
 
 class PG:
@@ -24,6 +24,7 @@ class PG:
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = "PG"
         self.source_flag = "PeerGarden"
         self.upload_url = "https://peergarden.org/api/torrents/upload"
@@ -139,7 +140,7 @@ class PG:
             data["season_number"] = meta.get("season_int", "0")
             data["episode_number"] = meta.get("episode_int", "0")
         if meta["debug"] is False:
-            response = requests.post(
+            response = await self.http.post(
                 url=self.upload_url,
                 files=files,
                 data=data,
@@ -321,7 +322,7 @@ class PG:
             params["name"] = params["name"] + f" {meta['edition']}"
 
         try:
-            response = requests.get(url=self.search_url, params=params, headers=headers)
+            response = await self.http.get(url=self.search_url, params=params, headers=headers)
             response = response.json()
             for each in response["data"]:
                 result = [each][0]["attributes"]["name"]
@@ -332,7 +333,6 @@ class PG:
             console.print(
                 "[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect"
             )
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -347,7 +347,7 @@ class PG:
         headers = self.get_headers()
 
         try:
-            response = requests.get(url=self.search_url, params=params, headers=headers)
+            response = await self.http.get(url=self.search_url, params=params, headers=headers)
             response.raise_for_status()
             response_data = response.json()
 
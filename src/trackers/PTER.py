@@ -10,6 +10,7 @@ import pickle
 from unidecode import unidecode
 from urllib.parse import urlparse
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.exceptions import *  # noqa E403
 from src.console import console
 
@@ -18,6 +19,7 @@ class PTER():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'PTER'
         self.source_flag = 'PTER'
         self.passkey = str(config['TRACKERS']['PTER'].get('passkey', '')).strip()
@@ -395,7 +397,7 @@ class PTER():
 
     async def download_new_torrent(self, id, torrent_path):
         download_url = f"https://pterclub.com/download.php?id={id}&passkey={self.passkey}"
-        r = requests.get(url=download_url)
+        r = await self.http.get(url=download_url)
         if r.status_code == 200:
             with open(torrent_path, "wb") as tor:
                 tor.write(r.content)
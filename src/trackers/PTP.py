@@ -1,5 +1,4 @@
 import cli_ui
-import requests
 import asyncio
 import re
 import os
@@ -7,12 +6,14 @@ from pathlib import Path
 from str2bool import str2bool
 import json
 import glob
-import multiprocessing
+import copy
 import platform
-import pickle
 import click
 from pymediainfo import MediaInfo
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
+from src.mediainfocache import get_file_mediainfo
+from src.cookiesessions import get_cookie_session
 from src.bbcode import BBCODE
 from src.exceptions import *  # noqa F403
 from src.console import console
@@ -24,6 +25,7 @@ class PTP():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'PTP'
         self.source_flag = 'PTP'
         self.api_user = config['TRACKERS']['PTP'].get('ApiUser', '').strip()
@@ -93,8 +95,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url, params=params, headers=headers)
-        await asyncio.sleep(1)
+        response = await self.http.get(url, params=params, headers=headers)
         console.print(f"[green]Searching PTP for: [bold yellow]{filename}[/bold yellow]")
 
         try:
@@ -163,8 +164,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url, params=params, headers=headers)
-        await asyncio.sleep(1)
+        response = await self.http.get(url, params=params, headers=headers)
         try:
             if response.status_code == 200:
                 response = response.json()
@@ -197,8 +197,7 @@ class PTP():
         }
         url = 'https://passthepopcorn.me/torrents.php'
         console.print(f"[yellow]Requesting description from {url} with ID {ptp_torrent_id}")
-        response = requests.get(url, params=params, headers=headers)
-        await asyncio.sleep(1)
+        response = await self.http.get(url, params=params, headers=headers)
 
         ptp_desc = response.text
         # console.print(f"[yellow]Raw description received:\n{ptp_desc[:6800]}...")  # Show first 500 characters for brevity
@@ -244,8 +243,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url=url, headers=headers, params=params)
-        await asyncio.sleep(1)
+        response = await self.http.get(url=url, headers=headers, params=params)
         try:
             response = response.json()
             if response.get("Page") == "Browse":  # No Releases on Site with ID
@@ -272,8 +270,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = "https://passthepopcorn.me/ajax.php"
-        response = requests.get(url=url, params=params, headers=headers)
-        await asyncio.sleep(1)
+        response = await self.http.get(url=url, params=params, headers=headers)
         tinfo = {}
         try:
             response = response.json()
@@ -333,8 +330,7 @@ class PTP():
             'User-Agent': self.user_agent
         }
         url = 'https://passthepopcorn.me/torrents.php'
-        response = requests.get(url=url, headers=headers, params=params)
-        await asyncio.sleep(1)
+        response = await self.http.get(url=url, headers=headers, params=params)
         existing = []
         try:
             response = response.json()
@@ -356,7 +352,7 @@ class PTP():
         headers = {'referer': 'https://ptpimg.me/index.php'}
         url = "https://ptpimg.me/upload.php"
 
-        response = requests.post(url, headers=headers, data=payload)
+        response = await self.http.post(url, headers=headers, data=payload)
         try:
             response = response.json()
             ptpimg_code = response[0]['code']
@@ -689,10 +685,7 @@ class PTP():
                                 new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"FILE_{i}-*.png")
                                 if not new_screens:
                                     use_vs = meta.get('vapoursynth', False)
-                                    ds = multiprocessing.Process(target=prep.disc_screenshots, args=(meta, f"FILE_{i}", each['bdinfo'], meta['uuid'], meta['base_dir'], use_vs, [], meta.get('ffdebug', False), multi_screens, True))
-                                    ds.start()
-                                    while ds.is_alive() is True:
-                                        await asyncio.sleep(1)
+                                    await asyncio.to_thread(prep.disc_screenshots, copy.deepcopy(meta), f"FILE_{i}", each['bdinfo'], meta['uuid'], meta['base_dir'], use_vs, [], meta.get('ffdebug', False), multi_screens, True)
                                     new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"FILE_{i}-*.png")
                                 if new_screens:
                                     uploaded_images, _ = prep.upload_screens(meta, multi_screens, 1, 0, 2, new_screens, {new_images_key: meta[new_images_key]})
@@ -741,10 +734,7 @@ class PTP():
                                 meta[new_images_key] = []
                                 new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"{meta['discs'][i]['name']}-*.png")
                                 if not new_screens:
-                                    ds = multiprocessing.Process(target=prep.dvd_screenshots, args=(meta, i, multi_screens, True))
-                                    ds.start()
-                                    while ds.is_alive() is True:
-                                        await asyncio.sleep(1)
+                                    await asyncio.to_thread(prep.dvd_screenshots, copy.deepcopy(meta), i, multi_screens, True)
                                     new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"{meta['discs'][i]['name']}-*.png")
                                 if new_screens:
                                     uploaded_images, _ = prep.upload_screens(meta, multi_screens, 1, 0, 2, new_screens, {new_images_key: meta[new_images_key]})
@@ -788,7 +778,7 @@ class PTP():
                             desc.write(f"[img]{raw_url}[/img]\n")
                         desc.write("\n")
                     else:
-                        mi_dump = MediaInfo.parse(file, output="STRING", full=False, mediainfo_options={'inform_version': '1'})
+                        mi_dump = get_file_mediainfo(meta, file).text
                         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/TEMP_PTP_MEDIAINFO.txt", "w", newline="", encoding="utf-8") as f:
                             f.write(mi_dump)
                         mi_dump = open(f"{meta['base_dir']}/tmp/{meta['uuid']}/TEMP_PTP_MEDIAINFO.txt", "r", encoding="utf-8").read()
@@ -804,10 +794,7 @@ class PTP():
                             meta[new_images_key] = []
                             new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"FILE_{i}-*.png")
                             if not new_screens:
-                                s = multiprocessing.Process(target=prep.screenshots, args=(file, f"FILE_{i}", meta['uuid'], meta['base_dir'], meta, multi_screens + 1, True, None))
-                                s.start()
-                                while s.is_alive() is True:
-                                    await asyncio.sleep(3)
+                                await asyncio.to_thread(prep.screenshots, file, f"FILE_{i}", meta['uuid'], meta['base_dir'], copy.deepcopy(meta), multi_screens + 1, True, None)
                                 new_screens = glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"FILE_{i}-*.png")
                             if new_screens:
                                 uploaded_images, _ = prep.upload_screens(meta, multi_screens, 1, 0, 2, new_screens, {new_images_key: meta[new_images_key]})
@@ -829,12 +816,11 @@ class PTP():
         if not os.path.exists(f"{meta['base_dir']}/data/cookies"):
             Path(f"{meta['base_dir']}/data/cookies").mkdir(parents=True, exist_ok=True)
         cookiefile = f"{meta['base_dir']}/data/cookies/PTP.pickle"
-        with requests.Session() as session:
+        cookie_session = get_cookie_session(self.tracker, cookiefile)
+        with cookie_session as session:
             loggedIn = False
             if os.path.exists(cookiefile):
-                with open(cookiefile, 'rb') as cf:
-                    session.cookies.update(pickle.load(cf))
-                uploadresponse = session.get("https://passthepopcorn.me/upload.php")
+                uploadresponse = await asyncio.to_thread(session.get, "https://passthepopcorn.me/upload.php")
                 loggedIn = await self.validate_login(uploadresponse)
             else:
                 console.print("[yellow]PTP Cookies not found. Creating new session.")
@@ -849,22 +835,19 @@ class PTP():
                     "keeplogged": "1",
                 }
                 headers = {"User-Agent": self.user_agent}
-                loginresponse = session.post("https://passthepopcorn.me/ajax.php?action=login", data=data, headers=headers)
-                await asyncio.sleep(2)
+                loginresponse = await asyncio.to_thread(session.post, "https://passthepopcorn.me/ajax.php?action=login", data=data, headers=headers)
                 try:
                     resp = loginresponse.json()
                     if resp['Result'] == "TfaRequired":
                         data['TfaType'] = "normal"
                         data['TfaCode'] = cli_ui.ask_string("2FA Required: Please enter 2FA code")
-                        loginresponse = session.post("https://passthepopcorn.me/ajax.php?action=login", data=data, headers=headers)
-                        await asyncio.sleep(2)
+                        loginresponse = await asyncio.to_thread(session.post, "https://passthepopcorn.me/ajax.php?action=login", data=data, headers=headers)
                         resp = loginresponse.json()
                     try:
                         if resp["Result"] != "Ok":
                             raise LoginException("Failed to login to PTP. Probably due to the bad user name, password, announce url, or 2FA code.")  # noqa F405
                         AntiCsrfToken = resp["AntiCsrfToken"]
-                        with open(cookiefile, 'wb') as cf:
-                            pickle.dump(session.cookies, cf)
+                        cookie_session.save()
                     except Exception:
                         raise LoginException(f"Got exception while loading JSON login response from PTP. Response: {loginresponse.text}")  # noqa F405
                 except Exception:
@@ -1003,7 +986,7 @@ class PTP():
 
             # Validate and write the new torrent
             new_torrent.validate_piece_size()
-            new_torrent.generate(callback=prep.torf_cb, interval=5)
+            await asyncio.to_thread(prep.hash_torrent, new_torrent, meta)
             new_torrent.write(torrent_path, overwrite=True)
 
         # Proceed with the upload process
@@ -1020,11 +1003,9 @@ class PTP():
                 console.log(url)
                 console.log(data)
             else:
-                with requests.Session() as session:
-                    cookiefile = f"{meta['base_dir']}/data/cookies/PTP.pickle"
-                    with open(cookiefile, 'rb') as cf:
-                        session.cookies.update(pickle.load(cf))
-                    response = session.post(url=url, data=data, headers=headers, files=files)
+                cookiefile = f"{meta['base_dir']}/data/cookies/PTP.pickle"
+                with get_cookie_session(self.tracker, cookiefile) as session:
+                    response = await asyncio.to_thread(session.post, url=url, data=data, headers=headers, files=files)
                 console.print(f"[cyan]{response.url}")
                 responsetext = response.text
                 # If the response contains our announce URL, then we are on the upload page and the upload wasn't successful.
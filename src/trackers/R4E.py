@@ -10,6 +10,7 @@ import os
 import glob
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -23,6 +24,7 @@ class R4E():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'R4E'
         self.source_flag = 'R4E'
         # self.signature = f"\n[center][url=https://github.com/L4GSP1KE/Upload-Assistant]Created by L4G's Upload Assistant[/url][/center]"
@@ -90,7 +92,7 @@ class R4E():
             data['season_number'] = meta.get('season_int', '0')
             data['episode_number'] = meta.get('episode_int', '0')
         if meta['debug'] is False:
-            response = requests.post(url=url, files=files, data=data, headers=headers)
+            response = await self.http.post(url=url, files=files, data=data, headers=headers)
             try:
 
                 console.print(response.json())
@@ -109,14 +111,14 @@ class R4E():
     async def get_cat_id(self, category_name, tmdb_id):
         if category_name == 'MOVIE':
             movie = tmdb.Movies(tmdb_id)
-            movie_info = movie.info()
+            movie_info = await asyncio.to_thread(movie.info)
             is_docu = self.is_docu(movie_info['genres'])
             category_id = '70'  # Motorsports Movie
             if is_docu:
                 category_id = '66'  # Documentary
         elif category_name == 'TV':
             tv = tmdb.TV(tmdb_id)
-            tv_info = tv.info()
+            tv_info = await asyncio.to_thread(tv.info)
             is_docu = self.is_docu(tv_info['genres'])
             category_id = '79'  # TV Series
             if is_docu:
@@ -164,7 +166,7 @@ class R4E():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + meta['edition']
         try:
-            response = requests.get(url=url, params=params)
+            response = await self.http.get(url=url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
@@ -173,7 +175,6 @@ class R4E():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -188,7 +189,7 @@ class R4E():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 import requests
 import platform
 import re
@@ -10,6 +9,7 @@ import os
 import glob
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -24,6 +24,7 @@ class RF():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'RF'
         self.source_flag = 'ReelFliX'
         self.upload_url = 'https://reelflix.cc/api/torrents/upload'
@@ -104,7 +105,7 @@ class RF():
             'api_token': self.config['TRACKERS'][self.tracker]['api_key'].strip()
         }
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 resp_json = response.json()
                 console.print(resp_json)
@@ -199,7 +200,7 @@ class RF():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + meta['edition']
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
@@ -208,7 +209,6 @@ class RF():
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -223,7 +223,7 @@ class RF():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response.raise_for_status()
             response_data = response.json()
 
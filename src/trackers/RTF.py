@@ -1,13 +1,12 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
-import requests
 import base64
 import re
 import datetime
 import httpx
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -21,6 +20,7 @@ class RTF():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'RTF'
         self.source_flag = 'sunshine'
         self.upload_url = 'https://retroflix.club/api/upload'
@@ -75,7 +75,7 @@ class RTF():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, json=json_data, headers=headers)
+            response = await self.http.post(url=self.upload_url, json=json_data, headers=headers)
             try:
                 console.print(response.json())
 
@@ -116,14 +116,13 @@ class RTF():
             params['search'] = meta['title'].replace(':', '').replace("'", '').replace(",", '')
 
         try:
-            response = requests.get(url=self.search_url, params=params, headers=headers)
+            response = await self.http.get(url=self.search_url, params=params, headers=headers)
             response = response.json()
             for each in response:
                 result = [each][0]['name']
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -134,7 +133,7 @@ class RTF():
             'Authorization': self.config['TRACKERS'][self.tracker]['api_key'].strip(),
         }
 
-        response = requests.get('https://retroflix.club/api/test', headers=headers)
+        response = await self.http.get('https://retroflix.club/api/test', headers=headers)
 
         if response.status_code != 200:
             console.print('[bold red]Your API key is incorrect SO generating a new one')
@@ -1,9 +1,8 @@
 # -*- coding: utf-8 -*-
-import requests
-import asyncio
 import sys
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -17,6 +16,7 @@ class SN():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'SN'
         self.source_flag = 'Swarmazon'
         self.upload_url = 'https://swarmazon.club/api/upload.php'
@@ -94,7 +94,7 @@ class SN():
 
         # Post request with error messages returned:
         if meta['debug'] is False:
-            response = requests.request("POST", url=self.upload_url, data=data, files=files)
+            response = await self.http.request("POST", url=self.upload_url, data=data, files=files)
     
         # Check if the response is actually JSON before parsing
             if response.status_code == 200 and 'application/json' in response.headers.get('Content-Type', ''):
@@ -153,7 +153,7 @@ class SN():
 
         try:
             # Standard GET request to the search API
-            response = requests.get(url=self.search_url, params=params, timeout=10)
+            response = await self.http.get(url=self.search_url, params=params, timeout=10)
         
             # Defensive check: Ensure the response is actually JSON before parsing
             if response.status_code == 200 and 'application/json' in response.headers.get('Content-Type', ''):
@@ -172,5 +172,4 @@ class SN():
 
         except Exception as e:
             console.print(f'[red]Unexpected error during search: {e}')
-            await asyncio.sleep(5)
         return dupes
\ No newline at end of file
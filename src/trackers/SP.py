@@ -1,5 +1,3 @@
-import asyncio
-import requests
 import platform
 import re
 import os
@@ -7,12 +5,14 @@ import glob
 import bencodepy
 from str2bool import str2bool
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
 class SP():
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'SP'
         self.source_flag = 'seedpool.org'
         self.upload_url = 'https://seedpool.org/api/torrents/upload'
@@ -174,7 +174,7 @@ class SP():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 console.print(response.json())
             except Exception:
@@ -205,13 +205,12 @@ class SP():
             params['name'] += f" {meta['edition']}"
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = each['attributes']['name']
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
-import asyncio
 from torf import Torrent
-import requests
 from src.console import console
 from pprint import pprint
 import base64
@@ -11,6 +9,7 @@ import os
 import traceback
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 
 
 # from pprint import pprint
@@ -20,6 +19,7 @@ class SPD():
     def __init__(self, config):
         self.url = "https://speedapp.io"
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'SPD'
         self.source_flag = 'speedapp.io'
         self.search_url = 'https://speedapp.io/api/torrent'
@@ -87,14 +87,14 @@ class SPD():
         headers = {'Authorization': 'Bearer ' + self.config['TRACKERS'][self.tracker]['api_key'].strip()}
 
         if meta['debug'] is False:
-            response = requests.request("POST", url=self.upload_url, json=data, headers=headers)
+            response = await self.http.request("POST", url=self.upload_url, json=data, headers=headers)
             try:
                 print(response.json())
                 # response = {'status': True, 'error': False, 'downloadUrl': '/api/torrent/383435/download', 'torrent': {'id': 383435, 'name': 'name-with-full-stops', 'slug': 'name-with-dashs', 'category_id': 3}}
                 # downloading the torrent from site as it adds a tonne of different trackers and the source is different all the time.
                 try:
                     # torrent may not dl and may not provide error if machine is under load or network connection usage high.
-                    with requests.get(url=self.url + response.json()['downloadUrl'], stream=True, headers=headers) as r:
+                    with await self.http.get(url=self.url + response.json()['downloadUrl'], stream=True, headers=headers) as r:
                         # replacing L4g/torf created torrent so it will be added to the client.
                         with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]{meta['clean_name']}.torrent",
                                   'wb') as f:
@@ -141,13 +141,12 @@ class SPD():
             params['search'] = meta['title'].replace(':', '').replace("'", '').replace(",", '')
 
         try:
-            response = requests.get(url=self.search_url, params=params, headers=headers)
+            response = await self.http.get(url=self.search_url, params=params, headers=headers)
             response = response.json()
             for each in response:
                 result = [each][0]['name']
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
\ No newline at end of file
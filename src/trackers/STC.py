@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
-import asyncio
-import requests
 from str2bool import str2bool
 import platform
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -18,6 +17,7 @@ class STC():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'STC'
         self.source_flag = 'STC'
         self.upload_url = 'https://skipthecommercials.xyz/api/torrents/upload'
@@ -87,7 +87,7 @@ class STC():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 response_json = response.json()
                 console.print(response_json)
@@ -185,13 +185,12 @@ class STC():
         if meta.get('edition', "") != "":
             params['name'] + meta['edition']
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             for each in response['data']:
                 result = [each][0]['attributes']['name']
                 dupes.append(result)
         except Exception:
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
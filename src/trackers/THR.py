@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import asyncio
 from torf import Torrent
-import requests
 import json
 import glob
 import cli_ui
@@ -10,6 +9,7 @@ import re
 import platform
 from unidecode import unidecode
 
+from src.network import get_http_client
 from src.console import console
 
 
@@ -23,6 +23,7 @@ class THR():
     """
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.username = config['TRACKERS']['THR'].get('username')
         self.password = config['TRACKERS']['THR'].get('password')
         self.banned_groups = [""]
@@ -195,10 +196,8 @@ class THR():
             desc.write("[/quote]")
             desc.write(base)
             # REHOST IMAGES
-            os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
-            image_glob = glob.glob("*.png")
-            if 'POSTER.png' in image_glob:
-                image_glob.remove('POSTER.png')
+            image_glob = glob.glob(os.path.join(glob.escape(f"{meta['base_dir']}/tmp/{meta['uuid']}"), "*.png"))
+            image_glob = [image for image in image_glob if os.path.basename(image) != 'POSTER.png']
             image_list = []
             for image in image_glob:
                 url = "https://img2.torrenthr.org/api/1/upload"
@@ -207,7 +206,7 @@ class THR():
                     # 'source' : base64.b64encode(open(image, "rb").read()).decode('utf8')
                 }
                 files = {'source': open(image, 'rb')}
-                response = requests.post(url, data=data, files=files)
+                response = await self.http.post(url, data=data, files=files)
                 try:
                     response = response.json()
                     # med_url = response['image']['medium']['url']
@@ -233,7 +232,7 @@ class THR():
                     'theme': self.config['TRACKERS']['THR'].get('pronfo_theme', 'gray'),
                     'rapi': self.config['TRACKERS']['THR'].get('pronfo_rapi_id')
                 }
-                response = requests.post(pronfo_url, data=data)
+                response = await self.http.post(pronfo_url, data=data)
                 try:
                     response = response.json()
                     if response.get('error', True) is False:
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 # import discord
-import requests
 import platform
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 from pathlib import Path
 
@@ -30,6 +30,7 @@ class TL():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'TL'
         self.source_flag = 'TorrentLeech.org'
         self.upload_url = 'https://www.torrentleech.org/torrents/upload/apiupload'
@@ -104,7 +105,7 @@ class TL():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers)
             if not response.text.isnumeric():
                 console.print(f'[red]{response.text}')
         else:
@@ -1,4 +1,3 @@
-import pickle
 from bs4 import BeautifulSoup
 import requests
 import asyncio
@@ -9,6 +8,8 @@ from str2bool import str2bool
 from unidecode import unidecode
 from urllib.parse import urlparse
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
+from src.cookiesessions import get_cookie_session, save_cookies
 from src.exceptions import *  # noqa #F405
 from src.console import console
 
@@ -17,6 +18,7 @@ class TTG():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'TTG'
         self.source_flag = 'TTG'
         self.username = str(config['TRACKERS']['TTG'].get('username', '')).strip()
@@ -158,11 +160,9 @@ class TTG():
                 console.print(url)
                 console.print(data)
             else:
-                with requests.Session() as session:
-                    cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/TTG.pkl")
-                    with open(cookiefile, 'rb') as cf:
-                        session.cookies.update(pickle.load(cf))
-                    up = session.post(url=url, data=data, files=files)
+                cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/TTG.pkl")
+                with get_cookie_session(self.tracker, cookiefile) as session:
+                    up = await asyncio.to_thread(session.post, url=url, data=data, files=files)
                     torrentFile.close()
                     mi_dump.close()
 
@@ -179,11 +179,8 @@ class TTG():
 
     async def search_existing(self, meta, disctype):
         dupes = []
-        with requests.Session() as session:
-            cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/TTG.pkl")
-            with open(cookiefile, 'rb') as cf:
-                session.cookies.update(pickle.load(cf))
-
+        cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/TTG.pkl")
+        with get_cookie_session(self.tracker, cookiefile) as session:
             if int(meta['imdb_id'].replace('tt', '')) != 0:
                 imdb = f"imdb{meta['imdb_id'].replace('tt', '')}"
             else:
@@ -195,8 +192,7 @@ class TTG():
             else:
                 res_type = meta['resolution']
             search_url = f"https://totheglory.im/browse.php?search_field= {imdb} {res_type}"
-            r = session.get(search_url)
-            await asyncio.sleep(0.5)
+            r = await asyncio.to_thread(session.get, search_url)
             soup = BeautifulSoup(r.text, 'html.parser')
             find = soup.find_all('a', href=True)
             for each in find:
@@ -228,15 +224,17 @@ class TTG():
     async def validate_cookies(self, meta, cookiefile):
         url = "https://totheglory.im"
         if os.path.exists(cookiefile):
-            with requests.Session() as session:
-                with open(cookiefile, 'rb') as cf:
-                    session.cookies.update(pickle.load(cf))
-                resp = session.get(url=url)
+            cookie_session = get_cookie_session(self.tracker, cookiefile)
+            with cookie_session as session:
+                if cookie_session.validated:
+                    return True
+                resp = await asyncio.to_thread(session.get, url=url)
                 if meta['debug']:
                     console.print('[cyan]Cookies:')
                     console.print(session.cookies.get_dict())
                     console.print(resp.url)
                 if resp.text.find("""<a href="/logout.php">Logout</a>""") != -1:
+                    cookie_session.validated = True
                     return True
                 else:
                     return False
@@ -252,7 +250,7 @@ class TTG():
             'passan': self.passan
         }
         with requests.Session() as session:
-            response = session.post(url, data=data)
+            response = await asyncio.to_thread(session.post, url, data=data)
             await asyncio.sleep(0.5)
             if response.url.endswith('2fa.php'):
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -263,12 +261,11 @@ class TTG():
                     'uid': self.uid
                 }
                 two_factor_url = "https://totheglory.im/take2fa.php"
-                response = session.post(two_factor_url, data=two_factor_data)
+                response = await asyncio.to_thread(session.post, two_factor_url, data=two_factor_data)
                 await asyncio.sleep(0.5)
             if response.url.endswith('my.php'):
                 console.print('[green]Successfully logged into TTG')
-                with open(cookiefile, 'wb') as cf:
-                    pickle.dump(session.cookies, cf)
+                save_cookies(cookiefile, session.cookies)
             else:
                 console.print('[bold red]Something went wrong')
                 await asyncio.sleep(1)
@@ -328,7 +325,7 @@ class TTG():
 
     async def download_new_torrent(self, id, torrent_path):
         download_url = f"https://totheglory.im/dl/{id}/{self.passkey}"
-        r = requests.get(url=download_url)
+        r = await self.http.get(url=download_url)
         if r.status_code == 200:
             with open(torrent_path, "wb") as tor:
                 tor.write(r.content)
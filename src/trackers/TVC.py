@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 from str2bool import str2bool
 import traceback
 import cli_ui
@@ -10,6 +9,7 @@ from src.bbcode import BBCODE
 import json
 
 from src.trackers.COMMON import COMMON
+from src.network import get_http_client
 from src.console import console
 
 
@@ -24,6 +24,7 @@ class TVC():
 
     def __init__(self, config):
         self.config = config
+        self.http = get_http_client(config)
         self.tracker = 'TVC'
         self.source_flag = 'TVCHAOS'
         self.upload_url = 'https://tvchaosuk.com/api/torrents/upload'
@@ -208,7 +209,7 @@ class TVC():
             return
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
             try:
                 # some reason this does not return json instead it returns something like below.
                 # b'application/x-bittorrent\n{"success":true,"data":"https:\\/\\/tvchaosuk.com\\/torrent\\/download\\/164633.REDACTED","message":"Torrent uploaded successfully."}'
@@ -236,28 +237,28 @@ class TVC():
         import tmdbsimple as tmdb
         if meta['category'] == "MOVIE":
             movie = tmdb.Movies(meta['tmdb'])
-            response = movie.info()
+            response = await asyncio.to_thread(movie.info)
         else:
             tv = tmdb.TV(meta['tmdb'])
-            response = tv.info()
+            response = await asyncio.to_thread(tv.info)
 
         # TVC stuff
         if meta['category'] == "TV":
             if hasattr(tv, 'release_dates'):
-                meta['release_dates'] = tv.release_dates()
+                meta['release_dates'] = await asyncio.to_thread(tv.release_dates)
 
             if hasattr(tv, 'networks') and len(tv.networks) != 0 and 'name' in tv.networks[0]:
                 meta['networks'] = tv.networks[0]['name']
 
         try:
             if 'tv_pack' in meta and not meta['tv_pack']:
-                episode_info = tmdb.TV_Episodes(meta['tmdb'], meta['season_int'], meta['episode_int']).info()
+                episode_info = await asyncio.to_thread(tmdb.TV_Episodes(meta['tmdb'], meta['season_int'], meta['episode_int']).info)
 
                 meta['episode_airdate'] = episode_info['air_date']
                 meta['episode_name'] = episode_info['name']
                 meta['episode_overview'] = episode_info['overview']
             if 'tv_pack' in meta and meta['tv_pack']:
-                season_info = tmdb.TV_Seasons(meta['tmdb'], meta['season_int']).info()
+                season_info = await asyncio.to_thread(tmdb.TV_Seasons(meta['tmdb'], meta['season_int']).info)
                 meta['season_air_first_date'] = season_info['air_date']
 
                 if hasattr(tv, 'first_air_date'):
@@ -300,7 +301,7 @@ class TVC():
         }
 
         try:
-            response = requests.get(url=self.search_url, params=params)
+            response = await self.http.get(url=self.search_url, params=params)
             response = response.json()
             if "message" in response and response["message"] == "No Torrents Found":
                 return
@@ -312,7 +313,6 @@ class TVC():
             console.print(response)
             console.print(self.search_url, params)
             console.print('[bold red]Unable to search for existing torrents on site. Either the site is down or your API key is incorrect')
-            await asyncio.sleep(5)
 
         return dupes
 
@@ -0,0 +1,74 @@
+import atexit
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import get_context
+
+
+class WorkerPool():
+    """
+    Process pool shared by the screenshot and image optimizing stages.
+
+    The stages run on threads of the main process and submit their tasks here.
+    Workers are spawned on first use and then kept until the run ends, so each
+    release in a queue doesn't pay for starting interpreters and importing
+    src.prep again. The pool size comes from task_limit; a stage can ask for
+    fewer tasks at once.
+    """
+    def __init__(self, size):
+        self.size = max(1, int(size))
+        self.pid = os.getpid()
+        self.executor = ProcessPoolExecutor(max_workers=self.size, mp_context=get_context("spawn"))
+
+    def imap_unordered(self, func, tasks, limit=None):
+        """
+        Runs func on every task and yields the results as they finish, with no
+        more than limit tasks in flight.
+        """
+        limit = max(1, min(int(limit or self.size), self.size))
+        tasks = iter(tasks)
+        pending = set()
+        try:
+            while True:
+                for task in tasks:
+                    pending.add(self.executor.submit(func, task))
+                    if len(pending) >= limit:
+                        break
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self, cancel=False):
+        self.executor.shutdown(wait=True, cancel_futures=cancel)
+
+
+_worker_pool = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool(size=None):
+    """
+    Returns the worker pool of the current process, creating it on first use.
+    """
+    global _worker_pool
+    with _worker_pool_lock:
+        # A forked process gets a copy of its parent's pool, which it can't use
+        if _worker_pool is None or _worker_pool.pid != os.getpid():
+            _worker_pool = WorkerPool(size or os.cpu_count() or 1)
+        return _worker_pool
+
+
+def shutdown_worker_pool(cancel=False):
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is not None and _worker_pool.pid == os.getpid():
+            _worker_pool.shutdown(cancel=cancel)
+        _worker_pool = None
+
+
+atexit.register(shutdown_worker_pool)
@@ -1,65 +1,21 @@
 #!/usr/bin/env python3
 
+import sys
+if __name__ == "__main__" and '--import-profile' in sys.argv:
+    # Started before anything else is imported, so the breakdown covers startup too
+    from src.importprofile import start_import_profile
+    start_import_profile()
+
 import requests
 from src.args import Args
 from src.clients import Clients
 from src.trackers.COMMON import COMMON
-from src.trackers.HUNO import HUNO
-from src.trackers.BLU import BLU
-from src.trackers.BHD import BHD
-from src.trackers.AITHER import AITHER
-from src.trackers.R4E import R4E
-from src.trackers.THR import THR
-from src.trackers.HP import HP
-from src.trackers.PTP import PTP
-from src.trackers.SN import SN
-from src.trackers.ACM import ACM
-from src.trackers.HDB import HDB
-from src.trackers.LCD import LCD
-from src.trackers.TTG import TTG
-from src.trackers.LST import LST
-from src.trackers.FL import FL
-from src.trackers.LT import LT
-from src.trackers.NBL import NBL
-from src.trackers.ANT import ANT
-from src.trackers.PTER import PTER
-from src.trackers.MTV import MTV
-from src.trackers.JPTV import JPTV
-from src.trackers.TL import TL
-from src.trackers.HDT import HDT
-from src.trackers.RF import RF
-from src.trackers.OE import OE
-from src.trackers.BHDTV import BHDTV
-from src.trackers.RTF import RTF
-from src.trackers.OTW import OTW
-from src.trackers.FNP import FNP
-from src.trackers.CBR import CBR
-from src.trackers.UTP import UTP
-from src.trackers.AL import AL
-from src.trackers.SHRI import SHRI
-from src.trackers.TIK import TIK
-from src.trackers.TVC import TVC
-from src.trackers.PSS import PSS
-from src.trackers.ULCX import ULCX
-from src.trackers.SPD import SPD
-from src.trackers.YOINK import YOINK
-from src.trackers.YUS import YUS
-from src.trackers.SP import SP
-from src.trackers.PTT import PTT
-from src.trackers.LUME import LUME
-from src.trackers.STC import STC
-from src.trackers.HHD import HHD
-from src.trackers.DP import DP
-from src.trackers.MS import MS
-from src.trackers.IHD import IHD
-from src.trackers.PG import PG
-from src.trackers.ZNTH import ZNTH
-from src.trackers.RMC import RMC
+from src.trackerregistry import tracker_class_map
+from src.tracing import span, start_trace, save_trace
 import json
 from pathlib import Path
 import asyncio
 import os
-import sys
 import platform
 import shutil
 import glob
@@ -67,11 +23,14 @@ import cli_ui
 import traceback
 import click
 import re
+import copy
+import time
 import aiohttp  # NEW IMPORT ADDED
 
 from src.console import console
 from rich.markdown import Markdown
 from rich.style import Style
+from rich.table import Table
 
 
 cli_ui.setup(color='always', title="Only Uploader")
@@ -90,6 +49,7 @@ except Exception:
         console.print(traceback.print_exc())
 
 from src.prep import Prep  # noqa E402
+from src.workers import shutdown_worker_pool  # noqa E402
 client = Clients(config=config)
 parser = Args(config)
 
@@ -250,7 +210,17 @@ def display_queue(queue, base_dir, queue_name, save_to_log=True):
 
 async def process_meta(meta, base_dir):
     """Process the metadata for each queued path."""
+    prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
+    await prep_release(meta, prep)
+    # Hashing is disk bound and the image host upload is network bound, so run them side by side
+    await asyncio.gather(
+        asyncio.to_thread(upload_release_images, meta, prep),
+        create_base_torrent(meta, Prep(screens=meta['screens'], img_host=meta['imghost'], config=config))
+    )
+
 
+async def prep_release(meta, prep):
+    """Gather the release info, screenshots included, and work out its name."""
     if meta['imghost'] is None:
         meta['imghost'] = config['DEFAULT']['img_host_1']
 
@@ -260,12 +230,18 @@ async def process_meta(meta, base_dir):
             meta['unattended'] = True
             console.print("[yellow]Running in Auto Mode")
 
-    prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
+    if meta.get('uuid', None) is None:
+        meta['uuid'] = os.path.basename(meta['path'])
+    start_trace(meta)
     meta = await prep.gather_prep(meta=meta, mode='cli')
     with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
         json.dump(meta, f, indent=4)
     meta['name_notag'], meta['name'], meta['clean_name'], meta['potential_missing'] = await prep.get_name(meta)
     meta['cutoff'] = int(config['DEFAULT'].get('cutoff_screens', 3))
+
+
+def upload_release_images(meta, prep):
+    """Upload the screenshots to the image host, unless there are enough already."""
     if len(meta.get('image_list', [])) < meta.get('cutoff') and meta.get('skip_imghost_upload', False) is False:
         if 'image_list' not in meta:
             meta['image_list'] = []
@@ -278,6 +254,9 @@ async def process_meta(meta, base_dir):
     elif meta.get('skip_imghost_upload', False) is True and meta.get('image_list', False) is False:
         meta['image_list'] = []
 
+
+async def create_base_torrent(meta, prep):
+    """Reuse or hash BASE.torrent, and make the randomized copies."""
     torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
     if not os.path.exists(torrent_path):
         reuse_torrent = None
@@ -287,17 +266,373 @@ async def process_meta(meta, base_dir):
                 prep.create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
 
         if meta['nohash'] is False and reuse_torrent is None:
-            prep.create_torrent(meta, Path(meta['path']), "BASE")
+            await asyncio.to_thread(prep.create_torrent, meta, Path(meta['path']), "BASE")
         if meta['nohash']:
             meta['client'] = "none"
 
     elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
-        prep.create_torrent(meta, Path(meta['path']), "BASE")
+        await asyncio.to_thread(prep.create_torrent, meta, Path(meta['path']), "BASE")
 
     if int(meta.get('randomized', 0)) >= 1:
         prep.create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
 
 
+api_trackers = [
+    'ACM', 'AITHER', 'AL', 'BHD', 'BLU', 'CBR', 'FNP', 'HUNO', 'JPTV', 'LCD', 'LST', 'LT',
+    'OE', 'OTW', 'PSS', 'RF', 'R4E', 'SHRI', 'TIK', 'ULCX', 'UTP', 'YOINK', 'PTT', 'YUS', 'SP', 'LUME', 'STC', 'HHD', 'DP', 'MS', 'IHD', 'PG', 'ZNTH', 'RMC'
+]
+other_api_trackers = [
+    'ANT', 'BHDTV', 'NBL', 'RTF', 'SN', 'SPD', 'TL', 'TVC'
+]
+http_trackers = [
+    'FL', 'HDB', 'HDT', 'MTV', 'PTER', 'TTG'
+]
+
+tracker_capabilities = {
+    'AITHER': {'mod_q': True, 'draft': False},
+    'BHD': {'draft_live': True},
+    'BLU': {'mod_q': True, 'draft': False},
+    'LST': {'mod_q': True, 'draft': True},
+}
+
+
+async def check_mod_q_and_draft(tracker_class, meta, debug, disctype):
+    modq, draft = None, None
+
+    tracker_caps = tracker_capabilities.get(tracker_class.tracker, {})
+
+    # Handle BHD specific draft/live logic
+    if tracker_class.tracker == 'BHD' and tracker_caps.get('draft_live'):
+        draft_int = await tracker_class.get_live(meta)
+        draft = "Draft" if draft_int == 0 else "Live"
+
+    # Handle mod_q and draft for other trackers
+    else:
+        if tracker_caps.get('mod_q'):
+            modq = await tracker_class.get_flag(meta, 'modq')
+            modq = 'Yes' if modq else 'No'
+        if tracker_caps.get('draft'):
+            draft = await tracker_class.get_flag(meta, 'draft')
+            draft = 'Yes' if draft else 'No'
+
+    return modq, draft
+
+
+# Waits before each look for a new upload's torrent page, the tracker can take a moment to list it
+PERMALINK_RETRY_DELAYS = (0.5, 1, 2, 4)
+
+
+async def find_torrent_page(tracker_class, meta, disctype):
+    """
+    Looks up the page of a torrent that was just uploaded, waiting longer each
+    time the tracker doesn't list it yet. Returns the page, or None.
+    """
+    for delay in PERMALINK_RETRY_DELAYS:
+        await asyncio.sleep(delay)
+        details_link = await tracker_class.search_torrent_page(meta, disctype)
+        if details_link:
+            return details_link
+    return None
+
+
+async def process_tracker(tracker, trackers, meta, prep, common):
+    """
+    Run the dupe check, upload and client injection for a single tracker.
+    Returns a short status string describing the outcome.
+    """
+    disctype = meta.get('disctype', None)
+    tracker = tracker.replace(" ", "").upper().strip()
+    if meta['name'].endswith('DUPE?'):
+        meta['name'] = meta['name'].replace(' DUPE?', '')
+
+    if meta['debug']:
+        debug = "(DEBUG)"
+    else:
+        debug = ""
+    status = "Not uploaded"
+
+    if tracker in api_trackers:
+        tracker_class = tracker_class_map[tracker](config=config)
+
+        if meta['unattended']:
+            upload_to_tracker = True
+        else:
+            try:
+                upload_to_tracker = cli_ui.ask_yes_no(
+                    f"Upload to {tracker_class.tracker}? {debug}",
+                    default=meta['unattended']
+                )
+            except (KeyboardInterrupt, EOFError):
+                sys.exit(1)  # Exit immediately
+
+        if upload_to_tracker:
+            # Get mod_q, draft, or draft/live depending on the tracker
+            modq, draft = await check_mod_q_and_draft(tracker_class, meta, debug, disctype)
+
+            # Print mod_q and draft info if relevant
+            if modq is not None:
+                console.print(f"(modq: {modq})")
+            if draft is not None:
+                console.print(f"(draft: {draft})")
+
+            console.print(f"Uploading to {tracker_class.tracker}")
+
+            # Check if the group is banned for the tracker
+            if check_banned_group(tracker_class.tracker, tracker_class.banned_groups, meta):
+                return "Banned group"
+
+            dupes = await search_dupes(tracker, tracker_class, meta, disctype, common)
+            if 'skipping' not in meta or meta['skipping'] is None:
+                # Check for exact match before proceeding with dupe check
+                exact_match = find_exact_match(dupes, meta)
+                if exact_match:
+                    if await handle_exact_match(tracker_class, tracker_class.tracker, exact_match, meta, client):
+                        console.print(f"[bold green]Successfully handled exact match - skipping upload to {tracker_class.tracker}[/bold green]")
+                        meta['skipping'] = None
+                        return "Exact match"
+                    else:
+                        console.print("[bold yellow]Exact match handling failed or skipped - proceeding with normal flow[/bold yellow]")
+
+                meta = dupe_check(dupes, meta)
+
+                # Proceed with upload if the meta is set to upload
+                if meta.get('upload', False):
+                    with span(meta, f"{tracker} upload", cat="tracker"):
+                        await tracker_class.upload(meta, disctype)
+                    perm = config['DEFAULT'].get('get_permalink', False)
+                    if perm:
+                        await find_torrent_page(tracker_class, meta, disctype)
+                    await client.add_to_client(meta, tracker_class.tracker)
+                    status = "Uploaded"
+                else:
+                    status = "Dupe"
+            else:
+                status = "Skipped"
+            meta['skipping'] = None
+
+    if tracker in other_api_trackers:
+        tracker_class = tracker_class_map[tracker](config=config)
+
+        if meta['unattended']:
+            upload_to_tracker = True
+        else:
+            try:
+                upload_to_tracker = cli_ui.ask_yes_no(
+                    f"Upload to {tracker_class.tracker}? {debug}",
+                    default=meta['unattended']
+                )
+            except (KeyboardInterrupt, EOFError):
+                sys.exit(1)  # Exit immediately
+
+        if upload_to_tracker:
+            # Get mod_q, draft, or draft/live depending on the tracker
+            modq, draft = await check_mod_q_and_draft(tracker_class, meta, debug, disctype)
+
+            # Print mod_q and draft info if relevant
+            if modq is not None:
+                console.print(f"(modq: {modq})")
+            if draft is not None:
+                console.print(f"(draft: {draft})")
+
+            console.print(f"Uploading to {tracker_class.tracker}")
+
+            # Check if the group is banned for the tracker
+            if check_banned_group(tracker_class.tracker, tracker_class.banned_groups, meta):
+                return "Banned group"
+
+            # Perform the existing checks for dupes except TL
+            if tracker != "TL":
+                if tracker == "RTF":
+                    await tracker_class.api_test(meta)
+
+                dupes = await search_dupes(tracker, tracker_class, meta, disctype, common)
+                if 'skipping' not in meta or meta['skipping'] is None:
+                    # Check for exact match before proceeding with dupe check
+                    exact_match = find_exact_match(dupes, meta)
+                    if exact_match:
+                        if await handle_exact_match(tracker_class, tracker_class.tracker, exact_match, meta, client):
+                            console.print(f"[bold green]Successfully handled exact match - skipping upload to {tracker_class.tracker}[/bold green]")
+                            meta['skipping'] = None
+                            return "Exact match"
+                        else:
+                            console.print("[bold yellow]Exact match handling failed or skipped - proceeding with normal flow[/bold yellow]")
+
+                    meta = dupe_check(dupes, meta)
+
+            if 'skipping' not in meta or meta['skipping'] is None:
+                # Proceed with upload if the meta is set to upload
+                if tracker == "TL" or meta.get('upload', False):
+                    with span(meta, f"{tracker} upload", cat="tracker"):
+                        await tracker_class.upload(meta, disctype)
+                    if tracker == 'SN':
+                        # Give SN time to register the new torrent before the client announces it
+                        await asyncio.sleep(16)
+                    await client.add_to_client(meta, tracker_class.tracker)
+                    status = "Uploaded"
+                else:
+                    status = "Dupe"
+            else:
+                status = "Skipped"
+            meta['skipping'] = None
+
+    if tracker in http_trackers:
+        tracker_class = tracker_class_map[tracker](config=config)
+
+        if meta['unattended']:
+            upload_to_tracker = True
+        else:
+            try:
+                upload_to_tracker = cli_ui.ask_yes_no(
+                    f"Upload to {tracker_class.tracker}? {debug}",
+                    default=meta['unattended']
+                )
+            except (KeyboardInterrupt, EOFError):
+                sys.exit(1)  # Exit immediately
+
+        if upload_to_tracker:
+            console.print(f"Uploading to {tracker}")
+            if check_banned_group(tracker_class.tracker, tracker_class.banned_groups, meta):
+                return "Banned group"
+            if await tracker_class.validate_credentials(meta) is True:
+                with span(meta, f"{tracker} search", cat="tracker"):
+                    dupes = await tracker_class.search_existing(meta, disctype)
+                dupes = await common.filter_dupes(dupes, meta)
+
+                # Check for exact match before proceeding with dupe check
+                exact_match = find_exact_match(dupes, meta)
+                if exact_match:
+                    if await handle_exact_match(tracker_class, tracker_class.tracker, exact_match, meta, client):
+                        console.print(f"[bold green]Successfully handled exact match - skipping upload to {tracker_class.tracker}[/bold green]")
+                        return "Exact match"
+                    else:
+                        console.print("[bold yellow]Exact match handling failed or skipped - proceeding with normal flow[/bold yellow]")
+
+                meta = dupe_check(dupes, meta)
+                if meta['upload'] is True:
+                    with span(meta, f"{tracker} upload", cat="tracker"):
+                        await tracker_class.upload(meta, disctype)
+                    await client.add_to_client(meta, tracker_class.tracker)
+                    status = "Uploaded"
+                else:
+                    status = "Dupe"
+            else:
+                status = "Invalid credentials"
+
+    if tracker == "MANUAL":
+        if meta['unattended']:
+            do_manual = True
+        else:
+            do_manual = cli_ui.ask_yes_no("Get files for manual upload?", default=True)
+        if do_manual:
+            for manual_tracker in trackers:
+                if manual_tracker != 'MANUAL':
+                    manual_tracker = manual_tracker.replace(" ", "").upper().strip()
+                    tracker_class = tracker_class_map[manual_tracker](config=config)
+                    if manual_tracker in api_trackers:
+                        await common.unit3d_edit_desc(meta, tracker_class.tracker, tracker_class.signature)
+                    else:
+                        await tracker_class.edit_desc(meta)
+            url = await prep.package(meta)
+            if url is False:
+                console.print(f"[yellow]Unable to upload prep files, they can be found at `tmp/{meta['uuid']}")
+            else:
+                console.print(f"[green]{meta['name']}")
+                console.print(f"[green]Files can be found at: [yellow]{url}[/yellow]")
+                status = "Packaged"
+
+    if tracker == "THR":
+        if meta['unattended']:
+            upload_to_thr = True
+        else:
+            try:
+                upload_to_thr = cli_ui.ask_yes_no(
+                    f"Upload to THR? {debug}",
+                    default=meta['unattended']
+                )
+            except (KeyboardInterrupt, EOFError):
+                sys.exit(1)  # Exit immediately
+        if upload_to_thr:
+            console.print("Uploading to THR")
+            # nable to get IMDB id/Youtube Link
+            if meta.get('imdb_id', '0') == '0':
+                imdb_id = cli_ui.ask_string("Unable to find IMDB id, please enter e.g.(tt1234567)")
+                meta['imdb_id'] = imdb_id.replace('tt', '').zfill(7)
+            if meta.get('youtube', None) is None:
+                youtube = cli_ui.ask_string("Unable to find youtube trailer, please link one e.g.(https://www.youtube.com/watch?v=dQw4w9WgXcQ)")
+                meta['youtube'] = youtube
+            thr = tracker_class_map['THR'](config=config)
+            try:
+                with requests.Session() as session:
+                    console.print("[yellow]Logging in to THR")
+                    session = thr.login(session)
+                    console.print("[yellow]Searching for Dupes")
+                    with span(meta, "THR search", cat="tracker"):
+                        dupes = thr.search_existing(session, disctype, meta.get('imdb_id'))
+                    dupes = await common.filter_dupes(dupes, meta)
+                    meta = dupe_check(dupes, meta)
+                    if meta['upload'] is True:
+                        with span(meta, "THR upload", cat="tracker"):
+                            await thr.upload(session, meta, disctype)
+                        await client.add_to_client(meta, "THR")
+                        status = "Uploaded"
+                    else:
+                        status = "Dupe"
+            except Exception:
+                console.print(traceback.format_exc())
+                status = "Failed"
+
+    if tracker == "PTP":
+        if meta['unattended']:
+            upload_to_ptp = True
+        else:
+            try:
+                upload_to_ptp = cli_ui.ask_yes_no(
+                    f"Upload to {tracker}? {debug}",
+                    default=meta['unattended']
+                )
+            except (KeyboardInterrupt, EOFError):
+                sys.exit(1)  # Exit immediately
+
+        if upload_to_ptp:  # Ensure the variable is defined before this check
+            console.print(f"Uploading to {tracker}")
+            if meta.get('imdb_id', '0') == '0':
+                imdb_id = cli_ui.ask_string("Unable to find IMDB id, please enter e.g.(tt1234567)")
+                meta['imdb_id'] = imdb_id.replace('tt', '').zfill(7)
+            ptp = tracker_class_map['PTP'](config=config)
+            if check_banned_group("PTP", ptp.banned_groups, meta):
+                return "Banned group"
+            try:
+                console.print("[yellow]Searching for Group ID")
+                groupID = await ptp.get_group_by_imdb(meta['imdb_id'])
+                if groupID is None:
+                    console.print("[yellow]No Existing Group found")
+                    if meta.get('youtube', None) is None or "youtube" not in str(meta.get('youtube', '')):
+                        youtube = cli_ui.ask_string("Unable to find youtube trailer, please link one e.g.(https://www.youtube.com/watch?v=dQw4w9WgXcQ)", default="")
+                        meta['youtube'] = youtube
+                    meta['upload'] = True
+                else:
+                    console.print("[yellow]Searching for Existing Releases")
+                    with span(meta, "PTP search", cat="tracker"):
+                        dupes = await ptp.search_existing(groupID, meta, disctype)
+                    dupes = await common.filter_dupes(dupes, meta)
+                    meta = dupe_check(dupes, meta)
+                if meta.get('imdb_info', {}) == {}:
+                    meta['imdb_info'] = await prep.get_imdb_info(meta['imdb_id'], meta)
+                if meta['upload'] is True:
+                    ptpUrl, ptpData = await ptp.fill_upload_form(groupID, meta)
+                    with span(meta, "PTP upload", cat="tracker"):
+                        await ptp.upload(meta, ptpUrl, ptpData, disctype)
+                    await client.add_to_client(meta, "PTP")
+                    status = "Uploaded"
+                else:
+                    status = "Dupe"
+            except Exception:
+                console.print(traceback.format_exc())
+                status = "Failed"
+
+    return status
+
+
 async def do_the_thing(base_dir):
     meta = {'base_dir': base_dir}
     paths = []
@@ -482,381 +817,304 @@ async def do_the_thing(base_dir):
         if meta['debug']:
             display_queue(queue, base_dir, queue_name, save_to_log=False)
 
-    processed_files_count = 0
     base_meta = {k: v for k, v in meta.items()}
+    unattended = meta['unattended'] or str(config['DEFAULT'].get('auto_mode', False)).lower() == "true"
+    if meta.get('queue') and unattended and config['DEFAULT'].get('queue_pipeline', False):
+        await process_queue_pipelined(queue, base_meta, log_file)
+        return
+
+    processed_files_count = 0
     for path in queue:
         total_files = len(queue)
+        meta = load_queued_meta(path, base_meta)
+
+        console.print(f"[green]Gathering info for {os.path.basename(path)}")
         try:
-            meta = base_meta.copy()
-            meta['path'] = path
-            meta['uuid'] = None
+            await process_meta(meta, base_dir)
+            await upload_release(meta)
+        finally:
+            if meta.get('uuid'):
+                save_trace(meta)
+
+        if meta.get('queue') is not None:
+            processed_files_count += 1
+            console.print(f"[cyan]Processed {processed_files_count}/{total_files} files.")
+            if not meta['debug']:
+                if log_file:
+                    save_processed_file(log_file, path)
 
-            if not path:
-                raise ValueError("The 'path' variable is not defined or is empty.")
 
-            meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
+def load_queued_meta(path, base_meta):
+    """
+    Fresh meta for a queued path, with the meta.json from an earlier run merged in.
+    """
+    try:
+        meta = base_meta.copy()
+        meta['path'] = path
+        meta['uuid'] = None
 
-            if os.path.exists(meta_file):
-                with open(meta_file, "r") as f:
-                    saved_meta = json.load(f)
-                    meta.update(merge_meta(meta, saved_meta, path))
-            else:
-                if meta['debug']:
-                    console.print(f"[yellow]No metadata file found at {meta_file}")
+        if not path:
+            raise ValueError("The 'path' variable is not defined or is empty.")
 
-        except Exception as e:
-            console.print(f"[red]Failed to load metadata for path '{path}': {e}")
+        meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
 
-        console.print(f"[green]Gathering info for {os.path.basename(path)}")
-        await process_meta(meta, base_dir)
-        prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
-        if meta.get('trackers', None) is not None:
-            trackers = meta['trackers']
+        if os.path.exists(meta_file):
+            with open(meta_file, "r") as f:
+                saved_meta = json.load(f)
+                meta.update(merge_meta(meta, saved_meta, path))
         else:
-            trackers = config['TRACKERS']['default_trackers']
-        if "," in trackers:
-            trackers = trackers.split(',')
-        confirm = get_confirmation(meta)
-        while confirm is False:
-            editargs = cli_ui.ask_string("Input args that need correction e.g. (--tag NTb --category tv --tmdb 12345)")
-            editargs = (meta['path'],) + tuple(editargs.split())
-            if meta.get('debug', False):
-                editargs += ("--debug",)
-            meta, help, before_args = parser.parse(editargs, meta)
-            meta['edit'] = True
-            meta = await prep.gather_prep(meta=meta, mode='cli')
-            with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
-                json.dump(meta, f, indent=4)
-            meta['name_notag'], meta['name'], meta['clean_name'], meta['potential_missing'] = await prep.get_name(meta)
-            confirm = get_confirmation(meta)
-
-        if isinstance(trackers, str):
-            trackers = trackers.split(',')
-        trackers = [s.strip().upper() for s in trackers]
-        if meta.get('manual', False):
-            trackers.insert(0, "MANUAL")
-        ####################################
-        #######  Upload to Trackers  #######  # noqa #F266
-        ####################################
-        common = COMMON(config=config)
-        api_trackers = [
-            'ACM', 'AITHER', 'AL', 'BHD', 'BLU', 'CBR', 'FNP', 'HUNO', 'JPTV', 'LCD', 'LST', 'LT',
-            'OE', 'OTW', 'PSS', 'RF', 'R4E', 'SHRI', 'TIK', 'ULCX', 'UTP', 'YOINK', 'PTT', 'YUS', 'SP', 'LUME', 'STC', 'HHD', 'DP', 'MS', 'IHD', 'PG', 'ZNTH', 'RMC'
-        ]
-        other_api_trackers = [
-            'ANT', 'BHDTV', 'NBL', 'RTF', 'SN', 'SPD', 'TL', 'TVC'
-        ]
-        http_trackers = [
-            'FL', 'HDB', 'HDT', 'MTV', 'PTER', 'TTG'
-        ]
-        tracker_class_map = {
-            'ACM': ACM, 'AITHER': AITHER, 'AL': AL, 'ANT': ANT, 'BHD': BHD, 'BHDTV': BHDTV, 'BLU': BLU, 'CBR': CBR,
-            'FNP': FNP, 'FL': FL, 'HDB': HDB, 'HDT': HDT, 'HP': HP, 'HUNO': HUNO, 'JPTV': JPTV, 'LCD': LCD,
-            'LST': LST, 'LT': LT, 'MTV': MTV, 'NBL': NBL, 'OE': OE, 'OTW': OTW, 'PSS': PSS, 'PTP': PTP, 'PTER': PTER,
-            'R4E': R4E, 'RF': RF, 'RTF': RTF, 'SHRI': SHRI, 'SN': SN, 'SPD': SPD, 'THR': THR,
-            'TIK': TIK, 'TL': TL, 'TVC': TVC, 'TTG': TTG, 'ULCX': ULCX, 'UTP': UTP, 'YOINK': YOINK, 'YUS': YUS, 'SP': SP, 'PTT': PTT, 'LUME': LUME, 'STC': STC,
-            'HHD': HHD, 'DP': DP, 'MS': MS, 'IHD': IHD, 'PG': PG, 'ZNTH': ZNTH, 'RMC': RMC,
-        }
-
-        tracker_capabilities = {
-            'AITHER': {'mod_q': True, 'draft': False},
-            'BHD': {'draft_live': True},
-            'BLU': {'mod_q': True, 'draft': False},
-            'LST': {'mod_q': True, 'draft': True},
-        }
-
-        async def check_mod_q_and_draft(tracker_class, meta, debug, disctype):
-            modq, draft = None, None
-
-            tracker_caps = tracker_capabilities.get(tracker_class.tracker, {})
-
-            # Handle BHD specific draft/live logic
-            if tracker_class.tracker == 'BHD' and tracker_caps.get('draft_live'):
-                draft_int = await tracker_class.get_live(meta)
-                draft = "Draft" if draft_int == 0 else "Live"
-
-            # Handle mod_q and draft for other trackers
-            else:
-                if tracker_caps.get('mod_q'):
-                    modq = await tracker_class.get_flag(meta, 'modq')
-                    modq = 'Yes' if modq else 'No'
-                if tracker_caps.get('draft'):
-                    draft = await tracker_class.get_flag(meta, 'draft')
-                    draft = 'Yes' if draft else 'No'
+            if meta['debug']:
+                console.print(f"[yellow]No metadata file found at {meta_file}")
+
+    except Exception as e:
+        console.print(f"[red]Failed to load metadata for path '{path}': {e}")
+    return meta
 
-            return modq, draft
 
+async def upload_release(meta):
+    """
+    Confirm the release info, then upload it to each tracker.
+    """
+    prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
+    if meta.get('trackers', None) is not None:
+        trackers = meta['trackers']
+    else:
+        trackers = config['TRACKERS']['default_trackers']
+    if "," in trackers:
+        trackers = trackers.split(',')
+    confirm = get_confirmation(meta)
+    while confirm is False:
+        editargs = cli_ui.ask_string("Input args that need correction e.g. (--tag NTb --category tv --tmdb 12345)")
+        editargs = (meta['path'],) + tuple(editargs.split())
+        if meta.get('debug', False):
+            editargs += ("--debug",)
+        meta, help, before_args = parser.parse(editargs, meta)
+        meta['edit'] = True
+        meta = await prep.gather_prep(meta=meta, mode='cli')
+        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
+            json.dump(meta, f, indent=4)
+        meta['name_notag'], meta['name'], meta['clean_name'], meta['potential_missing'] = await prep.get_name(meta)
+        confirm = get_confirmation(meta)
+
+    if isinstance(trackers, str):
+        trackers = trackers.split(',')
+    trackers = [s.strip().upper() for s in trackers]
+    if meta.get('manual', False):
+        trackers.insert(0, "MANUAL")
+    ####################################
+    #######  Upload to Trackers  #######  # noqa #F266
+    ####################################
+    common = COMMON(config=config)
+    if config['DEFAULT'].get('prefetch_dupes', False):
+        await prefetch_dupes(trackers, meta, common)
+    tracker_concurrency = get_tracker_concurrency(meta)
+    if meta['unattended'] and tracker_concurrency > 1:
+        if "MANUAL" in trackers:
+            await process_tracker("MANUAL", trackers, meta, prep, common)
+        await process_trackers_concurrently([t for t in trackers if t != "MANUAL"], trackers, meta, prep, common, tracker_concurrency)
+    else:
         for tracker in trackers:
-            disctype = meta.get('disctype', None)
-            tracker = tracker.replace(" ", "").upper().strip()
-            if meta['name'].endswith('DUPE?'):
-                meta['name'] = meta['name'].replace(' DUPE?', '')
+            await process_tracker(tracker, trackers, meta, prep, common)
 
-            if meta['debug']:
-                debug = "(DEBUG)"
-            else:
-                debug = ""
 
-            if tracker in api_trackers:
-                tracker_class = tracker_class_map[tracker](config=config)
+async def process_queue_pipelined(queue, base_meta, log_file):
+    """
+    Run an unattended queue as a pipeline: prep, image host upload, hashing and
+    tracker upload each work on a different release at the same time, with at
+    most queue_pipeline_depth releases waiting between two stages.
+    A release that fails in one stage is dropped, and left out of the processed files log.
+    """
+    try:
+        depth = max(1, int(config['DEFAULT'].get('queue_pipeline_depth', 2)))
+    except (TypeError, ValueError):
+        depth = 2
+    total_files = len(queue)
+    processed_files_count = 0
+    prepped = asyncio.Queue(maxsize=depth)
+    imaged = asyncio.Queue(maxsize=depth)
+    hashed = asyncio.Queue(maxsize=depth)
 
-                if meta['unattended']:
-                    upload_to_tracker = True
-                else:
-                    try:
-                        upload_to_tracker = cli_ui.ask_yes_no(
-                            f"Upload to {tracker_class.tracker}? {debug}",
-                            default=meta['unattended']
-                        )
-                    except (KeyboardInterrupt, EOFError):
-                        sys.exit(1)  # Exit immediately
+    async def run_stage(name, meta, stage):
+        try:
+            await stage(meta)
+            return True
+        except Exception:
+            console.print(f"[bold red]{name} failed for {os.path.basename(meta['path'])}, skipping it")
+            console.print(traceback.format_exc())
+            if meta.get('uuid'):
+                save_trace(meta)
+            return False
 
-                if upload_to_tracker:
-                    # Get mod_q, draft, or draft/live depending on the tracker
-                    modq, draft = await check_mod_q_and_draft(tracker_class, meta, debug, disctype)
+    async def prep_stage(meta):
+        await prep_release(meta, Prep(screens=meta['screens'], img_host=meta['imghost'], config=config))
+
+    async def image_stage(meta):
+        await asyncio.to_thread(upload_release_images, meta, Prep(screens=meta['screens'], img_host=meta['imghost'], config=config))
+
+    async def hash_stage(meta):
+        await create_base_torrent(meta, Prep(screens=meta['screens'], img_host=meta['imghost'], config=config))
+
+    async def feed():
+        for path in queue:
+            meta = load_queued_meta(path, base_meta)
+            console.print(f"[green]Gathering info for {os.path.basename(path)}")
+            if await run_stage("Prep", meta, prep_stage):
+                await prepped.put(meta)
+        await prepped.put(None)
+
+    async def forward(name, source, target, stage):
+        while (meta := await source.get()) is not None:
+            if await run_stage(name, meta, stage):
+                await target.put(meta)
+        await target.put(None)
+
+    async def upload():
+        nonlocal processed_files_count
+        while (meta := await hashed.get()) is not None:
+            succeeded = await run_stage("Tracker upload", meta, upload_release)
+            save_trace(meta)
+            if succeeded:
+                processed_files_count += 1
+                console.print(f"[cyan]Processed {processed_files_count}/{total_files} files.")
+                if not meta['debug'] and log_file:
+                    save_processed_file(log_file, meta['path'])
+
+    console.print(f"[cyan]Processing {total_files} files as a pipeline, up to {depth} waiting between stages")
+    await asyncio.gather(
+        feed(),
+        forward("Image upload", prepped, imaged, image_stage),
+        forward("Hashing", imaged, hashed, hash_stage),
+        upload()
+    )
+
+
+async def search_dupes(tracker, tracker_class, meta, disctype, common):
+    """
+    Search a tracker for dupes and filter them, using the results from prefetch_dupes when there are any.
+    Like search_existing, sets meta['skipping'] when the tracker does not allow the release.
+    """
+    prefetched = meta.get('dupe_prefetch', {}).pop(tracker, None)
+    if prefetched is not None:
+        if prefetched['skipping'] is not None:
+            meta['skipping'] = prefetched['skipping']
+        return prefetched['dupes']
 
-                    # Print mod_q and draft info if relevant
-                    if modq is not None:
-                        console.print(f"(modq: {modq})")
-                    if draft is not None:
-                        console.print(f"(draft: {draft})")
+    with span(meta, f"{tracker} search", cat="tracker"):
+        dupes = await tracker_class.search_existing(meta, disctype)
+    if 'skipping' not in meta or meta['skipping'] is None:
+        dupes = await common.filter_dupes(dupes, meta)
+    return dupes
 
-                    console.print(f"Uploading to {tracker_class.tracker}")
 
-                    # Check if the group is banned for the tracker
-                    if check_banned_group(tracker_class.tracker, tracker_class.banned_groups, meta):
-                        continue
+async def prefetch_dupes(trackers, meta, common):
+    """
+    Search every selected API tracker for dupes at the same time, before any uploading starts.
+    The filtered results are kept in meta['dupe_prefetch'] for search_dupes, and shown in one table.
+    """
+    # TL has no dupe search, and RTF may need to generate a new API key first
+    prefetch_trackers = [tracker for tracker in trackers
+                         if tracker in api_trackers or (tracker in other_api_trackers and tracker not in ("TL", "RTF"))]
+    meta.pop('dupe_prefetch', None)
+    if not prefetch_trackers:
+        return {}
+    disctype = meta.get('disctype', None)
+    results = {}
+    timings = {}
+
+    async def search(tracker):
+        tracker_meta = copy.deepcopy(meta)
+        tracker_meta['skipping'] = None
+        start_time = time.perf_counter()
+        try:
+            tracker_class = tracker_class_map[tracker](config=config)
+            dupes = await search_dupes(tracker, tracker_class, tracker_meta, disctype, common)
+            results[tracker] = {'dupes': dupes or [], 'skipping': tracker_meta.get('skipping')}
+        except Exception:
+            console.print(f"[bold red]{tracker}: dupe search failed, it will be searched again when uploading")
+            if meta['debug']:
+                console.print(traceback.format_exc())
+        timings[tracker] = time.perf_counter() - start_time
+
+    console.print(f"[cyan]Searching {len(prefetch_trackers)} trackers for dupes")
+    await asyncio.gather(*(search(tracker) for tracker in prefetch_trackers))
+    meta['dupe_prefetch'] = results
+    print_dupe_summary(prefetch_trackers, results, timings, meta)
+    return results
+
+
+def print_dupe_summary(trackers, results, timings, meta):
+    table = Table(title="Dupe Summary", title_justify="left")
+    table.add_column("Tracker", style="bold cyan")
+    table.add_column("Dupes")
+    table.add_column("Time", justify="right")
+    for tracker in trackers:
+        result = results.get(tracker)
+        if result is None:
+            status = "[red]Search failed"
+        elif result['skipping'] is not None:
+            status = "[yellow]Not allowed"
+        elif not result['dupes']:
+            status = "[green]None"
+        elif find_exact_match(result['dupes'], meta):
+            status = f"[red]Exact match ({len(result['dupes'])} total)"
+        else:
+            status = f"[yellow]{len(result['dupes'])} possible"
+        table.add_row(tracker, status, f"{timings.get(tracker, 0):.1f}s")
+    console.print(table)
 
-                    dupes = await tracker_class.search_existing(meta, disctype)
-                    if 'skipping' not in meta or meta['skipping'] is None:
-                        dupes = await common.filter_dupes(dupes, meta)
-
-                        # Check for exact match before proceeding with dupe check
-                        exact_match = find_exact_match(dupes, meta)
-                        if exact_match:
-                            if await handle_exact_match(tracker_class, tracker_class.tracker, exact_match, meta, client):
-                                console.print(f"[bold green]Successfully handled exact match - skipping upload to {tracker_class.tracker}[/bold green]")
-                                meta['skipping'] = None
-                                continue  # Skip the rest of the upload process for this tracker
-                            else:
-                                console.print("[bold yellow]Exact match handling failed or skipped - proceeding with normal flow[/bold yellow]")
-
-                        meta = dupe_check(dupes, meta)
-
-                        # Proceed with upload if the meta is set to upload
-                        if meta.get('upload', False):
-                            await tracker_class.upload(meta, disctype)
-                            perm = config['DEFAULT'].get('get_permalink', False)
-                            if perm:
-                                # need a wait so we don't race the api
-                                await asyncio.sleep(5)
-                                await tracker_class.search_torrent_page(meta, disctype)
-                                await asyncio.sleep(0.5)
-                            await client.add_to_client(meta, tracker_class.tracker)
-                    meta['skipping'] = None
-
-            if tracker in other_api_trackers:
-                tracker_class = tracker_class_map[tracker](config=config)
-
-                if meta['unattended']:
-                    upload_to_tracker = True
-                else:
-                    try:
-                        upload_to_tracker = cli_ui.ask_yes_no(
-                            f"Upload to {tracker_class.tracker}? {debug}",
-                            default=meta['unattended']
-                        )
-                    except (KeyboardInterrupt, EOFError):
-                        sys.exit(1)  # Exit immediately
-
-                if upload_to_tracker:
-                    # Get mod_q, draft, or draft/live depending on the tracker
-                    modq, draft = await check_mod_q_and_draft(tracker_class, meta, debug, disctype)
-
-                    # Print mod_q and draft info if relevant
-                    if modq is not None:
-                        console.print(f"(modq: {modq})")
-                    if draft is not None:
-                        console.print(f"(draft: {draft})")
-
-                    console.print(f"Uploading to {tracker_class.tracker}")
-
-                    # Check if the group is banned for the tracker
-                    if check_banned_group(tracker_class.tracker, tracker_class.banned_groups, meta):
-                        continue
-
-                    # Perform the existing checks for dupes except TL
-                    if tracker != "TL":
-                        if tracker == "RTF":
-                            await tracker_class.api_test(meta)
-
-                        dupes = await tracker_class.search_existing(meta, disctype)
-                        if 'skipping' not in meta or meta['skipping'] is None:
-                            dupes = await common.filter_dupes(dupes, meta)
-
-                            # Check for exact match before proceeding with dupe check
-                            exact_match = find_exact_match(dupes, meta)
-                            if exact_match:
-                                if await handle_exact_match(tracker_class, tracker_class.tracker, exact_match, meta, client):
-                                    console.print(f"[bold green]Successfully handled exact match - skipping upload to {tracker_class.tracker}[/bold green]")
-                                    meta['skipping'] = None
-                                    continue  # Skip the rest of the upload process for this tracker
-                                else:
-                                    console.print("[bold yellow]Exact match handling failed or skipped - proceeding with normal flow[/bold yellow]")
-
-                            meta = dupe_check(dupes, meta)
-
-                    if 'skipping' not in meta or meta['skipping'] is None:
-                        # Proceed with upload if the meta is set to upload
-                        if tracker == "TL" or meta.get('upload', False):
-                            await tracker_class.upload(meta, disctype)
-                            if tracker == 'SN':
-                                await asyncio.sleep(16)
-                            await client.add_to_client(meta, tracker_class.tracker)
-                    meta['skipping'] = None
-
-            if tracker in http_trackers:
-                tracker_class = tracker_class_map[tracker](config=config)
-
-                if meta['unattended']:
-                    upload_to_tracker = True
-                else:
-                    try:
-                        upload_to_tracker = cli_ui.ask_yes_no(
-                            f"Upload to {tracker_class.tracker}? {debug}",
-                            default=meta['unattended']
-                        )
-                    except (KeyboardInterrupt, EOFError):
-                        sys.exit(1)  # Exit immediately
-
-                if upload_to_tracker:
-                    console.print(f"Uploading to {tracker}")
-                    if check_banned_group(tracker_class.tracker, tracker_class.banned_groups, meta):
-                        continue
-                    if await tracker_class.validate_credentials(meta) is True:
-                        dupes = await tracker_class.search_existing(meta, disctype)
-                        dupes = await common.filter_dupes(dupes, meta)
-
-                        # Check for exact match before proceeding with dupe check
-                        exact_match = find_exact_match(dupes, meta)
-                        if exact_match:
-                            if await handle_exact_match(tracker_class, tracker_class.tracker, exact_match, meta, client):
-                                console.print(f"[bold green]Successfully handled exact match - skipping upload to {tracker_class.tracker}[/bold green]")
-                                continue  # Skip the rest of the upload process for this tracker
-                            else:
-                                console.print("[bold yellow]Exact match handling failed or skipped - proceeding with normal flow[/bold yellow]")
 
-                        meta = dupe_check(dupes, meta)
-                        if meta['upload'] is True:
-                            await tracker_class.upload(meta, disctype)
-                            await client.add_to_client(meta, tracker_class.tracker)
+def get_tracker_concurrency(meta):
+    """
+    Number of trackers to upload to at the same time, from --tracker-concurrency or the config.
+    """
+    concurrency = meta.get('tracker_concurrency') or config['DEFAULT'].get('tracker_concurrency', 1)
+    try:
+        return max(1, int(concurrency))
+    except (TypeError, ValueError):
+        console.print(f"[bold red]Invalid tracker concurrency '{concurrency}', uploading to one tracker at a time")
+        return 1
 
-            if tracker == "MANUAL":
-                if meta['unattended']:
-                    do_manual = True
-                else:
-                    do_manual = cli_ui.ask_yes_no("Get files for manual upload?", default=True)
-                if do_manual:
-                    for manual_tracker in trackers:
-                        if manual_tracker != 'MANUAL':
-                            manual_tracker = manual_tracker.replace(" ", "").upper().strip()
-                            tracker_class = tracker_class_map[manual_tracker](config=config)
-                            if manual_tracker in api_trackers:
-                                await common.unit3d_edit_desc(meta, tracker_class.tracker, tracker_class.signature)
-                            else:
-                                await tracker_class.edit_desc(meta)
-                    url = await prep.package(meta)
-                    if url is False:
-                        console.print(f"[yellow]Unable to upload prep files, they can be found at `tmp/{meta['uuid']}")
-                    else:
-                        console.print(f"[green]{meta['name']}")
-                        console.print(f"[green]Files can be found at: [yellow]{url}[/yellow]")
 
-            if tracker == "THR":
-                if meta['unattended']:
-                    upload_to_thr = True
-                else:
-                    try:
-                        upload_to_ptp = cli_ui.ask_yes_no(
-                            f"Upload to THR? {debug}",
-                            default=meta['unattended']
-                        )
-                    except (KeyboardInterrupt, EOFError):
-                        sys.exit(1)  # Exit immediately
-                if upload_to_thr:
-                    console.print("Uploading to THR")
-                    # nable to get IMDB id/Youtube Link
-                    if meta.get('imdb_id', '0') == '0':
-                        imdb_id = cli_ui.ask_string("Unable to find IMDB id, please enter e.g.(tt1234567)")
-                        meta['imdb_id'] = imdb_id.replace('tt', '').zfill(7)
-                    if meta.get('youtube', None) is None:
-                        youtube = cli_ui.ask_string("Unable to find youtube trailer, please link one e.g.(https://www.youtube.com/watch?v=dQw4w9WgXcQ)")
-                        meta['youtube'] = youtube
-                    thr = THR(config=config)
-                    try:
-                        with requests.Session() as session:
-                            console.print("[yellow]Logging in to THR")
-                            session = thr.login(session)
-                            console.print("[yellow]Searching for Dupes")
-                            dupes = thr.search_existing(session, disctype, meta.get('imdb_id'))
-                            dupes = await common.filter_dupes(dupes, meta)
-                            meta = dupe_check(dupes, meta)
-                            if meta['upload'] is True:
-                                await thr.upload(session, meta, disctype)
-                                await client.add_to_client(meta, "THR")
-                    except Exception:
-                        console.print(traceback.format_exc())
-
-            if tracker == "PTP":
-                if meta['unattended']:
-                    upload_to_ptp = True
-                else:
-                    try:
-                        upload_to_ptp = cli_ui.ask_yes_no(
-                            f"Upload to {tracker}? {debug}",
-                            default=meta['unattended']
-                        )
-                    except (KeyboardInterrupt, EOFError):
-                        sys.exit(1)  # Exit immediately
-
-                if upload_to_ptp:  # Ensure the variable is defined before this check
-                    console.print(f"Uploading to {tracker}")
-                    if meta.get('imdb_id', '0') == '0':
-                        imdb_id = cli_ui.ask_string("Unable to find IMDB id, please enter e.g.(tt1234567)")
-                        meta['imdb_id'] = imdb_id.replace('tt', '').zfill(7)
-                    ptp = PTP(config=config)
-                    if check_banned_group("PTP", ptp.banned_groups, meta):
-                        continue
-                    try:
-                        console.print("[yellow]Searching for Group ID")
-                        groupID = await ptp.get_group_by_imdb(meta['imdb_id'])
-                        if groupID is None:
-                            console.print("[yellow]No Existing Group found")
-                            if meta.get('youtube', None) is None or "youtube" not in str(meta.get('youtube', '')):
-                                youtube = cli_ui.ask_string("Unable to find youtube trailer, please link one e.g.(https://www.youtube.com/watch?v=dQw4w9WgXcQ)", default="")
-                                meta['youtube'] = youtube
-                            meta['upload'] = True
-                        else:
-                            console.print("[yellow]Searching for Existing Releases")
-                            dupes = await ptp.search_existing(groupID, meta, disctype)
-                            dupes = await common.filter_dupes(dupes, meta)
-                            meta = dupe_check(dupes, meta)
-                        if meta.get('imdb_info', {}) == {}:
-                            meta['imdb_info'] = await prep.get_imdb_info(meta['imdb_id'], meta)
-                        if meta['upload'] is True:
-                            ptpUrl, ptpData = await ptp.fill_upload_form(groupID, meta)
-                            await ptp.upload(meta, ptpUrl, ptpData, disctype)
-                            await asyncio.sleep(5)
-                            await client.add_to_client(meta, "PTP")
-                    except Exception:
-                        console.print(traceback.format_exc())
+async def process_trackers_concurrently(trackers, all_trackers, meta, prep, common, concurrency):
+    """
+    Fan the per-tracker work out as separate tasks, each with its own copy of meta.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    results = {}
 
-        if meta.get('queue') is not None:
-            processed_files_count += 1
-            console.print(f"[cyan]Processed {processed_files_count}/{total_files} files.")
-            if not meta['debug']:
-                if log_file:
-                    save_processed_file(log_file, path)
+    async def run(tracker):
+        async with semaphore:
+            tracker_meta = copy.deepcopy(meta)
+            start_time = time.perf_counter()
+            try:
+                status = await process_tracker(tracker, all_trackers, tracker_meta, prep, common)
+            except Exception as e:
+                console.print(f"[bold red]{tracker}: upload failed")
+                console.print(traceback.format_exc())
+                status = f"Failed ({e})"
+            results[tracker] = (status, time.perf_counter() - start_time)
+
+    console.print(f"[cyan]Uploading to {len(trackers)} trackers, {concurrency} at a time")
+    await asyncio.gather(*(run(tracker) for tracker in trackers))
+    print_tracker_summary(trackers, results)
+    return results
+
+
+def print_tracker_summary(trackers, results):
+    table = Table(title="Tracker Summary", title_justify="left")
+    table.add_column("Tracker", style="bold cyan")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+    for tracker in trackers:
+        status, elapsed = results.get(tracker, ("Not run", 0))
+        if status == "Uploaded":
+            status = f"[green]{status}"
+        elif status.startswith("Failed"):
+            status = f"[red]{status}"
+        else:
+            status = f"[yellow]{status}"
+        table.add_row(tracker, status, f"{elapsed:.1f}s")
+    console.print(table)
 
 
 def get_confirmation(meta):
@@ -971,7 +1229,7 @@ async def handle_exact_match(tracker_class, tracker_name, exact_match_name, meta
                 console.print(f"[blue]Debug: Searching with params: name={exact_match_name}[/blue]")
 
             try:
-                response = requests.get(url=tracker_class.search_url, params=params, timeout=30)
+                response = await tracker_class.http.get(url=tracker_class.search_url, params=params, timeout=30)
                 response.raise_for_status()
                 response_data = response.json()
 
@@ -1239,3 +1497,4 @@ if __name__ == '__main__':
         asyncio.run(do_the_thing(base_dir))  # Pass the correct base_dir value here
     except (KeyboardInterrupt):
         console.print("[bold red]Program interrupted. Exiting.")
+        shutdown_worker_pool(cancel=True)